@@ -0,0 +1,17 @@
+KPL/MK
+
+As involution.tm, with DE440 reduced to the served bodies and 1550-2650
+(services/spice/tools/build_trimmed_spk.py). Select with
+SPICE_METAKERNEL=involution_trimmed.tm
+
+\begindata
+PATH_VALUES  = ( '/app/kernels' )
+PATH_SYMBOLS = ( 'KERN' )
+
+KERNELS_TO_LOAD = (
+  '$KERN/lsk/naif0012.tls',
+  '$KERN/pck/pck00011.tpc',
+  '$KERN/pck/earth_latest_high_prec.bpc',
+  '$KERN/spk/planets/de440_trimmed.bsp'
+)
+\begintext
@@ -0,0 +1,100 @@
+"""
+Astrocartography: where on Earth each body is on the ASC, DSC, MC or IC at one instant.
+
+Uses the horizon/meridian geometry of houses.py (zenith and east vectors from
+latitude and local sidereal time), solved for geographic longitude rather than
+evaluated location by location. A body is on the MC where local sidereal time
+equals its right ascension (IC: 180° later) at every latitude. It is on the
+ASC/DSC where it lies in the horizon plane, z·p = 0, i.e. where its hour angle
+satisfies cos H = -tan φ tan δ, east (rising) or west (setting) of the
+meridian. Each line is a closed form in latitude, so a map is a latitude grid
+evaluated for all bodies at once, chunk by chunk.
+"""
+
+import numpy as np
+from houses import _wrap360
+
+
+def _wrap180(x: np.ndarray) -> np.ndarray:
+    return (x + 180.0) % 360.0 - 180.0
+
+
+def equatorial_from_ecliptic(
+    lon_deg: np.ndarray, lat_deg: np.ndarray, eps_deg: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Right ascension and declination of date from ecliptic-of-date coordinates.
+
+    Args:
+        lon_deg: Ecliptic longitudes (degrees)
+        lat_deg: Ecliptic latitudes (degrees)
+        eps_deg: Obliquity of the ecliptic (degrees)
+
+    Returns:
+        Tuple of (ra_deg in [0, 360), dec_deg) arrays
+    """
+    lam, beta, eps = np.radians(lon_deg), np.radians(lat_deg), np.radians(eps_deg)
+    x = np.cos(beta) * np.cos(lam)
+    y = np.cos(beta) * np.sin(lam)
+    z = np.sin(beta)
+
+    # Ecliptic → equatorial (rotate by +ε about X)
+    ce, se = np.cos(eps), np.sin(eps)
+    ra = _wrap360(np.degrees(np.arctan2(ce * y - se * z, x)))
+    dec = np.degrees(np.arcsin(np.clip(se * y + ce * z, -1.0, 1.0)))
+    return ra, dec
+
+
+def meridian_longitudes(ra_deg: np.ndarray, gmst_deg: float) -> tuple[np.ndarray, np.ndarray]:
+    """Geographic longitudes of the MC (LST = RA) and IC (LST = RA + 180°) lines"""
+    mc = _wrap180(ra_deg - gmst_deg)
+    return mc, _wrap180(mc + 180.0)
+
+
+def horizon_longitudes(
+    ra_deg: np.ndarray, dec_deg: np.ndarray, gmst_deg: float, lat_deg: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Geographic longitudes of the ASC and DSC lines at each latitude.
+
+    Args:
+        ra_deg: Right ascension of date per body (degrees), shape (B,)
+        dec_deg: Declination of date per body (degrees), shape (B,)
+        gmst_deg: Greenwich mean sidereal time (degrees)
+        lat_deg: Latitudes to solve at (degrees), shape (L,)
+
+    Returns:
+        Tuple of (asc, dsc) longitudes in [-180, 180), shape (B, L); NaN where
+        the body never rises or never sets at that latitude
+    """
+    cos_h = -np.tan(np.radians(lat_deg))[None, :] * np.tan(np.radians(dec_deg))[:, None]
+    h0 = np.degrees(np.arccos(np.where(np.abs(cos_h) <= 1.0, cos_h, np.nan)))
+
+    # Rising east of the meridian (hour angle -H0), setting west of it (+H0)
+    transit = (np.asarray(ra_deg) - gmst_deg)[:, None]
+    return _wrap180(transit - h0), _wrap180(transit + h0)
+
+
+def line_pieces(lat_deg: np.ndarray, lon_deg: np.ndarray) -> list[np.ndarray]:
+    """
+    Split one sampled line into GeoJSON-ready (K, 2) [lon, lat] pieces.
+
+    Breaks at NaN gaps (no solution) and at the antimeridian; both sides of an
+    antimeridian break end on an interpolated point at ±180°.
+    """
+    pieces = []
+    valid = np.concatenate([[0], ~np.isnan(lon_deg), [0]]).astype(np.int8)
+    for start, stop in np.flatnonzero(np.diff(valid)).reshape(-1, 2):
+        lon, lat = lon_deg[start:stop], lat_deg[start:stop]
+        head = np.empty((0, 2))
+        first = 0
+        for j in np.flatnonzero(np.abs(np.diff(lon)) > 180.0):
+            side = 180.0 if lon[j] > 0 else -180.0
+            frac = (side - lon[j]) / (lon[j + 1] + 2 * side - lon[j])
+            lat_x = lat[j] + frac * (lat[j + 1] - lat[j])
+            body = np.column_stack([lon[first : j + 1], lat[first : j + 1]])
+            pieces.append(np.vstack([head, body, [[side, lat_x]]]))
+            head = np.array([[-side, lat_x]])
+            first = j + 1
+        pieces.append(np.vstack([head, np.column_stack([lon[first:], lat[first:]])]))
+    return [p for p in pieces if len(p) >= 2]
@@ -0,0 +1,83 @@
+"""
+Shared test fixtures: the repo's leapseconds/PCK kernels plus a synthetic SPK.
+
+SPICE-backed tests use these instead of DE440, which is not in the repo.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+import pytest
+import spiceypy as spice
+
+KERNELS = Path(__file__).resolve().parents[2] / "kernels"
+
+# target -> center for the served bodies, as in DE440
+SERVED_LAYOUT = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0, 6: 0, 10: 0, 301: 3, 399: 3}
+
+
+def synthetic_spk(
+    path: Path,
+    layout: dict[int, int] = SERVED_LAYOUT,
+    start_et: float = -14.2e9,
+    end_et: float = 20.6e9,
+    records: int = 400,
+) -> None:
+    """Type 2 (Chebyshev) segments per target over [start_et, end_et] with plausible distances"""
+    rng = np.random.default_rng(0)
+    handle = spice.spkopn(str(path), "synthetic", 0)
+    for target, center in layout.items():
+        scale = {301: 4e5, 399: 5e3}.get(target, 1.5e8)
+        coeffs = rng.normal(scale=scale / 100, size=(records, 3, 4))
+        coeffs[:, :, 0] = rng.normal(scale=scale, size=(records, 3))
+        spice.spkw02(
+            handle, target, center, "J2000", start_et, end_et, "synthetic",
+            (end_et - start_et) / records, records, 3, coeffs.ravel(), start_et,
+        )
+    spice.spkcls(handle)
+
+
+@contextmanager
+def furnished_kernels(directory: Path, earth_model: bool = False) -> Iterator[None]:
+    """
+    Furnish LSK, PCK and a synthetic SPK written to directory; unload them afterwards.
+
+    With earth_model, main.load_earth_model() runs once the kernels are loaded and
+    main.reset_earth_model() before they are unloaded.
+    """
+    lsk, pck = KERNELS / "lsk" / "naif0012.tls", KERNELS / "pck" / "pck00011.tpc"
+    if not (lsk.exists() and pck.exists()):
+        pytest.skip("Leapseconds/PCK kernels not available")
+    spk = directory / "synthetic.bsp"
+    synthetic_spk(spk)
+    paths = [str(lsk), str(pck), str(spk)]
+    for path in paths:
+        spice.furnsh(path)
+    if earth_model:
+        # Imported here: test modules set DISABLE_RATE_LIMIT before main is first imported
+        import main
+
+        main.load_earth_model()
+    try:
+        yield
+    finally:
+        if earth_model:
+            main.reset_earth_model()
+        for path in paths:
+            spice.unload(path)
+
+
+@pytest.fixture
+def kernels(tmp_path: Path) -> Iterator[None]:
+    """LSK, PCK and the synthetic SPK loaded for one test"""
+    with furnished_kernels(tmp_path):
+        yield
+
+
+@pytest.fixture
+def kernels_with_earth_model(tmp_path: Path) -> Iterator[None]:
+    """kernels, plus the Earth model (radii, ITRF93 coverage) read from them"""
+    with furnished_kernels(tmp_path, earth_model=True):
+        yield
@@ -14,6 +14,7 @@ echo "📍 Downloading GeoNames cities database..."
 if [ -f "$TARGET_FILE" ]; then
     echo "✓ cities15000.txt already exists ($(wc -l < "$TARGET_FILE") cities)"
     echo "  To force re-download, delete the file first"
+    python "$SCRIPT_DIR/tools/build_geonames_index.py" --cities "$TARGET_FILE"
     exit 0
 fi
 
@@ -35,4 +36,7 @@ fi
 
 # Cleanup
 rm -f /tmp/cities15000.zip
+
+# Memory-mapped index so workers skip parsing and tree building at import
+python "$SCRIPT_DIR/tools/build_geonames_index.py" --cities "$TARGET_FILE"
 echo "✓ GeoNames database ready"
@@ -0,0 +1,69 @@
+"""
+Per-request epoch context shared by the planet, house and aspect pipeline.
+
+A chart needs the same instant in several forms: SPICE ET for positions,
+a UTC Julian Date and GMST for the houses, the obliquity, the ayanamsa and
+the J2000 → ecliptic-of-date rotation. EpochContext computes each once per
+request (one str2et call) and is passed to every step that needs them.
+
+The values are the ones the individual steps used to compute for
+themselves, so outputs are unchanged: houses keep their UTC-based JD and
+IAU 1980 obliquity, while positions use the TT-based rotation from
+precession.py.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import numpy as np
+import spiceypy as spice
+from houses import _gmst_deg, _jd_from_iso_utc, _obliquity_deg
+from precession import centuries_since_j2000, ecliptic_matrix, ecliptic_matrix_rate
+from timing import count_spice_calls
+
+
+@dataclass(frozen=True, eq=False)
+class EpochContext:
+    """Epoch-dependent values for one chart instant (picklable for the worker pool)"""
+
+    iso_z: str  # ISO UTC instant, "Z" suffix
+    et: float  # SPICE ephemeris time
+    jd_ut: float  # Julian Date (UTC-based, houses and sidereal time)
+    T: float  # Julian centuries of TT since J2000.0
+    eps_deg: float  # IAU 1980 mean obliquity at jd_ut (houses)
+    gmst_deg: float  # Greenwich mean sidereal time
+    ayanamsa: str
+    ayanamsa_deg: float
+    ecliptic_rotation: np.ndarray  # J2000 → ecliptic of date (read-only)
+    ecliptic_rotation_rate: np.ndarray  # its time derivative, per second
+
+
+def epoch_context(
+    iso_z: str, ayanamsa: str, calculate_ayanamsa_func: Callable[[str, float], float]
+) -> EpochContext:
+    """
+    Build the epoch context for one instant.
+
+    Args:
+        iso_z: ISO UTC datetime string (with Z or +00:00)
+        ayanamsa: Ayanamsa name ("lahiri" or "fagan_bradley")
+        calculate_ayanamsa_func: Function to calculate ayanamsa value
+
+    Returns:
+        EpochContext with every value computed once
+    """
+    count_spice_calls()
+    et = spice.str2et(iso_z)
+    jd_ut = _jd_from_iso_utc(iso_z)
+    return EpochContext(
+        iso_z=iso_z,
+        et=et,
+        jd_ut=jd_ut,
+        T=float(centuries_since_j2000(et)),
+        eps_deg=_obliquity_deg(jd_ut),
+        gmst_deg=_gmst_deg(jd_ut),
+        ayanamsa=ayanamsa,
+        ayanamsa_deg=calculate_ayanamsa_func(ayanamsa, et),
+        ecliptic_rotation=ecliptic_matrix(et),
+        ecliptic_rotation_rate=ecliptic_matrix_rate(et),
+    )
@@ -0,0 +1,155 @@
+"""
+Event search: when a body's ecliptic longitude reaches a target.
+
+Covers sign ingresses (every multiple of 30°) and arbitrary longitudes. The
+scan steps from `start` with steps derived from the body's speed bounds: a
+body that is a degrees short of the next target (moving direct) and b degrees
+past the last one (moving retrograde) cannot reach either in less than
+min(a / max direct speed, b / max retrograde speed), so that step never skips
+a crossing, retrograde loops included. A step whose ends straddle a target is
+refined with Brent's method. Steps are long far from a target and shrink near
+it, which keeps evaluations per event small and bounded.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from houses import FloatOrArray
+
+# Bounds on geocentric longitude speed (deg/day) as (max direct, max retrograde),
+# with a small margin; the Sun and Moon never move retrograde
+SPEED_BOUNDS_DEG_PER_DAY = {
+    "Sun": (1.1, 0.0),
+    "Moon": (16.0, 0.0),
+    "Mercury": (2.5, 1.6),
+    "Venus": (1.35, 0.75),
+    "Mars": (0.9, 0.5),
+    "Jupiter": (0.26, 0.16),
+    "Saturn": (0.14, 0.1),
+}
+
+# Shortest scan step; lets the scan step past a target it has closed in on
+MIN_STEP_S = 600.0
+
+# Crossing instants are refined to this (sub-second)
+TIME_TOLERANCE_S = 0.01
+
+
+@dataclass(frozen=True)
+class Crossing:
+    """One crossing of the target longitude"""
+
+    et: float
+    longitude: float  # at `et`, degrees 0..360
+    direction: int  # +1 direct, -1 retrograde
+
+
+@dataclass(frozen=True)
+class CrossingSearch:
+    """Crossings found, in time order, and how far the scan got"""
+
+    crossings: list[Crossing]
+    evaluations: int
+    searched_until_et: float
+
+
+def _offset(lon: FloatOrArray, target_deg: float, period_deg: float) -> FloatOrArray:
+    """Signed distance (deg) from lon to the nearest target + k * period (elementwise for arrays)"""
+    half = period_deg / 2
+    return (lon - target_deg + half) % period_deg - half
+
+
+def _brent(
+    f: Callable[[float], float], a: float, b: float, fa: float, fb: float, xtol: float
+) -> float:
+    """Root of f in [a, b], where fa and fb have opposite signs (Brent's method)"""
+    if abs(fa) < abs(fb):
+        a, b, fa, fb = b, a, fb, fa
+    c, fc, d = a, fa, a
+    bisected = True
+    while fb != 0.0 and abs(b - a) > xtol:
+        if fa != fc and fb != fc:
+            # Inverse quadratic interpolation
+            s = (
+                a * fb * fc / ((fa - fb) * (fa - fc))
+                + b * fa * fc / ((fb - fa) * (fb - fc))
+                + c * fa * fb / ((fc - fa) * (fc - fb))
+            )
+        else:
+            # Secant
+            s = b - fb * (b - a) / (fb - fa)
+
+        lo, hi = sorted(((3 * a + b) / 4, b))
+        last = abs(b - c) if bisected else abs(c - d)
+        if not lo < s < hi or abs(s - b) >= last / 2 or last < xtol:
+            s = (a + b) / 2
+            bisected = True
+        else:
+            bisected = False
+
+        fs = f(s)
+        d, c, fc = c, b, fb
+        if fa * fs < 0:
+            b, fb = s, fs
+        else:
+            a, fa = s, fs
+        if abs(fa) < abs(fb):
+            a, b, fa, fb = b, a, fb, fa
+    return b
+
+
+def find_crossings(
+    longitude_at: Callable[[float], float],
+    start_et: float,
+    end_et: float,
+    target_deg: float,
+    period_deg: float,
+    speed_bounds: tuple[float, float],
+    accept: Callable[[Crossing], bool],
+    limit: int,
+    max_evaluations: int,
+) -> CrossingSearch:
+    """
+    Crossings of target_deg (+ k * period_deg) by a longitude over [start_et, end_et].
+
+    Args:
+        longitude_at: Longitude (degrees) of the body at an ET
+        start_et, end_et: Search window (ET seconds)
+        target_deg: Target longitude (degrees)
+        period_deg: 360 for one longitude, 30 for every sign boundary
+        speed_bounds: (max direct, max retrograde) longitude speed, deg/day
+        accept: Filter for crossings to report (e.g. one sign's ingress)
+        limit: Stop after this many accepted crossings
+        max_evaluations: Stop after this many longitude evaluations
+
+    Returns:
+        CrossingSearch; searched_until_et < end_et if the limit or budget stopped it
+    """
+    evaluations = 0
+
+    def offset_at(et: float) -> float:
+        nonlocal evaluations
+        evaluations += 1
+        return _offset(longitude_at(et), target_deg, period_deg)
+
+    direct, retrograde = speed_bounds
+    crossings: list[Crossing] = []
+    t, g = start_et, offset_at(start_et)
+    while t < end_et and len(crossings) < limit and evaluations < max_evaluations:
+        # Degrees past the last target and short of the next one
+        behind = g % period_deg
+        days = (period_deg - behind) / direct
+        if retrograde > 0.0:
+            days = min(days, behind / retrograde)
+        safe_s = days * 86400.0
+        t1 = min(t + max(MIN_STEP_S, safe_s), end_et)
+        g1 = offset_at(t1)
+        # No target is reachable within safe_s; only a minimum step can straddle one
+        if safe_s < MIN_STEP_S and (g < 0.0 <= g1 or g > 0.0 >= g1):
+            root = _brent(offset_at, t, t1, g, g1, TIME_TOLERANCE_S)
+            evaluations += 1
+            crossing = Crossing(root, longitude_at(root) % 360.0, 1 if g1 > g else -1)
+            if accept(crossing):
+                crossings.append(crossing)
+        t, g = t1, g1
+    return CrossingSearch(crossings, evaluations, t)
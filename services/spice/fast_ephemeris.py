@@ -0,0 +1,375 @@
+"""
+Precomputed Chebyshev ephemeris tables for the fast precision tier.
+
+An offline builder (tools/build_fast_ephemeris.py) samples the research
+pipeline, DE440 geocentric LT+S positions rotated to the ecliptic of date, over
+1550-2650. It fits fixed-length Chebyshev segments per body and writes:
+
+- ``chebyshev.npy``  coefficients, shape (segments, 3, degree + 1), float64,
+  rows are (longitude, latitude, distance); memory-mapped read-only at runtime
+- ``chebyshev.json`` index: span, degree, per-body segment length/offset/count
+  and the maximum fit error measured by the builder
+
+Evaluating a body is one segment lookup plus a Chebyshev series, so charts take
+microseconds and need no SPICE calls beyond time conversion. Topocentric
+parallax is applied analytically (see topocentric_correction).
+"""
+
+import json
+import math
+import os
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from houses import _gmst_deg
+from numpy.polynomial import chebyshev as C
+from precession import AU_KM, SECONDS_PER_DAY, mean_obliquity_deg
+
+# Uniform series degree; accuracy per body is tuned by segment length instead
+TABLE_DEGREE = 13
+
+# Segment length in days per body (shorter for fast movers)
+DEFAULT_SEGMENT_DAYS = {
+    "Sun": 32.0,
+    "Moon": 8.0,
+    "Mercury": 16.0,
+    "Venus": 16.0,
+    "Mars": 32.0,
+    "Jupiter": 64.0,
+    "Saturn": 64.0,
+}
+
+# Documented bound on |fast - research| for longitude and latitude (3.6"); fit error
+# is typically < 0.01" and parallax/aberration approximations < 1" for the Moon
+FAST_MAX_ERROR_DEG = 0.001
+
+TABLE_START_UTC = "1550-01-01T00:00:00"
+TABLE_END_UTC = "2650-12-31T00:00:00"
+TABLE_FORMAT_VERSION = 1
+
+# (lon, lat, dist_au) arrays for an array of ETs
+Sampler = Callable[[np.ndarray], tuple[np.ndarray, np.ndarray, np.ndarray]]
+
+
+def fit_segments(
+    sampler: Sampler,
+    start_et: float,
+    end_et: float,
+    segment_days: float,
+    degree: int = TABLE_DEGREE,
+) -> tuple[np.ndarray, dict[str, float]]:
+    """
+    Fit Chebyshev segments to a sampled body track.
+
+    Each segment is least-squares fitted on 2 × (degree + 1) Chebyshev nodes and
+    then checked on a denser grid of points between the nodes. Longitude is
+    unwrapped within each segment so the series stays smooth across 0°/360°.
+
+    Args:
+        sampler: Function returning (longitude_deg, latitude_deg, distance_au) for ETs
+        start_et: First covered ET
+        end_et: Last covered ET
+        segment_days: Segment length in days
+        degree: Chebyshev degree
+
+    Returns:
+        Tuple of (coefficients (S, 3, degree + 1), max errors) where max errors
+        has keys longitude_deg, latitude_deg and distance_au
+    """
+    seg_len = segment_days * SECONDS_PER_DAY
+    n_seg = math.ceil((end_et - start_et) / seg_len)
+    seg_start = start_et + seg_len * np.arange(n_seg)
+
+    # Fit on Chebyshev-Gauss nodes (well conditioned), check between them
+    n_nodes = 2 * (degree + 1)
+    x_fit = np.cos(np.pi * (np.arange(n_nodes) + 0.5) / n_nodes)[::-1]
+    x_chk = np.linspace(-1.0, 1.0, 4 * (degree + 1) + 1)
+
+    def sample(x: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        ets = seg_start[:, None] + (x[None, :] + 1.0) * 0.5 * seg_len
+        lon, lat, dist = sampler(ets.ravel())
+        shape = ets.shape
+        lon = np.degrees(np.unwrap(np.radians(lon.reshape(shape)), axis=1))
+        return lon, lat.reshape(shape), dist.reshape(shape)
+
+    lon, lat, dist = sample(x_fit)
+    vander = C.chebvander(x_fit, degree)
+    pinv = np.linalg.pinv(vander)  # (degree + 1, n_nodes)
+
+    coeffs = np.empty((n_seg, 3, degree + 1))
+    for k, values in enumerate((lon, lat, dist)):
+        coeffs[:, k, :] = values @ pinv.T
+
+    # Keep the constant term small so float64 precision is spent on the shape
+    base = np.floor(coeffs[:, 0, 0] / 360.0) * 360.0
+    coeffs[:, 0, 0] -= base
+
+    lon_c, lat_c, dist_c = sample(x_chk)
+    vander_chk = C.chebvander(x_chk, degree)
+    fitted = np.einsum("skd,nd->skn", coeffs, vander_chk)
+    d_lon = (fitted[:, 0, :] - lon_c + 180.0) % 360.0 - 180.0
+    errors = {
+        "longitude_deg": float(np.max(np.abs(d_lon))),
+        "latitude_deg": float(np.max(np.abs(fitted[:, 1, :] - lat_c))),
+        "distance_au": float(np.max(np.abs(fitted[:, 2, :] - dist_c))),
+    }
+    return coeffs, errors
+
+
+def _chebvander(x: np.ndarray, degree: int) -> np.ndarray:
+    """Chebyshev basis T_k(x) = cos(k·arccos x), k = 0..degree (cheaper than C.chebvander)"""
+    theta = np.arccos(np.clip(x, -1.0, 1.0))
+    return np.cos(theta[:, None] * np.arange(degree + 1))
+
+
+class ChebyshevTables:
+    """Read-only, memory-mapped Chebyshev tables and their index."""
+
+    def __init__(self, coeffs: np.ndarray, index: dict[str, Any]):
+        self.coeffs = coeffs
+        self.index = index
+        self.start_et = float(index["start_et"])
+        self.end_et = float(index["end_et"])
+        self.bodies: dict[str, dict[str, Any]] = index["bodies"]
+        self.degree = int(index["degree"])
+        # Maps series coefficients to derivative-series coefficients
+        self._deriv = C.chebder(np.eye(self.degree + 1)).T
+
+    def covers(self, et: float) -> bool:
+        return self.start_et <= et <= self.end_et
+
+    def has_body(self, name: str) -> bool:
+        return name in self.bodies
+
+    def max_error(self) -> dict[str, dict[str, float]]:
+        """Builder-measured maximum fit error per body"""
+        return {name: dict(b["max_error"]) for name, b in self.bodies.items()}
+
+    def evaluate(
+        self, name: str, ets: np.ndarray | float
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Geocentric ecliptic-of-date position and longitude speed of one body.
+
+        Args:
+            name: Body display name (e.g. "Moon")
+            ets: SPICE ephemeris time(s) within [start_et, end_et]
+
+        Returns:
+            Tuple of (longitude_deg, latitude_deg, distance_au, speed_deg_per_day) arrays
+        """
+        body = self.bodies[name]
+        ets_arr = np.atleast_1d(np.asarray(ets, dtype=float))
+        return self._evaluate(
+            ets_arr,
+            np.full(ets_arr.shape, float(body["segment_days"]) * SECONDS_PER_DAY),
+            np.full(ets_arr.shape, int(body["offset"])),
+            np.full(ets_arr.shape, int(body["count"])),
+        )
+
+    def evaluate_bodies(
+        self, names: list[str], et: float
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Same as evaluate, for several bodies at one epoch (one row per name)."""
+        bodies = [self.bodies[n] for n in names]
+        return self._evaluate(
+            np.full(len(names), float(et)),
+            np.array([float(b["segment_days"]) * SECONDS_PER_DAY for b in bodies]),
+            np.array([int(b["offset"]) for b in bodies]),
+            np.array([int(b["count"]) for b in bodies]),
+        )
+
+    def _evaluate(
+        self, ets: np.ndarray, seg_len: np.ndarray, offset: np.ndarray, count: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Evaluate row i at ets[i] from the segment table starting at offset[i]"""
+        rel = (ets - self.start_et) / seg_len
+        seg = np.minimum(np.maximum(np.floor(rel), 0.0), count - 1).astype(np.int64)
+        x = 2.0 * (rel - seg) - 1.0
+
+        c = self.coeffs[offset + seg]  # (N, 3, degree + 1)
+        vander = _chebvander(x, self.degree)  # (N, degree + 1)
+        values = np.einsum("nkd,nd->nk", c, vander)
+
+        # d/dx of the longitude series → degrees/day
+        dlon_dx = np.einsum("nd,nd->n", c[:, 0, :] @ self._deriv, vander[:, :-1])
+        speed = dlon_dx * 2.0 / seg_len * SECONDS_PER_DAY
+
+        return values[:, 0] % 360.0, values[:, 1], values[:, 2], speed
+
+
+def save_tables(
+    out_path: Path,
+    fitted: dict[str, tuple[np.ndarray, dict[str, float]]],
+    start_et: float,
+    end_et: float,
+    segment_days: dict[str, float],
+    meta: dict[str, Any],
+) -> None:
+    """Write coefficients (.npy) and index (.json, same stem) for fitted bodies."""
+    bodies: dict[str, Any] = {}
+    blocks = []
+    offset = 0
+    for name, (coeffs, errors) in fitted.items():
+        bodies[name] = {
+            "offset": offset,
+            "count": int(coeffs.shape[0]),
+            "segment_days": segment_days[name],
+            "max_error": errors,
+        }
+        blocks.append(coeffs)
+        offset += coeffs.shape[0]
+
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    np.save(out_path, np.concatenate(blocks, axis=0))
+    index = {
+        "format_version": TABLE_FORMAT_VERSION,
+        "start_et": start_et,
+        "end_et": end_et,
+        "degree": int(blocks[0].shape[-1] - 1),
+        "bodies": bodies,
+        **meta,
+    }
+    out_path.with_suffix(".json").write_text(json.dumps(index, indent=2))
+
+
+def load_tables(path: Path, kernel_set_tag: str | None = None) -> ChebyshevTables:
+    """
+    Memory-map coefficients read-only and read the index.
+
+    With kernel_set_tag, tables fitted to a different kernel set are rejected
+    (ValueError) rather than served as precision=fast.
+    """
+    index = json.loads(path.with_suffix(".json").read_text())
+    if index.get("format_version") != TABLE_FORMAT_VERSION:
+        raise ValueError(f"Unsupported fast ephemeris format: {index.get('format_version')}")
+    if kernel_set_tag is not None and index.get("kernel_set_tag") != kernel_set_tag:
+        raise ValueError(
+            f"Fast ephemeris tables were built for kernel set {index.get('kernel_set_tag')}, "
+            f"not {kernel_set_tag}"
+        )
+    # Plain ndarray view of the read-only mapping (avoids np.memmap indexing overhead)
+    coeffs = np.asarray(np.load(path, mmap_mode="r"))
+    return ChebyshevTables(coeffs, index)
+
+
+def default_tables_path() -> Path:
+    """Table location: FAST_EPHEMERIS_PATH or kernels/fast/chebyshev.npy next to this file"""
+    env = os.getenv("FAST_EPHEMERIS_PATH")
+    if env:
+        return Path(env)
+    return Path(__file__).resolve().parent / "kernels" / "fast" / "chebyshev.npy"
+
+
+_tables: ChebyshevTables | None = None
+
+# What load_fast_tables raises for an unreadable, corrupt or incompatible table file
+TABLE_LOAD_ERRORS = (OSError, ValueError, KeyError)
+
+
+def load_fast_tables(kernel_set_tag: str) -> ChebyshevTables | None:
+    """Load tables for the running kernel set; None if they have not been built."""
+    global _tables
+    _tables = None
+    path = default_tables_path()
+    if not path.exists():
+        return None
+    _tables = load_tables(path, kernel_set_tag)
+    return _tables
+
+
+def get_fast_tables() -> ChebyshevTables | None:
+    """Loaded tables, or None when the fast tier is unavailable."""
+    return _tables
+
+
+def topocentric_correction(
+    lon_deg: np.ndarray,
+    lat_deg: np.ndarray,
+    dist_au: np.ndarray,
+    et: float,
+    jd_ut: float,
+    obs_lat_deg: float,
+    obs_lon_deg: float,
+    obs_elev_m: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Shift geocentric ecliptic-of-date positions to the observer (parallax).
+
+    The observer is placed on the WGS-84 ellipsoid and rotated by mean sidereal
+    time into the equator of date, then into the ecliptic of date. Nutation and
+    polar motion are ignored; for the Moon that contributes well under an
+    arcsecond, far below the parallax itself (~1°).
+
+    Args:
+        lon_deg, lat_deg, dist_au: Geocentric ecliptic-of-date coordinates
+        et: SPICE ephemeris time (for obliquity)
+        jd_ut: Julian Date (UT) for sidereal time
+        obs_lat_deg, obs_lon_deg, obs_elev_m: Observer geodetic location
+
+    Returns:
+        Tuple of topocentric (longitude_deg, latitude_deg, distance_au) arrays
+    """
+    # WGS-84 geodetic → geocentric (km), matching _observer_pos_in_iau_earth
+    re = 6378.137
+    f = 1.0 / 298.257223563
+    phi = math.radians(obs_lat_deg)
+    e2 = f * (2.0 - f)
+    n = re / math.sqrt(1.0 - e2 * math.sin(phi) ** 2)
+    h = obs_elev_m / 1000.0
+    rho_cos = (n + h) * math.cos(phi)
+    rho_sin = (n * (1.0 - e2) + h) * math.sin(phi)
+
+    lst = math.radians(_gmst_deg(jd_ut) + obs_lon_deg)
+    obs_eq = np.array([rho_cos * math.cos(lst), rho_cos * math.sin(lst), rho_sin])
+
+    T = et / SECONDS_PER_DAY / 36525.0
+    eps = math.radians(float(mean_obliquity_deg(T)))
+    ce, se = math.cos(eps), math.sin(eps)
+    obs_ecl = np.array(
+        [obs_eq[0], ce * obs_eq[1] + se * obs_eq[2], -se * obs_eq[1] + ce * obs_eq[2]]
+    )
+
+    lam, bet = np.radians(lon_deg), np.radians(lat_deg)
+    r_km = np.asarray(dist_au) * AU_KM
+    x = r_km * np.cos(bet) * np.cos(lam) - obs_ecl[0]
+    y = r_km * np.cos(bet) * np.sin(lam) - obs_ecl[1]
+    z = r_km * np.sin(bet) - obs_ecl[2]
+
+    r_topo = np.sqrt(x * x + y * y + z * z)
+    lon_t = (np.degrees(np.arctan2(y, x)) + 360.0) % 360.0
+    lat_t = np.degrees(np.arcsin(z / r_topo))
+    return lon_t, lat_t, r_topo / AU_KM
+
+
+def topocentric_positions(
+    tables: ChebyshevTables,
+    names: list[str],
+    et: float,
+    jd_ut: float,
+    obs_lat_deg: float,
+    obs_lon_deg: float,
+    obs_elev_m: float,
+    half_step: float = 3600.0,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Topocentric ecliptic-of-date positions and longitude speed for several bodies.
+
+    Speed is a central difference of the topocentric longitude with the observer
+    held fixed in inertial space, the same definition the research path uses
+    (observer velocity added back), so diurnal parallax does not leak into it.
+
+    Returns:
+        Tuple of (longitude_deg, latitude_deg, distance_au, speed_deg_per_day) arrays
+    """
+    obs = (jd_ut, obs_lat_deg, obs_lon_deg, obs_elev_m)
+    geo = tables.evaluate_bodies(names, et)
+    lon, lat, dist = topocentric_correction(geo[0], geo[1], geo[2], et, *obs)
+
+    lon0 = topocentric_correction(*tables.evaluate_bodies(names, et - half_step)[:3], et, *obs)[0]
+    lon1 = topocentric_correction(*tables.evaluate_bodies(names, et + half_step)[:3], et, *obs)[0]
+    d_lon = (lon1 - lon0 + 180.0) % 360.0 - 180.0
+    speed = d_lon / (2.0 * half_step) * SECONDS_PER_DAY
+    return lon, lat, dist, speed
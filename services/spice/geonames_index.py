@@ -0,0 +1,272 @@
+"""
+Prebuilt GeoNames city index for nearest-city timezone lookup.
+
+An offline step (tools/build_geonames_index.py) parses cities15000.txt once and
+writes:
+
+- ``geonames.npy``  structured array (x, y, z, tz): each city as a unit vector
+  on the sphere, in kd-tree order; memory-mapped read-only at runtime, so
+  workers share the same pages and startup does no parsing or tree building
+- ``geonames.json`` index: format version, leaf size, timezone name table and
+  the size of the source file it was built from
+
+Distances are chords between unit vectors, which are monotonic in great-circle
+distance: no distortion at high latitudes and no seam at the antimeridian. A
+kilometre radius converts to a chord once, so "nearest city within 100 km" is a
+radius-bounded search that never visits cells farther away.
+
+The kd-tree is implicit in the row order: a range [lo, hi) longer than the leaf
+size keeps its median row (on axis depth % 3: x, y, z) at mid = (lo + hi) // 2,
+with [lo, mid) <= it and [mid + 1, hi) >= it. No node arrays are stored;
+queries walk ranges and scan leaves with numpy. ``nearest_within`` resolves
+arrays of coordinates in one pass over the tree.
+
+Without a prebuilt file the same index is built in memory from the text file.
+"""
+
+import json
+import math
+import os
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+INDEX_FORMAT_VERSION = 2
+
+# Rows per leaf: leaves are scanned vectorized, so a few dozen beats deeper trees
+LEAF_SIZE = 32
+
+# 32-byte records keep x, y, z aligned for the (n, 3) view
+CITY_DTYPE = np.dtype(
+    {
+        "names": ["x", "y", "z", "tz"],
+        "formats": ["<f8", "<f8", "<f8", "<u2"],
+        "offsets": [0, 8, 16, 24],
+        "itemsize": 32,
+    }
+)
+
+# Mean Earth radius (km), as used for haversine distances elsewhere
+EARTH_RADIUS_KM = 6371.0
+
+NO_CITY = -1
+
+
+def parse_cities(path: Path) -> tuple[np.ndarray, list[str]]:
+    """(lat, lon) array and timezone per city from a GeoNames dump; rows without tz skipped"""
+    coords: list[tuple[float, float]] = []
+    timezones: list[str] = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            parts = line.strip().split("\t")
+            if len(parts) > 17:
+                try:
+                    lat = float(parts[4])
+                    lon = float(parts[5])
+                    tz = parts[17]
+                    if tz:  # Only add if timezone is present
+                        coords.append((lat, lon))
+                        timezones.append(tz)
+                except (ValueError, IndexError):
+                    continue
+    return np.array(coords, dtype=np.float64).reshape(-1, 2), timezones
+
+
+def unit_vectors(lat_deg: np.ndarray, lon_deg: np.ndarray) -> np.ndarray:
+    """(n, 3) unit vectors for latitudes/longitudes in degrees"""
+    lat = np.radians(np.asarray(lat_deg, dtype=np.float64))
+    lon = np.radians(np.asarray(lon_deg, dtype=np.float64))
+    cos_lat = np.cos(lat)
+    return np.column_stack((cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)))
+
+
+def km_to_chord(distance_km: float) -> float:
+    """Chord length on the unit sphere for a great-circle distance"""
+    return 2.0 * math.sin(min(distance_km / EARTH_RADIUS_KM, math.pi) / 2.0)
+
+
+def chord_to_km(chord: np.ndarray | float) -> np.ndarray | float:
+    """Great-circle distance for chord length(s) on the unit sphere"""
+    return 2.0 * EARTH_RADIUS_KM * np.arcsin(np.clip(np.asarray(chord) / 2.0, 0.0, 1.0))
+
+
+def _kd_order(points: np.ndarray, leaf_size: int) -> np.ndarray:
+    """Row permutation that lays points out as the implicit kd-tree"""
+    order = np.arange(len(points))
+    k = points.shape[1]
+    stack = [(0, len(points), 0)]
+    while stack:
+        lo, hi, depth = stack.pop()
+        if hi - lo <= leaf_size:
+            continue
+        mid = (lo + hi) // 2
+        segment = order[lo:hi]
+        order[lo:hi] = segment[np.argpartition(points[segment, depth % k], mid - lo)]
+        stack.append((lo, mid, depth + 1))
+        stack.append((mid + 1, hi, depth + 1))
+    return order
+
+
+class GeoNamesIndex:
+    """Cities as unit vectors in kd-tree order, with their timezone table"""
+
+    def __init__(self, cities: np.ndarray, timezones: list[str], leaf_size: int = LEAF_SIZE):
+        self.cities = cities
+        self.timezones = timezones
+        self.leaf_size = leaf_size
+        # (n, 3) float64 view of x, y, z (no copy; on a mapped file these stay shared pages)
+        self._xyz = np.lib.stride_tricks.as_strided(
+            cities["x"], shape=(len(cities), 3), strides=(cities.strides[0], 8), writeable=False
+        )
+        self._tz = cities["tz"]
+
+    def __len__(self) -> int:
+        return len(self.cities)
+
+    @classmethod
+    def build(cls, coords: np.ndarray, timezones: list[str]) -> "GeoNamesIndex":
+        """Index (lat, lon) degree coordinates with one timezone name each"""
+        names = sorted(set(timezones))
+        if len(names) > np.iinfo(CITY_DTYPE["tz"]).max:
+            raise ValueError(f"Too many timezones for the index: {len(names)}")
+        tz_ids = {name: i for i, name in enumerate(names)}
+
+        xyz = unit_vectors(coords[:, 0], coords[:, 1])
+        order = _kd_order(xyz, LEAF_SIZE)
+        cities = np.empty(len(coords), dtype=CITY_DTYPE)
+        cities["x"], cities["y"], cities["z"] = xyz[order].T
+        cities["tz"] = np.array([tz_ids[tz] for tz in timezones], dtype=np.uint16)[order]
+        return cls(cities, names, LEAF_SIZE)
+
+    def nearest(self, lat: float, lon: float, max_distance_km: float) -> tuple[str, float] | None:
+        """(timezone, distance km) of the nearest city within max_distance_km, else None"""
+        if len(self.cities) == 0:
+            return None
+        query = unit_vectors(np.array([lat]), np.array([lon]))[0]
+        qx, qy, qz = (float(v) for v in query)
+        best_d2 = km_to_chord(max_distance_km) ** 2
+        best = NO_CITY
+        xyz = self._xyz
+        # (lo, hi, depth, lower bound on squared chord to any row in range)
+        stack = [(0, len(self.cities), 0, 0.0)]
+        while stack:
+            lo, hi, depth, bound = stack.pop()
+            if bound > best_d2:
+                continue
+            if hi - lo <= self.leaf_size:
+                d2 = ((xyz[lo:hi] - query) ** 2).sum(axis=1)
+                j = int(np.argmin(d2))
+                if d2[j] <= best_d2:
+                    best_d2 = float(d2[j])
+                    best = lo + j
+                continue
+            mid = (lo + hi) // 2
+            nx, ny, nz = xyz[mid].tolist()
+            d2_node = (nx - qx) ** 2 + (ny - qy) ** 2 + (nz - qz) ** 2
+            if d2_node <= best_d2:
+                best_d2 = d2_node
+                best = mid
+            diff = (qx - nx, qy - ny, qz - nz)[depth % 3]
+            near, far = ((lo, mid), (mid + 1, hi)) if diff < 0 else ((mid + 1, hi), (lo, mid))
+            stack.append((far[0], far[1], depth + 1, diff * diff))
+            stack.append((near[0], near[1], depth + 1, bound))
+        if best == NO_CITY:
+            return None
+        return self.timezones[int(self._tz[best])], float(chord_to_km(math.sqrt(best_d2)))
+
+    def nearest_within(
+        self, lats: np.ndarray, lons: np.ndarray, max_distance_km: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized nearest city within max_distance_km for arrays of coordinates.
+
+        Returns (timezone ids, distances km): ids index ``timezones`` and are
+        NO_CITY (distance inf) where no city is in range. The tree is walked
+        once for the whole batch, carrying the queries whose radius reaches
+        each range.
+        """
+        queries = unit_vectors(lats, lons)
+        m = len(queries)
+        best_d2 = np.full(m, km_to_chord(max_distance_km) ** 2)
+        best = np.full(m, NO_CITY, dtype=np.int64)
+        radius = math.sqrt(best_d2[0]) if m else 0.0
+        xyz = self._xyz
+
+        stack = [(0, len(self.cities), 0, np.arange(m))]
+        while stack:
+            lo, hi, depth, active = stack.pop()
+            if len(active) == 0 or hi <= lo:
+                continue
+            q = queries[active]
+            if hi - lo <= self.leaf_size:
+                d2 = ((q[:, None, :] - xyz[None, lo:hi, :]) ** 2).sum(axis=2)
+                j = np.argmin(d2, axis=1)
+                d2_min = d2[np.arange(len(active)), j]
+                better = d2_min <= best_d2[active]
+                best_d2[active[better]] = d2_min[better]
+                best[active[better]] = lo + j[better]
+                continue
+            mid = (lo + hi) // 2
+            node = xyz[mid]
+            d2_node = ((q - node) ** 2).sum(axis=1)
+            better = d2_node <= best_d2[active]
+            best_d2[active[better]] = d2_node[better]
+            best[active[better]] = mid
+            # A range can hold a match only within the fixed search radius of the split
+            diff = q[:, depth % 3] - node[depth % 3]
+            stack.append((lo, mid, depth + 1, active[diff <= radius]))
+            stack.append((mid + 1, hi, depth + 1, active[diff >= -radius]))
+
+        found = best != NO_CITY
+        tz_ids = np.full(m, NO_CITY, dtype=np.int64)
+        tz_ids[found] = self._tz[best[found]]
+        distances = np.full(m, np.inf)
+        distances[found] = chord_to_km(np.sqrt(best_d2[found]))
+        return tz_ids, distances
+
+
+def save_index(out_path: Path, index: GeoNamesIndex, meta: dict[str, Any]) -> None:
+    """Write cities (.npy) and index (.json, same stem)."""
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    np.save(out_path, index.cities)
+    header = {
+        "format_version": INDEX_FORMAT_VERSION,
+        "count": len(index),
+        "leaf_size": index.leaf_size,
+        "timezones": index.timezones,
+        **meta,
+    }
+    out_path.with_suffix(".json").write_text(json.dumps(header, indent=2))
+
+
+def load_index(path: Path) -> GeoNamesIndex:
+    """Memory-map cities read-only and read the index."""
+    header = json.loads(path.with_suffix(".json").read_text())
+    if header.get("format_version") != INDEX_FORMAT_VERSION:
+        raise ValueError(f"Unsupported GeoNames index format: {header.get('format_version')}")
+    # Plain ndarray view of the read-only mapping (avoids np.memmap indexing overhead)
+    cities = np.asarray(np.load(path, mmap_mode="r"))
+    if cities.dtype != CITY_DTYPE or len(cities) != header["count"]:
+        raise ValueError(f"GeoNames index {path} does not match its header")
+    return GeoNamesIndex(cities, header["timezones"], header["leaf_size"])
+
+
+def default_index_path() -> Path:
+    """Index location: GEONAMES_INDEX_PATH or geonames.npy next to this file"""
+    env = os.getenv("GEONAMES_INDEX_PATH")
+    if env:
+        return Path(env)
+    return Path(__file__).resolve().parent / "geonames.npy"
+
+
+def default_cities_path() -> Path:
+    return Path(__file__).resolve().parent / "cities15000.txt"
+
+
+def is_stale(index_path: Path, cities_path: Path) -> bool:
+    """True when cities_path exists and differs in size from the file the index was built from"""
+    if not cities_path.exists():
+        return False
+    header = json.loads(index_path.with_suffix(".json").read_text())
+    return header.get("source_bytes") != cities_path.stat().st_size
@@ -0,0 +1,23 @@
+"""
+Gunicorn settings for the SPICE service (Dockerfile CMD and tools/loadtest.py).
+
+PRELOAD=1 imports the app once in the master and loads the immutable shared
+state there (main.preload_shared_state) before workers fork, so workers share
+it copy-on-write instead of each building their own. CSPICE itself is still
+initialized in every worker after fork (lifespan), as its kernel pool and file
+handles cannot be shared between processes.
+"""
+
+import os
+import sys
+from typing import Any
+
+preload_app = os.getenv("PRELOAD", "0") == "1"
+
+
+def when_ready(server: Any) -> None:
+    """Master is up and the app imported; workers have not been forked yet"""
+    if preload_app:
+        # The module gunicorn loaded ("main" from the Dockerfile's main:app)
+        module = sys.modules[server.app.app_uri.partition(":")[0]]
+        module.preload_shared_state()
@@ -2,26 +2,36 @@
 House system calculations for astrological charts.
 
 This module handles ASC/MC calculation and house cusp generation for
-multiple house systems (Placidus, Whole Sign, Equal).
+multiple house systems (Placidus, Whole Sign, Equal). The *_arrays variants
+evaluate the same formulas for arrays of epochs at one location (rectification
+sweeps).
 """
 
 import math
 from datetime import datetime
-from typing import Literal
+from typing import TYPE_CHECKING, Literal, TypeVar
 
-import spiceypy as spice
+import numpy as np
 from fastapi import HTTPException
 
+if TYPE_CHECKING:
+    from epoch import EpochContext
+
 # Type aliases
 Zodiac = Literal["tropical", "sidereal"]
 HouseSystem = Literal["placidus", "whole-sign", "equal"]
 McHemisphere = Literal["south", "north", "auto"]
 
+# Angle helpers take a scalar or, for the *_arrays variants, a NumPy array
+FloatOrArray = TypeVar("FloatOrArray", float, np.ndarray)
+
+PLACIDUS_POLES_DETAIL = "Placidus undefined near poles (|latitude| too high)"
 
-def _wrap360(x: float) -> float:
-    """Wrap angle to [0, 360)"""
-    v = x % 360.0
-    return v if v >= 0 else v + 360.0
+
+def _wrap360(x: FloatOrArray) -> FloatOrArray:
+    """Wrap angle to [0, 360) (also elementwise for NumPy arrays)"""
+    # Python and NumPy % both return a result with the sign of the divisor
+    return x % 360.0
 
 
 def _atan2d(y: float, x: float) -> float:
@@ -29,7 +39,7 @@ def _atan2d(y: float, x: float) -> float:
     return _wrap360(math.degrees(math.atan2(y, x)))
 
 
-def _obliquity_deg(jd_tt_like: float) -> float:
+def _obliquity_deg(jd_tt_like: FloatOrArray) -> FloatOrArray:
     """
     Calculate mean obliquity of the ecliptic using IAU 1980 formula.
 
@@ -59,7 +69,7 @@ def _jd_from_iso_utc(iso_z: str) -> float:
     return dt.timestamp() / 86400.0 + 2440587.5  # Unix epoch to JD (UTC)
 
 
-def _gmst_deg(jd_ut: float) -> float:
+def _gmst_deg(jd_ut: FloatOrArray) -> FloatOrArray:
     """
     Calculate Greenwich Mean Sidereal Time in degrees.
 
@@ -82,11 +92,9 @@ def _gmst_deg(jd_ut: float) -> float:
 
 
 def _asc_mc_tropical_and_sidereal(
-    iso_z: str,
+    ctx: "EpochContext",
     lat_deg: float,
     lon_deg: float,
-    ay_name: str,
-    calculate_ayanamsa_func,
     mc_hemisphere: McHemisphere = "south",
 ) -> dict[str, float]:
     """
@@ -95,20 +103,17 @@ def _asc_mc_tropical_and_sidereal(
     Uses geometric intersection of local horizon/meridian with ecliptic plane.
 
     Args:
-        iso_z: ISO UTC datetime string
+        ctx: Epoch context (JD, obliquity, GMST, ayanamsa) for the instant
         lat_deg: Geographic latitude in degrees
         lon_deg: Geographic longitude in degrees
-        ay_name: Ayanamsa name ("lahiri" or "fagan_bradley")
-        calculate_ayanamsa_func: Function to calculate ayanamsa value
         mc_hemisphere: Which hemisphere to prefer for MC ("south", "north", "auto")
 
     Returns:
         Dictionary with asc_tropical, mc_tropical, asc (sidereal), mc (sidereal), ay, eps_deg, lst_deg
     """
-    jd = _jd_from_iso_utc(iso_z)
-    eps = math.radians(_obliquity_deg(jd))
-    ay = calculate_ayanamsa_func(ay_name, spice.str2et(iso_z))
-    gmst = _gmst_deg(jd)
+    eps = math.radians(ctx.eps_deg)
+    ay = ctx.ayanamsa_deg
+    gmst = ctx.gmst_deg
     lst = math.radians(_wrap360(gmst + lon_deg))
     phi = math.radians(lat_deg)
 
@@ -180,13 +185,12 @@ def _asc_mc_tropical_and_sidereal(
 
 
 def _placidus_cusps(
-    iso_z: str,
+    ctx: "EpochContext",
     lat_deg: float,
     lon_deg: float,
-    ay_name: str,
-    calculate_ayanamsa_func,
     zodiac: Zodiac,
     mc_hemisphere: McHemisphere = "south",
+    asc_mc: dict[str, float] | None = None,
 ) -> list[float]:
     """
     Calculate Placidus house cusps.
@@ -195,13 +199,13 @@ def _placidus_cusps(
     and nocturnal semi-arc to get 2/3. Enforces strict oppositions.
 
     Args:
-        iso_z: ISO UTC datetime string
+        ctx: Epoch context (JD, obliquity, GMST, ayanamsa) for the instant
         lat_deg: Geographic latitude in degrees
         lon_deg: Geographic longitude in degrees
-        ay_name: Ayanamsa name ("lahiri" or "fagan_bradley")
-        calculate_ayanamsa_func: Function to calculate ayanamsa value
         zodiac: "tropical" or "sidereal"
         mc_hemisphere: Which hemisphere to prefer for MC
+        asc_mc: Result of _asc_mc_tropical_and_sidereal for the same inputs, if
+            the caller already has it
 
     Returns:
         List of 12 house cusp longitudes in degrees
@@ -209,17 +213,14 @@ def _placidus_cusps(
     Raises:
         HTTPException: If latitude too close to poles (Placidus undefined)
     """
-    jd = _jd_from_iso_utc(iso_z)
-    eps = math.radians(_obliquity_deg(jd))
-    ay = calculate_ayanamsa_func(ay_name, spice.str2et(iso_z))
-    gmst = _gmst_deg(jd)
+    eps = math.radians(ctx.eps_deg)
+    ay = ctx.ayanamsa_deg
+    gmst = ctx.gmst_deg
     RAMC = math.radians(_wrap360(gmst + lon_deg))  # RA of MC
     phi = math.radians(lat_deg)
     cphi = math.cos(phi)
     if abs(cphi) < 1e-2:
-        raise HTTPException(
-            status_code=422, detail="Placidus undefined near poles (|latitude| too high)"
-        )
+        raise HTTPException(status_code=422, detail=PLACIDUS_POLES_DETAIL)
 
     def ra_from_hour(h: float) -> float:
         # α = atan2( sin h, cos h * cos φ )  (correct quadrant)
@@ -244,9 +245,8 @@ def _placidus_cusps(
 
     # Tropical MC & Asc for 10/1
     l10_t = ecl_lambda_from_ra(RAMC)
-    asc_mc = _asc_mc_tropical_and_sidereal(
-        iso_z, lat_deg, lon_deg, ay_name, calculate_ayanamsa_func, mc_hemisphere
-    )
+    if asc_mc is None:
+        asc_mc = _asc_mc_tropical_and_sidereal(ctx, lat_deg, lon_deg, mc_hemisphere)
     l01_t = asc_mc["asc_tropical"]
 
     # Opposites (tropical)
@@ -327,3 +327,119 @@ def _finalize_cusps(trop_list: list[float], ay: float, zodiac: Zodiac) -> list[f
         return [_wrap360(x - ay) for x in trop_list]
     else:
         return [_wrap360(x) for x in trop_list]
+
+
+def _asc_mc_arrays(
+    eps_deg: np.ndarray,
+    gmst_deg: np.ndarray,
+    lat_deg: float,
+    lon_deg: float,
+    mc_hemisphere: McHemisphere = "south",
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Tropical Ascendant and Midheaven for arrays of epochs at one location.
+
+    Same construction as _asc_mc_tropical_and_sidereal, one row per epoch.
+
+    Args:
+        eps_deg: Mean obliquity per epoch (degrees)
+        gmst_deg: Greenwich mean sidereal time per epoch (degrees)
+        lat_deg: Geographic latitude in degrees
+        lon_deg: Geographic longitude in degrees
+        mc_hemisphere: Which hemisphere to prefer for MC ("south", "north", "auto")
+
+    Returns:
+        Tuple of (asc_tropical, mc_tropical) arrays in degrees
+    """
+    eps = np.radians(eps_deg)
+    lst = np.radians(_wrap360(gmst_deg + lon_deg))
+    phi = math.radians(lat_deg)
+    cphi, sphi = math.cos(phi), math.sin(phi)
+    cl, sl = np.cos(lst), np.sin(lst)
+    zeros = np.zeros_like(lst)
+
+    # Local triad and ecliptic normal in equatorial coords, shape (N, 3)
+    z_hat = np.stack([cphi * cl, cphi * sl, zeros + sphi], axis=-1)
+    e_hat = np.stack([-sl, cl, zeros], axis=-1)
+    n_hat = np.stack([-sphi * cl, -sphi * sl, zeros + cphi], axis=-1)
+    n_ecl = np.stack([zeros, -np.sin(eps), np.cos(eps)], axis=-1)
+
+    # Asc: eastern intersection of horizon and ecliptic
+    d_asc = np.cross(n_ecl, z_hat)
+    d_asc *= np.where(np.sum(e_hat * d_asc, axis=-1) < 0, -1.0, 1.0)[:, None]
+
+    # MC: intersection of meridian and ecliptic on the chosen side
+    if mc_hemisphere == "north" or (mc_hemisphere == "auto" and lat_deg < 0.0):
+        ref = n_hat
+    else:
+        ref = -n_hat
+    d_mc = np.cross(n_ecl, e_hat)
+    d_mc *= np.where(np.sum(ref * d_mc, axis=-1) < 0, -1.0, 1.0)[:, None]
+
+    # Equatorial → Ecliptic-of-date (rotate by -ε about X); only x, y are needed
+    ce, se = np.cos(eps), np.sin(eps)
+
+    def ecliptic_longitude(d: np.ndarray) -> np.ndarray:
+        return _wrap360(np.degrees(np.arctan2(ce * d[:, 1] + se * d[:, 2], d[:, 0])))
+
+    return ecliptic_longitude(d_asc), ecliptic_longitude(d_mc)
+
+
+def _placidus_cusps_arrays(
+    eps_deg: np.ndarray,
+    gmst_deg: np.ndarray,
+    lat_deg: float,
+    lon_deg: float,
+    asc_tropical: np.ndarray,
+) -> np.ndarray:
+    """
+    Tropical Placidus cusps for arrays of epochs, as in _placidus_cusps.
+
+    Args:
+        eps_deg: Mean obliquity per epoch (degrees)
+        gmst_deg: Greenwich mean sidereal time per epoch (degrees)
+        lat_deg: Geographic latitude in degrees
+        lon_deg: Geographic longitude in degrees
+        asc_tropical: Tropical Ascendant per epoch (from _asc_mc_arrays)
+
+    Returns:
+        Array of shape (N, 12): cusps 1..12 per epoch in degrees
+
+    Raises:
+        HTTPException: If latitude too close to poles (Placidus undefined)
+    """
+    cphi = math.cos(math.radians(lat_deg))
+    if abs(cphi) < 1e-2:
+        raise HTTPException(status_code=422, detail=PLACIDUS_POLES_DETAIL)
+    eps = np.radians(eps_deg)
+    ramc = np.radians(_wrap360(gmst_deg + lon_deg))
+
+    def ecl_lambda_from_hour(h: np.ndarray) -> np.ndarray:
+        alpha = np.arctan2(np.sin(h), np.cos(h) * cphi)
+        return _wrap360(np.degrees(np.arctan2(np.sin(alpha) / np.cos(eps), np.cos(alpha))))
+
+    l10 = _wrap360(np.degrees(np.arctan2(np.sin(ramc) / np.cos(eps), np.cos(ramc))))
+    l11 = ecl_lambda_from_hour(ramc + math.radians(30.0))
+    l12 = ecl_lambda_from_hour(ramc + math.radians(60.0))
+    l02 = ecl_lambda_from_hour(ramc + math.pi + math.radians(-60.0))
+    l03 = ecl_lambda_from_hour(ramc + math.pi + math.radians(-30.0))
+    l01 = asc_tropical
+
+    # Strict oppositions, as in _placidus_cusps
+    l04, l05, l06, l07, l08, l09 = (_wrap360(x + 180.0) for x in (l10, l11, l12, l01, l02, l03))
+    return np.stack([l01, l02, l03, l04, l05, l06, l07, l08, l09, l10, l11, l12], axis=-1)
+
+
+def _asc_based_cusps_arrays(asc_final: np.ndarray, system: HouseSystem) -> np.ndarray:
+    """
+    Whole Sign or Equal cusps for arrays of epochs, as in _whole_sign_cusps/_equal_cusps.
+
+    Args:
+        asc_final: Ascendant per epoch in the requested zodiac (degrees)
+        system: "whole-sign" or "equal"
+
+    Returns:
+        Array of shape (N, 12) in the same zodiac as asc_final
+    """
+    first = np.floor(asc_final / 30.0) * 30.0 if system == "whole-sign" else asc_final
+    return _wrap360(first[:, None] + 30.0 * np.arange(12))
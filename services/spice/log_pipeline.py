@@ -0,0 +1,136 @@
+"""
+Non-blocking structured logging.
+
+Request handlers put log records on a bounded in-memory queue and return; a
+background thread serializes them to JSON and writes them to the stream. A slow
+or blocked stdout therefore never stalls the event loop. When the queue is full
+(the writer cannot keep up) records are dropped and counted rather than making
+the request wait.
+
+Structured events are logged as dicts (``logger.info({"event": ...})``); the
+JSON encoding happens on the writer thread.
+
+Fork-safe: the writer thread is stopped (queue flushed) just before os.fork and
+restarted in both parent and child, so a gunicorn master started with preload
+forks single-threaded and every worker gets its own writer.
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import sys
+import weakref
+from logging.handlers import QueueHandler, QueueListener
+from typing import TextIO
+
+DEFAULT_QUEUE_SIZE = 10_000
+
+
+class JsonFormatter(logging.Formatter):
+    """Dict messages become one JSON line; anything else is formatted as usual"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        if isinstance(record.msg, dict):
+            return json.dumps(record.msg)
+        return super().format(record)
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """Enqueue without formatting; drop (and count) when the queue is full"""
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]"):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The listener runs in this process, so the record needs no flattening;
+        # formatting is left to the writer thread
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class LogPipeline:
+    """Queue + writer thread behind one logger"""
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        level: int | str = logging.INFO,
+        max_queue: int = DEFAULT_QUEUE_SIZE,
+        stream: TextIO | None = None,
+    ):
+        self.logger = logger
+        self.queue: queue.Queue[logging.LogRecord] = queue.Queue(max_queue)
+        self._handler = _DroppingQueueHandler(self.queue)
+
+        writer = logging.StreamHandler(stream or sys.stdout)
+        writer.setFormatter(JsonFormatter("%(message)s"))
+        self._listener = QueueListener(self.queue, writer)
+        self._running = False
+        self._resume_after_fork = False
+        _pipelines.add(self)
+
+        logger.handlers = [self._handler]
+        logger.propagate = False
+        logger.setLevel(level)
+
+    @property
+    def dropped(self) -> int:
+        return self._handler.dropped
+
+    def start(self) -> None:
+        if not self._running:
+            self._listener.start()
+            self._running = True
+            atexit.register(self.stop)
+
+    def stop(self) -> None:
+        """Flush queued records and stop the writer thread (idempotent)"""
+        if self._running:
+            self._listener.stop()
+            self._running = False
+            atexit.unregister(self.stop)
+
+    def _pause_for_fork(self) -> None:
+        self._resume_after_fork = self._running
+        if self._running:
+            self._listener.stop()
+
+    def _resume_from_fork(self) -> None:
+        if self._resume_after_fork:
+            self._listener.start()
+            self._resume_after_fork = False
+
+
+# Pipelines to pause around os.fork (weak: tests create and drop many)
+_pipelines: "weakref.WeakSet[LogPipeline]" = weakref.WeakSet()
+
+
+def _before_fork() -> None:
+    for pipeline in list(_pipelines):
+        pipeline._pause_for_fork()
+
+
+def _after_fork() -> None:
+    for pipeline in list(_pipelines):
+        pipeline._resume_from_fork()
+
+
+os.register_at_fork(
+    before=_before_fork, after_in_parent=_after_fork, after_in_child=_after_fork
+)
+
+
+def parse_level(value: str) -> int:
+    """Numeric level for a name like "INFO" or "debug"; ValueError if unknown"""
+    level = logging.getLevelNamesMapping().get(value.strip().upper())
+    if level is None:
+        raise ValueError(f"Unknown log level: {value!r}")
+    return level
@@ -1,24 +1,49 @@
+import asyncio
 import csv
+import gc
 import io
 import json
 import logging
 import os
 import time
 import uuid
-from collections import deque
-from collections.abc import AsyncGenerator, Callable
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable, Hashable
 from contextlib import asynccontextmanager
-from datetime import UTC
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, NoReturn, TypeVar
 
 import numpy as np
 import pytz
 import spiceypy as spice
+from astrocartography import (
+    equatorial_from_ecliptic,
+    horizon_longitudes,
+    line_pieces,
+    meridian_longitudes,
+)
+from epoch import EpochContext, epoch_context
+from events import SPEED_BOUNDS_DEG_PER_DAY, Crossing, find_crossings
+from fast_ephemeris import (
+    TABLE_LOAD_ERRORS,
+    ChebyshevTables,
+    get_fast_tables,
+    load_fast_tables,
+    topocentric_positions,
+)
 from fastapi import FastAPI, HTTPException, Request
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import (
+    JSONResponse,
+    PlainTextResponse,
+    Response,
+    StreamingResponse,
+)
 from houses import (
+    FloatOrArray,
     _asc_mc_tropical_and_sidereal,
     _equal_cusps,
     _placidus_cusps,
@@ -27,24 +52,65 @@ from houses import (
 )
 
 # Import from new modules
+from log_pipeline import LogPipeline, parse_level
 from models import (
     AVAILABLE_BODIES,
     ApiMeta,
+    AstrocartographyRequest,
+    BatchChartItem,
+    BatchChartRequest,
+    BatchChartResponse,
+    BatchMeta,
     CalculationResponse,
     ChartRequest,
+    EphemerisSeriesRequest,
+    EventItem,
+    EventSearchRequest,
+    EventSearchResponse,
+    HouseSignChange,
     HousesRequest,
     HousesResponse,
+    HousesSweepRequest,
+    HousesSweepResponse,
     PlanetPosition,
+    Precision,
+    TimeResolveBatchItem,
+    TimeResolveBatchMeta,
+    TimeResolveBatchRequest,
+    TimeResolveBatchResponse,
     TimeResolveRequest,
     TimeResolveResponse,
     Zodiac,
+    ZodiacSign,
+)
+from precession import (
+    ecliptic_matrix,
+    ecliptic_matrix_rate,
+    precession_matrices,
+    spherical_from_rotation,
+    to_ecliptic_of_date,
 )
+from rectification import sweep_houses
+from result_cache import ResultCache, chart_cache_key, houses_cache_key, time_cache_key
+from shared_cache import SharedCache
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.middleware import SlowAPIMiddleware
 from slowapi.util import get_remote_address
+from spice_pool import (
+    SpiceCallTimeout,
+    SpicePool,
+    SpicePoolBusy,
+    SpiceWorkerError,
+    get_pool,
+    set_pool,
+)
+from spiceypy.utils.exceptions import SpiceyError
+from telemetry import Telemetry, quantile
 from time_resolution import (
     get_historical_timezone,
+    get_historical_timezones,
+    localize_datetimes,
 )
 from time_resolution import (
     localize_datetime_with_dst_handling as _localize_datetime_with_dst_handling,
@@ -52,6 +118,26 @@ from time_resolution import (
 from time_resolution import (
     parse_local_datetime as _parse_local_datetime,
 )
+from time_resolution import (
+    subsystem_status as timezone_status,
+)
+from time_resolution import (
+    warm_up as warm_up_timezones,
+)
+from timing import (
+    begin_request,
+    count_spice_calls,
+    current_timings,
+    end_request,
+    run_timed,
+    stage,
+)
+
+# Resolve relative to the file so dev + container both work; SPICE_METAKERNEL selects a
+# variant, e.g. involution_trimmed.tm (served bodies only, see tools/build_trimmed_spk.py)
+METAKERNEL = str(
+    Path(__file__).resolve().parent / "kernels" / os.getenv("SPICE_METAKERNEL", "involution.tm")
+)
 
 # Contract Constants
 ECL_FRAME = "ECLIPDATE"
@@ -61,8 +147,36 @@ ABCORR = "LT+S"
 KERNEL_SET_TAG = "2024-Q3"
 SERVICE_VERSION = "2.0.0"
 
+# Longitude speed: "analytic" (spkcpo velocity) or "finite_difference" (t±12h fallback)
+SPEED_METHOD = os.getenv("SPEED_METHOD", "analytic")
+
+# SPICE worker processes per HTTP worker (0 = run SPICE in the serving process),
+# calls allowed to wait for a free worker, and per-call timeout in seconds
+SPICE_POOL_SIZE = int(os.getenv("SPICE_POOL_SIZE", "2"))
+SPICE_POOL_QUEUE = int(os.getenv("SPICE_POOL_QUEUE", "64"))
+SPICE_CALL_TIMEOUT = float(os.getenv("SPICE_CALL_TIMEOUT", "25"))
+
+# Chart result cache bounds: entries (0 disables) and approximate memory in MB
+RESULT_CACHE_SIZE = int(os.getenv("RESULT_CACHE_SIZE", "4096"))
+RESULT_CACHE_MAX_MB = float(os.getenv("RESULT_CACHE_MAX_MB", "32"))
+
+# Optional node-wide cache tier shared by all HTTP workers (SQLite WAL file; unset disables)
+SHARED_CACHE_PATH = os.getenv("SHARED_CACHE_PATH", "")
+SHARED_CACHE_MAX_MB = float(os.getenv("SHARED_CACHE_MAX_MB", "256"))
+
+# Directory for per-worker metric files so /metrics covers every worker (unset = per process)
+TELEMETRY_DIR = os.getenv("TELEMETRY_DIR", "")
+
+# Log level and the bound on records waiting for the background log writer
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+
+# Load GeoNames, timezonefinder and tz transition tables at startup instead of on the
+# first time-resolution request (each process, including SPICE pool workers)
+TIMEZONE_WARMUP = os.getenv("TIMEZONE_WARMUP", "0") == "1"
+
 # Zodiac signs for UI enrichment
-SIGNS = [
+SIGNS: list[ZodiacSign] = [
     "Aries",
     "Taurus",
     "Gemini",
@@ -79,73 +193,32 @@ SIGNS = [
 
 limiter = Limiter(key_func=get_remote_address)
 
-# Configure structured JSON logging
-logging.basicConfig(level=logging.INFO, format="%(message)s", handlers=[logging.StreamHandler()])
+# Structured JSON logging: handlers enqueue, a background thread encodes and writes
 logger = logging.getLogger(__name__)
-
-
-class MetricsCollector:
-    """Simple metrics collector for latency and error tracking"""
-
-    def __init__(self, max_samples: int = 1000):
-        self.latencies: deque[float] = deque(maxlen=max_samples)
-        self.errors: deque[float] = deque(maxlen=max_samples)  # Store timestamps
-        self.spkinsuffdata_errors: deque[float] = deque(maxlen=max_samples)
-
-    def record_latency(self, latency_ms: float) -> None:
-        """Record a latency measurement"""
-        self.latencies.append(latency_ms)
-
-    def record_error(self, error_msg: str) -> None:
-        """Record an error occurrence"""
-        current_time = time.time()
-        self.errors.append(current_time)
-
-        # Check for SPICE insufficient data errors
-        if "SPKINSUFFDATA" in error_msg or "insufficient data" in error_msg.lower():
-            self.spkinsuffdata_errors.append(current_time)
-
-    def get_latency_percentiles(self) -> dict[str, float]:
-        """Get p50 and p95 latency percentiles"""
-        if not self.latencies:
-            return {"p50": 0.0, "p95": 0.0, "count": 0}
-
-        sorted_latencies = sorted(self.latencies)
-        count = len(sorted_latencies)
-
-        p50_idx = int(count * 0.5)
-        p95_idx = int(count * 0.95)
-
-        return {
-            "p50": round(sorted_latencies[p50_idx], 2),
-            "p95": round(sorted_latencies[p95_idx], 2),
-            "count": count,
-        }
-
-    def get_error_rate(self, window_minutes: int = 5) -> dict[str, Any]:
-        """Get error rate over the last N minutes"""
-        current_time = time.time()
-        window_start = current_time - (window_minutes * 60)
-
-        recent_errors = [t for t in self.errors if t >= window_start]
-        recent_spk_errors = [t for t in self.spkinsuffdata_errors if t >= window_start]
-
-        # Total requests approximated from latency records + error records
-        total_requests = len([t for t in self.latencies if t >= window_start]) + len(recent_errors)
-
-        error_rate = len(recent_errors) / total_requests if total_requests > 0 else 0.0
-
-        return {
-            "error_rate": round(error_rate, 4),
-            "total_errors": len(recent_errors),
-            "spkinsuffdata_errors": len(recent_spk_errors),
-            "total_requests": total_requests,
-            "window_minutes": window_minutes,
-        }
-
-
-# Global metrics collector
-metrics = MetricsCollector()
+try:
+    _log_level = parse_level(LOG_LEVEL)
+except ValueError as e:
+    print(f"⚠ {e}; logging at INFO")
+    _log_level = logging.INFO
+log_pipeline = LogPipeline(logger, _log_level, LOG_QUEUE_SIZE)
+log_pipeline.start()
+
+
+# Counters/histograms for /metrics, summed across workers via TELEMETRY_DIR
+telemetry = Telemetry(TELEMETRY_DIR or None)
+
+# Operational endpoints: exported to Prometheus but kept out of the JSON /metrics summary
+OPS_ENDPOINTS = frozenset({"/health", "/metrics", "/metrics/prometheus", "/debug", "/info"})
+
+# Deterministic chart, house and time-resolution results, keyed on the canonical
+# request + kernel set (or tz database), optionally backed by the shared tier
+result_cache = ResultCache(
+    RESULT_CACHE_SIZE,
+    int(RESULT_CACHE_MAX_MB * 1024 * 1024),
+    SharedCache(SHARED_CACHE_PATH, int(SHARED_CACHE_MAX_MB * 1024 * 1024))
+    if SHARED_CACHE_PATH
+    else None,
+)
 
 
 def log_calculation(
@@ -157,14 +230,21 @@ def log_calculation(
     latency_ms: float,
     success: bool,
     error: str | None = None,
+    bodies: dict[str, float] | None = None,
+    level: int = logging.INFO,
 ) -> None:
-    """Log calculation details in structured JSON format and update metrics"""
-    # Update metrics
-    metrics.record_latency(latency_ms)
-    if not success and error:
-        metrics.record_error(error)
+    """Queue a structured calculation record (encoded off the request path) and update metrics
+
+    bodies carries per-body latencies so a chart produces one summary record.
+    """
+    # Check for SPICE insufficient data errors
+    if error and ("SPKINSUFFDATA" in error or "insufficient data" in error.lower()):
+        telemetry.record_spkinsuffdata()
 
-    log_entry = {
+    if not logger.isEnabledFor(level):
+        return
+
+    log_entry: dict[str, Any] = {
         "timestamp": time.time(),
         "event": "calculation",
         "target": target,
@@ -175,18 +255,100 @@ def log_calculation(
         "latency_ms": round(latency_ms, 2),
         "success": success,
     }
+    if bodies:
+        log_entry["bodies"] = {body: round(ms, 2) for body, ms in bodies.items()}
     if error:
         log_entry["error"] = error
 
-    logger.info(json.dumps(log_entry))
+    logger.log(level, log_entry)
+
+
+def _init_spice_worker() -> None:
+    """SPICE pool worker startup: load kernels and per-process caches once"""
+    spice.furnsh(METAKERNEL)
+    load_earth_model()
+    try:
+        load_fast_tables(KERNEL_SET_TAG)
+    except TABLE_LOAD_ERRORS as e:
+        print(f"⚠ Fast ephemeris tables unavailable in SPICE worker: {e}")
+    if TIMEZONE_WARMUP:
+        warm_up_timezones()
+
+
+T = TypeVar("T")
+
+
+async def _run_spice(fn: Callable[..., T], *args: Any) -> T:
+    """Run synchronous SPICE work in the worker pool, or inline when no pool is running"""
+    pool = get_pool()
+    if pool is None:
+        return fn(*args)
+    timings = current_timings()
+    if timings is None:
+        result: T = await pool.run(fn, *args)
+        return result
+
+    # Stages are timed in the worker; the rest of the round trip is queueing + IPC
+    start = time.perf_counter()
+    result, worker_timings, elapsed = await pool.run(run_timed, fn, *args)
+    timings.merge(worker_timings)
+    timings.add("pool", time.perf_counter() - start - elapsed)
+    return result
+
+
+# Set in the gunicorn master when preload_shared_state() ran before forking workers
+_preloaded = False
+
+
+def preload_shared_state() -> None:
+    """
+    Load immutable state once in the gunicorn master before workers fork (PRELOAD=1).
+
+    Workers share it copy-on-write instead of each building their own: the GeoNames
+    index, timezonefinder data (in memory, no open file handles), tz transition
+    tables, fast ephemeris tables, and the Earth model / kernel coverage windows.
+    CSPICE is loaded only to read coverage and cleared again: its kernel pool and
+    file handles are per process, so each worker furnishes kernels after fork.
+    """
+    global _preloaded
+    start = time.perf_counter()
+    warm_up_timezones(in_memory=True)
+
+    try:
+        fast = load_fast_tables(KERNEL_SET_TAG)
+        if fast is not None:
+            print(f"✓ Fast ephemeris tables preloaded: {len(fast.bodies)} bodies")
+    except TABLE_LOAD_ERRORS as e:
+        print(f"⚠ Fast ephemeris tables unavailable: {e}")
+
+    if os.path.exists(METAKERNEL):
+        try:
+            spice.furnsh(METAKERNEL)
+            log_kernel_coverage()
+            load_earth_model()
+        except (SpiceyError, OSError) as e:
+            # Workers load the kernels themselves and report the failure from lifespan
+            print(f"⚠ Kernel coverage not preloaded: {e}")
+        finally:
+            spice.kclear()
+
+    # Keep the garbage collector from touching (and so copying) preloaded objects
+    gc.freeze()
+    _preloaded = True
+    print(f"✓ Shared state preloaded in {time.perf_counter() - start:.2f}s")
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Startup
-    # Resolve relative to the file so dev + container both work
-    base = Path(__file__).resolve().parent
-    metakernel = str(base / "kernels" / "involution.tm")
+    if TIMEZONE_WARMUP and not _preloaded:
+        seconds = warm_up_timezones()
+        print(
+            "✓ Timezone subsystem warmed up: "
+            + ", ".join(f"{name} {secs:.3f}s" for name, secs in seconds.items())
+        )
+
+    metakernel = METAKERNEL
 
     if not os.path.exists(metakernel):
         print("WARNING: Metakernel not found. Download kernels first.")
@@ -203,8 +365,42 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         print(f"✓ SPICE initialized - Toolkit: {spice.tkvrsn('TOOLKIT')}")
         print(f"✓ Kernels loaded: {spice.ktotal('ALL')}")
 
-        # Log kernel coverage windows for supply chain verification
-        log_kernel_coverage()
+        if _preloaded and _earth_model is not None:
+            # Coverage, Earth model and fast tables came from the master (PRELOAD=1)
+            print("✓ Using preloaded coverage, Earth model and fast tables")
+        else:
+            # Log kernel coverage windows for supply chain verification
+            log_kernel_coverage()
+
+            # Earth figure + EOP coverage once, so per-body frame choice is an interval check
+            earth = load_earth_model()
+            for start, end in earth.itrf93_coverage:
+                print(
+                    f"✓ ITRF93 EOP coverage: {spice.et2utc(start, 'ISOC', 0)}"
+                    f" to {spice.et2utc(end, 'ISOC', 0)}"
+                )
+
+            # Optional fast tier: memory-mapped Chebyshev tables built offline
+            try:
+                fast = load_fast_tables(KERNEL_SET_TAG)
+                if fast is not None:
+                    print(f"✓ Fast ephemeris tables loaded: {len(fast.bodies)} bodies")
+                else:
+                    print("⚠ Fast ephemeris tables not built; precision=fast uses SPICE")
+            except TABLE_LOAD_ERRORS as e:
+                print(f"⚠ Fast ephemeris tables unavailable: {e}")
+
+        # SPICE work runs in worker processes so the event loop never blocks on CSPICE
+        if SPICE_POOL_SIZE > 0:
+            pool = SpicePool(
+                SPICE_POOL_SIZE, _init_spice_worker, SPICE_POOL_QUEUE, SPICE_CALL_TIMEOUT
+            )
+            try:
+                await pool.start()
+                set_pool(pool)
+                print(f"✓ SPICE worker pool started: {SPICE_POOL_SIZE} processes")
+            except (SpiceWorkerError, TimeoutError, OSError) as e:
+                print(f"⚠ SPICE worker pool unavailable, running SPICE inline: {e}")
 
         yield
 
@@ -213,6 +409,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         raise
     finally:
         # Shutdown cleanup
+        running_pool = get_pool()
+        if running_pool is not None:
+            running_pool.close()
+            set_pool(None)
+        if result_cache.shared is not None:
+            result_cache.shared.close()
+        reset_earth_model()
         try:
             spice.kclear()
             print("✓ SPICE kernels cleared")
@@ -267,15 +470,42 @@ app.add_middleware(
 )
 
 
+@app.middleware("http")
+async def record_request_metrics(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """Count and time every request by route template and outcome; add Server-Timing"""
+    start = time.perf_counter()
+    timings, token = begin_request()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        response.headers["Server-Timing"] = timings.server_timing(time.perf_counter() - start)
+        return response
+    finally:
+        end_request(token)
+        # Route templates keep label cardinality bounded; unmatched paths share one label
+        endpoint = getattr(request.scope.get("route"), "path", "other")
+        telemetry.record_request(
+            endpoint, status_code, time.perf_counter() - start, endpoint not in OPS_ENDPOINTS
+        )
+        for name, seconds in timings.stages.items():
+            telemetry.observe(
+                "spice_stage_duration_seconds", {"endpoint": endpoint, "stage": name}, seconds
+            )
+        if timings.spice_calls:
+            telemetry.inc("spice_calls_total", {"endpoint": endpoint}, timings.spice_calls)
+
+
 def _calculate_single_body_position(
     body_name: str,
     body_id: str,
-    et: float,
+    ctx: EpochContext,
     lat: float,
     lon: float,
     elev: float,
     zodiac: Zodiac,
-    ayanamsa_deg: float | None,
 ) -> PlanetPosition:
     """
     Calculate position for a single celestial body.
@@ -283,30 +513,57 @@ def _calculate_single_body_position(
     Args:
         body_name: Display name of the body (e.g., "Sun")
         body_id: SPICE body identifier (e.g., "SUN")
-        et: SPICE ephemeris time
+        ctx: Epoch context (ET, ayanamsa, ecliptic rotation) shared by the chart
         lat, lon, elev: Observer location
         zodiac: "tropical" or "sidereal"
-        ayanamsa_deg: Ayanamsa value in degrees (None for tropical)
 
     Returns:
         PlanetPosition with all calculated fields
     """
-    # Get topocentric position
-    pos_topo_j2000 = topocentric_vec_j2000(body_id, et, lat, lon, elev)
+    et = ctx.et
 
-    # Convert to ecliptic of date
-    ecl_pos = convert_to_ecliptic_of_date_spice(pos_topo_j2000, et)
+    # Get topocentric state (position + velocity) in one spkcpo call
+    with stage("observer"):
+        obs_frame, obs_pos = _observer_frame_and_position(et, lat, lon, elev)
+    with stage("spkcpo"):
+        state = _topocentric_state(body_id, et, obs_frame, obs_pos)
 
-    # Apply zodiac-specific longitude
-    tropical_lon = ecl_pos["longitude"]
-    out_lon = (tropical_lon - ayanamsa_deg) % 360 if zodiac == "sidereal" else tropical_lon
+    # Convert to ecliptic of date
+    with stage("ecliptic"):
+        ecl_pos = _ecliptic_from_rotation(state[:3], ctx.ecliptic_rotation)
 
     # Calculate speed (degrees/day)
     try:
-        speed = estimate_longitude_speed(body_id, et, lat, lon, elev)
+        with stage("speed"):
+            if SPEED_METHOD == "finite_difference":
+                speed = estimate_longitude_speed(body_id, et, lat, lon, elev)
+            else:
+                obs_vel = _observer_velocity_j2000(et, obs_frame, obs_pos)
+                speed = longitude_speed_from_state(
+                    state, et, obs_vel, ctx.ecliptic_rotation, ctx.ecliptic_rotation_rate
+                )
     except Exception:
         speed = None  # Continue without speed if calculation fails
 
+    ayanamsa_deg = ctx.ayanamsa_deg if zodiac == "sidereal" else None
+    return _planet_position(ecl_pos, zodiac, ayanamsa_deg, speed)
+
+
+def _planet_position(
+    ecl_pos: dict[str, float],
+    zodiac: Zodiac,
+    ayanamsa_deg: float | None,
+    speed: float | None,
+) -> PlanetPosition:
+    """Build the UI-ready PlanetPosition from a tropical ecliptic-of-date position"""
+    # Apply zodiac-specific longitude
+    tropical_lon = ecl_pos["longitude"]
+    out_lon = (
+        (tropical_lon - ayanamsa_deg) % 360
+        if zodiac == "sidereal" and ayanamsa_deg is not None
+        else tropical_lon
+    )
+
     # Generate UI-ready fields
     sign, degree_in_sign = zodiac_from_longitude(out_lon)
     D, M, S = dms_from_degrees(degree_in_sign)
@@ -325,6 +582,108 @@ def _calculate_single_body_position(
     )
 
 
+def _fast_tables_for(chart: ChartRequest, et: float) -> ChebyshevTables | None:
+    """Tables to use for a fast-tier chart, or None to fall back to the research path"""
+    if chart.precision != "fast":
+        return None
+    tables = get_fast_tables()
+    if tables is None or not tables.covers(et):
+        return None
+    if not all(tables.has_body(name) for name in chart.bodies):
+        return None
+    return tables
+
+
+def _fast_tables_debug() -> dict[str, Any]:
+    """Fast-tier status for /debug: coverage and builder-measured max error per body"""
+    tables = get_fast_tables()
+    if tables is None:
+        return {"loaded": False}
+    return {
+        "loaded": True,
+        "start_utc": tables.index.get("start_utc"),
+        "end_utc": tables.index.get("end_utc"),
+        "kernel_set_tag": tables.index.get("kernel_set_tag"),
+        "max_error": tables.max_error(),
+    }
+
+
+def _fast_chart_positions(
+    tables: ChebyshevTables,
+    chart: ChartRequest,
+    et: float,
+    jd_ut: float,
+    ayanamsa_deg: float | None,
+) -> dict[str, PlanetPosition]:
+    """All requested bodies from the Chebyshev tables, shifted to the observer"""
+    lon, lat, dist, speed = topocentric_positions(
+        tables, chart.bodies, et, jd_ut, chart.latitude, chart.longitude, chart.elevation
+    )
+    return {
+        name: _planet_position(
+            {"longitude": float(lon[i]), "latitude": float(lat[i]), "distance": float(dist[i])},
+            chart.zodiac,
+            ayanamsa_deg,
+            float(speed[i]),
+        )
+        for i, name in enumerate(chart.bodies)
+    }
+
+
+@dataclass(frozen=True)
+class ChartPositions:
+    """Result of the SPICE part of /calculate (picklable for the worker pool)"""
+
+    data: dict[str, PlanetPosition]
+    et: float
+    ayanamsa_deg: float | None
+    precision: Precision
+    body_latency_ms: tuple[tuple[str, float], ...]  # (body_id, ms) on the research path
+
+
+def _epoch_context(birth_time: datetime, ayanamsa: str) -> EpochContext:
+    """Epoch context for a UTC birth time, built once and shared by planets and houses"""
+    with stage("epoch"):
+        return epoch_context(
+            birth_time.isoformat().replace("+00:00", "Z"), ayanamsa, calculate_ayanamsa
+        )
+
+
+def _chart_positions_sync(
+    chart: ChartRequest, ctx: EpochContext | None = None
+) -> ChartPositions:
+    """All requested bodies for one chart (runs in a SPICE worker when the pool is on)"""
+    if ctx is None:
+        ctx = _epoch_context(chart.birth_time, chart.ayanamsa)
+    et = ctx.et
+    ayanamsa_deg = ctx.ayanamsa_deg if chart.zodiac == "sidereal" else None
+
+    fast_tables = _fast_tables_for(chart, et)
+    if fast_tables is not None:
+        with stage("fast_tables"):
+            data = _fast_chart_positions(fast_tables, chart, et, ctx.jd_ut, ayanamsa_deg)
+        return ChartPositions(data, et, ayanamsa_deg, "fast", ())
+
+    data = {}
+    timings = []
+    for name in chart.bodies:
+        body_start_time = time.time()
+        body_id = AVAILABLE_BODIES[name]
+
+        data[name] = _calculate_single_body_position(
+            name,
+            body_id,
+            ctx,
+            chart.latitude,
+            chart.longitude,
+            chart.elevation,
+            chart.zodiac,
+        )
+        timings.append((body_id, (time.time() - body_start_time) * 1000))
+
+    return ChartPositions(data, et, ayanamsa_deg, "research", tuple(timings))
+
+
 @limiter.limit("10/minute")
 @app.post("/calculate", response_model=CalculationResponse)
 async def calculate_planetary_positions(
@@ -334,86 +693,91 @@ async def calculate_planetary_positions(
 
     IMPORTANT: This function only READS from SPICE state.
     No furnsh/kclear calls are made during request processing.
+    SPICE work runs in the worker pool (see spice_pool.py) when it is enabled.
     """
     start_time = time.time()
-    et = None
-    frame = ECL_FRAME
-    abcorr = ABCORR
-
     try:
-        # Convert to SPICE ET from ISO Z (always UTC now)
-        et = spice.str2et(chart.birth_time.isoformat().replace("+00:00", "Z"))
-
-        # Calculate ayanamsa once if needed
-        ayanamsa_deg = (
-            calculate_ayanamsa(chart.ayanamsa, et) if chart.zodiac == "sidereal" else None
-        )
+        cache_key = chart_cache_key(chart, KERNEL_SET_TAG, SERVICE_VERSION, SPEED_METHOD)
+        with stage("cache"):
+            positions: ChartPositions | None = await result_cache.get_async(cache_key)
+        if positions is None:
+            positions = await _run_spice(_chart_positions_sync, chart)
+            with stage("cache"):
+                await result_cache.put_async(cache_key, replace(positions, body_latency_ms=()))
+        return _calculation_response(chart, positions, start_time)
+    except Exception as e:
+        _calculation_failed(chart, e, start_time)
 
-        # Calculate positions for all requested bodies
-        results = {}
-        for name in chart.bodies:
-            body_start_time = time.time()
-            body_id = AVAILABLE_BODIES[name]
-
-            results[name] = _calculate_single_body_position(
-                name,
-                body_id,
-                et,
-                chart.latitude,
-                chart.longitude,
-                chart.elevation,
-                chart.zodiac,
-                ayanamsa_deg,
-            )
 
-            # Log individual body calculation
-            body_latency_ms = (time.time() - body_start_time) * 1000
-            log_calculation(body_id, et, frame, abcorr, chart.ayanamsa, body_latency_ms, True)
+def _calculation_response(
+    chart: ChartRequest, positions: ChartPositions, start_time: float
+) -> CalculationResponse:
+    """Log and record metrics for computed (or cached) positions and build the response"""
+    et = positions.et
+    ayanamsa_deg = positions.ayanamsa_deg
 
-        # Log overall request
-        total_latency_ms = (time.time() - start_time) * 1000
+    # Per-body latencies go to the histogram; individual records only at DEBUG
+    for body_id, body_latency_ms in positions.body_latency_ms:
+        telemetry.observe("spice_body_duration_seconds", {"body": body_id}, body_latency_ms / 1000)
         log_calculation(
-            "ALL_BODIES",
-            et or 0,
-            frame,
-            abcorr,
-            chart.ayanamsa if chart.zodiac == "sidereal" else "tropical",
-            total_latency_ms,
+            body_id,
+            et,
+            ECL_FRAME,
+            ABCORR,
+            chart.ayanamsa,
+            body_latency_ms,
             True,
+            level=logging.DEBUG,
         )
 
-        # Create meta information
-        meta = ApiMeta(
-            service_version=SERVICE_VERSION,
-            spice_version=spice.tkvrsn("TOOLKIT"),
-            kernel_set_tag=KERNEL_SET_TAG,
-            ecliptic_frame=ECL_FRAME,
-            zodiac=chart.zodiac,
-            ayanamsa_deg=round(ayanamsa_deg, 6) if ayanamsa_deg is not None else None,
-            request_id=str(uuid.uuid4()),
-            timestamp=time.time(),
-        )
+    # One summary record per request
+    total_latency_ms = (time.time() - start_time) * 1000
+    log_calculation(
+        "ALL_BODIES",
+        et or 0,
+        ECL_FRAME,
+        ABCORR,
+        chart.ayanamsa if chart.zodiac == "sidereal" else "tropical",
+        total_latency_ms,
+        True,
+        bodies=dict(positions.body_latency_ms),
+    )
 
-        return CalculationResponse(data=results, meta=meta)
+    # Create meta information
+    meta = ApiMeta(
+        service_version=SERVICE_VERSION,
+        spice_version=spice.tkvrsn("TOOLKIT"),
+        kernel_set_tag=KERNEL_SET_TAG,
+        ecliptic_frame=ECL_FRAME,
+        zodiac=chart.zodiac,
+        ayanamsa_deg=round(ayanamsa_deg, 6) if ayanamsa_deg is not None else None,
+        precision=positions.precision,
+        request_id=str(uuid.uuid4()),
+        timestamp=time.time(),
+    )
 
-    except Exception as e:
-        # Log error with timing info
-        error_latency_ms = (time.time() - start_time) * 1000
-        log_calculation(
-            "ERROR",
-            et or 0,
-            frame,
-            abcorr,
-            chart.ayanamsa if chart.zodiac == "sidereal" else "tropical",
-            error_latency_ms,
-            False,
-            str(e),
-        )
+    return CalculationResponse(data=positions.data, meta=meta)
+
+
+def _calculation_failed(chart: ChartRequest, e: Exception, start_time: float) -> NoReturn:
+    """Log a failed position calculation and raise the mapped HTTP error"""
+    # Log error with timing info
+    error_latency_ms = (time.time() - start_time) * 1000
+    log_calculation(
+        "ERROR",
+        0,
+        ECL_FRAME,
+        ABCORR,
+        chart.ayanamsa if chart.zodiac == "sidereal" else "tropical",
+        error_latency_ms,
+        False,
+        str(e),
+    )
 
-        # Map error to user-friendly message
-        status_code, detail = map_error(e)
-        print(f"Calculation error: {e}")
-        raise HTTPException(status_code=status_code, detail=detail)
+    # Map error to user-friendly message
+    status_code, detail = map_error(e)
+    print(f"Calculation error: {e}")
+    raise HTTPException(status_code=status_code, detail=detail)
 
 
 def _observer_pos_in_iau_earth(lat_deg: float, lon_deg: float, elev_m: float) -> np.ndarray:
@@ -425,63 +789,167 @@ def _observer_pos_in_iau_earth(lat_deg: float, lon_deg: float, elev_m: float) ->
     lon = np.radians(lon_deg)
     alt = elev_m / 1000.0
     # Geodetic → rectangular in body-fixed
+    count_spice_calls()
     x, y, z = spice.georec(lon, lat, alt, re, f)
     return np.array([x, y, z])
 
 
-def topocentric_vec_j2000(
-    target: str, et: float, lat_deg: float, lon_deg: float, elev_m: float
-) -> Any:
-    """Calculate topocentric position using spkcpo for proper LT+S corrections"""
-    # Choose observer frame dynamically based on EOP coverage
-    obs_frame = "ITRF93"
-    try:
-        # Test if ITRF93 transform exists at this epoch (requires EOP data)
-        spice.pxform("ITRF93", "J2000", et)
+# NAIF frame class ID of ITRF93 in binary Earth PCKs (earth_latest_high_prec.bpc)
+ITRF93_CLASS_ID = 3000
 
-        # Earth figure from SPICE for ITRF93
-        _, radii = spice.bodvrd("EARTH", "RADII", 3)
-        re, rp = radii[0], radii[2]
-        f = (re - rp) / re
 
-        lon = np.radians(lon_deg)
-        lat = np.radians(lat_deg)
-        alt_km = elev_m / 1000.0
+@dataclass(frozen=True)
+class EarthModel:
+    """Earth figure and ITRF93 (EOP) coverage, read once from the loaded kernels"""
 
-        # Observer position in ITRF93
-        obs_pos = spice.georec(lon, lat, alt_km, re, f)
+    radii_km: tuple[float, float, float]
+    itrf93_coverage: tuple[tuple[float, float], ...]
+
+    @property
+    def flattening(self) -> float:
+        re, rp = self.radii_km[0], self.radii_km[2]
+        return (re - rp) / re
+
+    def has_eop(self, et: float) -> bool:
+        """True if ITRF93 orientation data covers this ET"""
+        return any(start <= et <= end for start, end in self.itrf93_coverage)
 
-    except Exception:
-        # Fallback for historical dates (e.g., 1962): use IAU_EARTH body-fixed frame
-        obs_frame = "IAU_EARTH"
-        obs_pos = _observer_pos_in_iau_earth(lat_deg, lon_deg, elev_m)
 
-    # Use spkcpo with the chosen frame
+_earth_model: EarthModel | None = None
+
+
+def load_earth_model() -> EarthModel:
+    """Read Earth radii and ITRF93 coverage of every loaded binary PCK (startup only)"""
+    global _earth_model
+
+    _, radii = spice.bodvrd("EARTH", "RADII", 3)
+
+    windows: list[tuple[float, float]] = []
+    for i in range(spice.ktotal("PCK")):
+        fn, *_ = spice.kdata(i, "PCK")
+        cell = spice.cell_double(2000)
+        spice.pckcov(fn, ITRF93_CLASS_ID, cell)
+        for j in range(spice.wncard(cell)):
+            start, end = spice.wnfetd(cell, j)
+            windows.append((float(start), float(end)))
+
+    _earth_model = EarthModel(
+        radii_km=(float(radii[0]), float(radii[1]), float(radii[2])),
+        itrf93_coverage=tuple(sorted(windows)),
+    )
+    _observer_position.cache_clear()
+    _observer_velocity_j2000.cache_clear()
+    return _earth_model
+
+
+def reset_earth_model() -> None:
+    """Forget cached Earth state (kernels are about to be cleared)"""
+    global _earth_model
+    _earth_model = None
+    _observer_position.cache_clear()
+    _observer_velocity_j2000.cache_clear()
+
+
+def get_earth_model() -> EarthModel:
+    """Cached Earth model; loaded lazily when lifespan did not run (CLI tools, scripts)"""
+    return _earth_model if _earth_model is not None else load_earth_model()
+
+
+def _observer_frame(et: float) -> str:
+    """Choose observer frame based on EOP coverage (ITRF93 inside it, IAU_EARTH outside)"""
+    # Fallback for historical dates (e.g., 1962): use IAU_EARTH body-fixed frame
+    return "ITRF93" if get_earth_model().has_eop(et) else "IAU_EARTH"
+
+
+@lru_cache(maxsize=4096)
+def _observer_position(
+    obs_frame: str, lat_deg: float, lon_deg: float, elev_m: float
+) -> tuple[float, float, float]:
+    """Observer vector (km) in the chosen body-fixed frame, memoized per location"""
+    if obs_frame != "ITRF93":
+        x, y, z = _observer_pos_in_iau_earth(lat_deg, lon_deg, elev_m)
+        return float(x), float(y), float(z)
+
+    # Earth figure from SPICE for ITRF93 (cached at startup)
+    earth = get_earth_model()
+    re, f = earth.radii_km[0], earth.flattening
+
+    lon = np.radians(lon_deg)
+    lat = np.radians(lat_deg)
+    alt_km = elev_m / 1000.0
+
+    # Observer position in ITRF93
+    count_spice_calls()
+    x, y, z = spice.georec(lon, lat, alt_km, re, f)
+    return float(x), float(y), float(z)
+
+
+def _observer_frame_and_position(
+    et: float, lat_deg: float, lon_deg: float, elev_m: float
+) -> tuple[str, Any]:
+    """Pick the observer body-fixed frame for this epoch and the observer vector in it (km)"""
+    obs_frame = _observer_frame(et)
+    return obs_frame, _observer_position(obs_frame, lat_deg, lon_deg, elev_m)
+
+
+def _topocentric_state(target: str, et: float, obs_frame: str, obs_pos: Any) -> Any:
+    """spkcpo LT+S state of target (J2000, km and km/s) for an already-resolved observer"""
+    count_spice_calls()
     state, _ = spice.spkcpo(target, et, "J2000", "OBSERVER", "LT+S", obs_pos, "EARTH", obs_frame)
-    pos_j2000 = state[:3]
+    return state
+
 
-    return pos_j2000
+def _topocentric_from_observer(target: str, et: float, obs_frame: str, obs_pos: Any) -> Any:
+    """spkcpo LT+S position of target (J2000, km) for an already-resolved observer"""
+    return _topocentric_state(target, et, obs_frame, obs_pos)[:3]
+
+
+@lru_cache(maxsize=1024)
+def _observer_velocity_j2000(
+    et: float, obs_frame: str, obs_pos: tuple[float, float, float]
+) -> np.ndarray:
+    """Inertial (J2000) velocity of a body-fixed observer due to Earth rotation (km/s)
+
+    Memoized so all bodies of one chart share a single sxform call.
+    """
+    count_spice_calls()
+    xform = spice.sxform(obs_frame, "J2000", et)
+    vel = np.asarray(xform @ np.concatenate([np.asarray(obs_pos), np.zeros(3)]))[3:]
+    vel.flags.writeable = False
+    return vel
+
+
+def topocentric_vec_j2000(
+    target: str, et: float, lat_deg: float, lon_deg: float, elev_m: float
+) -> Any:
+    """Calculate topocentric position using spkcpo for proper LT+S corrections"""
+    obs_frame, obs_pos = _observer_frame_and_position(et, lat_deg, lon_deg, elev_m)
+    return _topocentric_from_observer(target, et, obs_frame, obs_pos)
+
+
+def precession_matrix_iau2006(T: float) -> np.ndarray:
+    """Precession matrix from J2000.0 to mean equator of date (T centuries since J2000)"""
+    return precession_matrices(T)
 
 
 def apply_precession_iau2006(pos_j2000: np.ndarray, T: float) -> np.ndarray:
     """Apply IAU 2006/2000A precession from J2000.0 to date (T centuries since J2000)"""
-    # IAU 2006 precession angles (arcseconds, converted to radians)
-    zeta_A = np.radians((2306.2181 * T + 0.30188 * T**2 + 0.017998 * T**3) / 3600.0)
-    z_A = np.radians((2306.2181 * T + 1.09468 * T**2 + 0.018203 * T**3) / 3600.0)
-    theta_A = np.radians((2004.3109 * T - 0.42665 * T**2 - 0.041833 * T**3) / 3600.0)
+    return precession_matrix_iau2006(T) @ pos_j2000
 
-    # Rotation matrices - corrected order and signs
-    cos_zeta, sin_zeta = np.cos(-zeta_A), np.sin(-zeta_A)
-    cos_z, sin_z = np.cos(-z_A), np.sin(-z_A)
-    cos_theta, sin_theta = np.cos(theta_A), np.sin(theta_A)
 
-    # P = R3(-z_A) * R2(theta_A) * R3(-zeta_A) applied to J2000 coordinates
-    R1 = np.array([[cos_zeta, sin_zeta, 0], [-sin_zeta, cos_zeta, 0], [0, 0, 1]])  # R3(-zeta_A)
-    R2 = np.array([[cos_theta, 0, -sin_theta], [0, 1, 0], [sin_theta, 0, cos_theta]])  # R2(theta_A)
-    R3 = np.array([[cos_z, sin_z, 0], [-sin_z, cos_z, 0], [0, 0, 1]])  # R3(-z_A)
+def ecliptic_of_date_matrix(et: float) -> np.ndarray:
+    """
+    Rotation from J2000 equatorial to ecliptic of date at ET (memoized per epoch):
+    1) J2000 equatorial → mean equatorial of date (precession)
+    2) Mean equatorial of date → ecliptic of date (obliquity rotation)
+    """
+    return ecliptic_matrix(et)
+
 
-    P = R3 @ R2 @ R1
-    return P @ pos_j2000
+def _ecliptic_from_rotation(pos_j2000: np.ndarray, rotation: np.ndarray) -> dict[str, float]:
+    """Spherical ecliptic coordinates of a J2000 vector given a precomputed rotation"""
+    lon, lat, dist = spherical_from_rotation(np.atleast_2d(pos_j2000), rotation)
+    return {"longitude": float(lon[0]), "latitude": float(lat[0]), "distance": float(dist[0])}
 
 
 def convert_to_ecliptic_of_date_spice(pos_j2000: np.ndarray, et: float) -> dict[str, float]:
@@ -491,39 +959,7 @@ def convert_to_ecliptic_of_date_spice(pos_j2000: np.ndarray, et: float) -> dict[
     2) Mean equatorial of date → ecliptic of date (obliquity rotation)
     """
     try:
-        # Get Julian date and centuries since J2000.0
-        jd_tt = spice.j2000() + et / spice.spd()
-        T = (jd_tt - 2451545.0) / 36525.0
-
-        # 1) Normalize & precess J2000 → mean equator of date
-        r_km = np.linalg.norm(pos_j2000)
-        v = pos_j2000 / r_km
-        v_eq_date = apply_precession_iau2006(v, T)
-
-        # 2) IAU 1980 mean obliquity of the ecliptic
-        obliq_deg = 23.43929111 - (46.8150 * T + 0.00059 * T**2 - 0.001813 * T**3) / 3600.0
-        obliq_rad = np.radians(obliq_deg)
-
-        # Create rotation matrix from equatorial of date to ecliptic of date
-        cos_obliq = np.cos(obliq_rad)
-        sin_obliq = np.sin(obliq_rad)
-
-        rotation_matrix = np.array(
-            [[1.0, 0.0, 0.0], [0.0, cos_obliq, sin_obliq], [0.0, -sin_obliq, cos_obliq]]
-        )
-
-        # Transform to ecliptic of date
-        v_ecl_date = rotation_matrix @ v_eq_date
-
-        # Convert to spherical coordinates
-        lon_rad = np.arctan2(v_ecl_date[1], v_ecl_date[0])
-        lat_rad = np.arcsin(v_ecl_date[2])
-
-        return {
-            "longitude": (np.degrees(lon_rad) + 360.0) % 360.0,
-            "latitude": np.degrees(lat_rad),
-            "distance": r_km / 149597870.7,
-        }
+        return _ecliptic_from_rotation(pos_j2000, ecliptic_matrix(et))
     except Exception as e:
         raise RuntimeError(f"SPICE frame transformation failed: {e}")
 
@@ -547,7 +983,9 @@ def log_kernel_coverage() -> None:
             try:
                 # Get coverage windows for this body
                 cell = spice.cell_double(200)  # Create cell for coverage data
-                spice.spkcov("kernels/spk/planets/de440.bsp", int(spice.bodn2c(body_id)), cell)
+                for i in range(spice.ktotal("SPK")):
+                    spk_file = spice.kdata(i, "SPK")[0]
+                    spice.spkcov(spk_file, int(spice.bodn2c(body_id)), cell)
 
                 # Get coverage intervals
                 intervals = spice.wnfetd(cell, 0) if spice.wncard(cell) > 0 else (0, 0)
@@ -568,16 +1006,18 @@ def log_kernel_coverage() -> None:
         print(f"⚠ Kernel coverage logging failed: {e}")
 
 
-def calculate_ayanamsa(system: str, et: float) -> float:
-    """Calculate ayanamsa for given system"""
+def calculate_ayanamsa(system: str, et: FloatOrArray) -> FloatOrArray:
+    """Calculate ayanamsa for given system (elementwise for an array of ETs)"""
     jd_tt = spice.j2000() + et / spice.spd()
     T = (jd_tt - 2451545.0) / 36525.0
 
     if system == "lahiri":
-        ayanamsa = 23.85144
-        ayanamsa += (50.2876 * T * 100) / 3600
-        ayanamsa += 0.000464 * T * T
-        ayanamsa += -0.0000002 * T * T * T
+        ayanamsa = (
+            23.85144
+            + (50.2876 * T * 100) / 3600
+            + 0.000464 * T * T
+            + -0.0000002 * T * T * T
+        )
         return ayanamsa % 360
 
     elif system == "fagan_bradley":
@@ -614,8 +1054,56 @@ def retro_from_speed(speed_deg_per_day: float | None) -> bool | None:
     return speed_deg_per_day < 0
 
 
+def longitude_speed_from_state(
+    state: np.ndarray,
+    et: float,
+    obs_vel_j2000: np.ndarray | None = None,
+    rotation: np.ndarray | None = None,
+    rotation_rate: np.ndarray | None = None,
+) -> float:
+    """
+    Analytic longitudinal speed in degrees/day from an spkcpo J2000 state.
+
+    The velocity is rotated into the ecliptic of date, including the slow
+    rotation of the frame itself (precession), and the longitude rate is
+    taken from the planar angular momentum: dλ/dt = (x·vy − y·vx) / (x² + y²).
+
+    spkcpo velocities are relative to an observer turning with the Earth, which
+    adds a diurnal term of several degrees/day for the Moon. Passing the
+    observer's inertial velocity (obs_vel_j2000) removes it, so the result is
+    the daily-motion speed that the t±12h finite difference approximates.
+
+    Args:
+        state: 6-vector (km, km/s) of target relative to observer in J2000
+        et: SPICE ephemeris time of the state
+        obs_vel_j2000: Observer velocity in J2000 (km/s), or None to keep the diurnal term
+        rotation, rotation_rate: Ecliptic-of-date rotation at et and its derivative, when
+            the caller has them already (EpochContext); computed here otherwise
+
+    Returns:
+        Longitude speed in degrees/day
+    """
+    pos = np.asarray(state[:3], dtype=float)
+    vel = np.asarray(state[3:], dtype=float)
+    if obs_vel_j2000 is not None:
+        vel = vel + obs_vel_j2000
+
+    # Ecliptic-of-date rotation and its time derivative (precession rate)
+    rot = ecliptic_matrix(et) if rotation is None else rotation
+    rot_rate = ecliptic_matrix_rate(et) if rotation_rate is None else rotation_rate
+
+    r = rot @ pos
+    v = rot @ vel + rot_rate @ pos
+    lam_dot = (r[0] * v[1] - r[1] * v[0]) / (r[0] ** 2 + r[1] ** 2)  # rad/s
+    return float(np.degrees(lam_dot) * spice.spd())
+
+
 def estimate_longitude_speed(body_id: str, et: float, lat: float, lon: float, elev: float) -> float:
-    """Estimate longitudinal speed in degrees/day using numeric differentiation"""
+    """Estimate longitudinal speed in degrees/day using numeric differentiation
+
+    Fallback for SPEED_METHOD=finite_difference; the default path derives speed
+    analytically from the spkcpo velocity (see longitude_speed_from_state).
+    """
     # Sample at t-12h and t+12h (1 day window total)
     dt_seconds = 12 * 3600  # 12 hours in seconds
     et0 = et - dt_seconds
@@ -629,14 +1117,15 @@ def estimate_longitude_speed(body_id: str, et: float, lat: float, lon: float, el
     ecl0 = convert_to_ecliptic_of_date_spice(pos0, et0)
     ecl1 = convert_to_ecliptic_of_date_spice(pos1, et1)
 
-    # Calculate shortest angular distance (wrap-aware)
-    lon0, lon1 = ecl0["longitude"], ecl1["longitude"]
+    return _longitude_delta(ecl0["longitude"], ecl1["longitude"]) / 1.0
+
+
+def _longitude_delta(lon0: float, lon1: float) -> float:
+    """Shortest signed angular distance lon1 - lon0 in degrees (wrap-aware)"""
     d = _wrap360(lon1 - lon0)
     if d > 180.0:
         d -= 360.0
-
-    # degrees per day
-    return d / 1.0
+    return d
 
 
 # Aspect calculation
@@ -679,6 +1168,10 @@ def calc_aspects(positions: dict[str, PlanetPosition]) -> list[dict[str, Any]]:
 # Error mapping
 def map_error(e: Exception) -> tuple[int, str]:
     """Map SPICE errors to user-friendly HTTP errors"""
+    if isinstance(e, SpicePoolBusy):
+        return 503, "Server busy, please retry shortly"
+    if isinstance(e, SpiceCallTimeout):
+        return 504, "Calculation timed out"
     m = str(e)
     if (
         "SPKINSUFFDATA" in m
@@ -698,6 +1191,11 @@ def map_error(e: Exception) -> tuple[int, str]:
     return 500, "Calculation error occurred"
 
 
+# Errors map_error turns into HTTP responses: SPICE and worker pool failures, and
+# invalid input only detected during a calculation
+CALCULATION_ERRORS = (SpiceyError, SpicePoolBusy, SpiceCallTimeout, SpiceWorkerError, ValueError)
+
+
 @app.get("/health")
 async def health_check() -> dict[str, Any]:
     """Health check with frame validation"""
@@ -779,12 +1277,30 @@ async def get_version() -> dict[str, Any]:
 async def get_metrics() -> dict[str, Any]:
     """Observability endpoint with latency and error metrics"""
     try:
-        latency_stats = metrics.get_latency_percentiles()
-        error_stats = metrics.get_error_rate()
+        buckets = telemetry.histogram(
+            "spice_http_request_duration_seconds", exclude={"endpoint": OPS_ENDPOINTS}
+        )
+        latency_stats = {
+            "p50": round(quantile(0.5, buckets) * 1000, 2),
+            "p95": round(quantile(0.95, buckets) * 1000, 2),
+            "count": int(buckets[-1][1]),
+        }
+
+        window = telemetry.window()
+        requests = int(window["requests"])
+        errors = int(window["errors"])
+        error_stats = {
+            "error_rate": round(errors / requests, 4) if requests else 0.0,
+            "total_errors": errors,
+            "spkinsuffdata_errors": int(window["spkinsuffdata"]),
+            "total_requests": requests,
+            "window_minutes": telemetry.window_minutes,
+        }
 
         return {
             "latency": latency_stats,
             "errors": error_stats,
+            "cache": result_cache.stats(),
             "timestamp": time.time(),
             "alerts": {
                 "high_latency": latency_stats["p95"] > 2000,  # Alert if p95 > 2s
@@ -797,6 +1313,12 @@ async def get_metrics() -> dict[str, Any]:
         return {"error": str(e), "timestamp": time.time()}
 
 
+@app.get("/metrics/prometheus", response_class=PlainTextResponse)
+async def get_prometheus_metrics() -> PlainTextResponse:
+    """Counters and latency histograms in Prometheus text format, summed across workers"""
+    return PlainTextResponse(telemetry.render(), media_type="text/plain; version=0.0.4")
+
+
 @app.get("/debug")
 async def debug_info() -> dict[str, Any]:
     """Debug endpoint with detailed configuration info"""
@@ -822,7 +1344,16 @@ async def debug_info() -> dict[str, Any]:
             "coordinate_system": "ecliptic_of_date",
             "obliquity_formula": "IAU_1980",
             "topocentric_method": "spkcpo",
+            "speed_method": SPEED_METHOD,
             "earth_figure": "SPICE_bodvrd_georec",
+            "fast_ephemeris": _fast_tables_debug(),
+            "spice_pool": pool.stats() if (pool := get_pool()) else {"enabled": False},
+            "timezone": timezone_status(),
+            "log_queue": {
+                "level": logging.getLevelName(logger.level),
+                "pending": log_pipeline.queue.qsize(),
+                "dropped": log_pipeline.dropped,
+            },
         }
     except Exception as e:
         return {"error": str(e)}
@@ -876,15 +1407,39 @@ async def info() -> dict[str, Any]:
 @app.post("/houses", response_model=HousesResponse)
 async def houses(req: HousesRequest):
     """Calculate house cusps using Placidus, Whole Sign, or Equal house systems"""
+    cache_key = houses_cache_key(req, KERNEL_SET_TAG, SERVICE_VERSION)
+    with stage("cache"):
+        cached = await result_cache.get_async(cache_key)
+    if cached is not None:
+        return cached
+    try:
+        response = await _run_spice(_houses_sync, req)
+        with stage("cache"):
+            await result_cache.put_async(cache_key, response)
+        return response
+    except CALCULATION_ERRORS as e:
+        status_code, detail = map_error(e)
+        raise HTTPException(status_code=status_code, detail=detail) from e
+
+
+def _check_placidus_latitude(latitude: float) -> None:
+    if abs(latitude) > 66.5:
+        raise HTTPException(
+            status_code=422, detail="Placidus undefined above polar circles (|lat| > ~66.5°)"
+        )
+
+
+def _houses_sync(req: HousesRequest, ctx: EpochContext | None = None) -> HousesResponse:
+    """House cusps for one request (runs in a SPICE worker when the pool is on)"""
     # normalize to UTC
     if req.birth_time.tzinfo is None or req.birth_time.tzinfo.utcoffset(req.birth_time) is None:
         raise HTTPException(status_code=422, detail="birth_time must include timezone")
-    iso_z = req.birth_time.astimezone(UTC).isoformat().replace("+00:00", "Z")
+    if ctx is None:
+        ctx = _epoch_context(req.birth_time.astimezone(UTC), req.ayanamsa)
 
     # Get tropical and sidereal ASC/MC
-    asc_mc = _asc_mc_tropical_and_sidereal(
-        iso_z, req.latitude, req.longitude, req.ayanamsa, calculate_ayanamsa, req.mc_hemisphere
-    )
+    with stage("asc_mc"):
+        asc_mc = _asc_mc_tropical_and_sidereal(ctx, req.latitude, req.longitude, req.mc_hemisphere)
     ayanamsa_deg = asc_mc["ay"] if req.zodiac == "sidereal" else None
 
     # Choose final ASC/MC based on zodiac
@@ -899,19 +1454,11 @@ async def houses(req: HousesRequest):
         cusps = _equal_cusps(asc_mc["asc_tropical"], asc_mc["ay"], req.zodiac)
     else:
         # placidus
-        if abs(req.latitude) > 66.5:
-            raise HTTPException(
-                status_code=422, detail="Placidus undefined above polar circles (|lat| > ~66.5°)"
+        _check_placidus_latitude(req.latitude)
+        with stage("placidus"):
+            cusps = _placidus_cusps(
+                ctx, req.latitude, req.longitude, req.zodiac, req.mc_hemisphere, asc_mc
             )
-        cusps = _placidus_cusps(
-            iso_z,
-            req.latitude,
-            req.longitude,
-            req.ayanamsa,
-            calculate_ayanamsa,
-            req.zodiac,
-            req.mc_hemisphere,
-        )
 
     return HousesResponse(
         system=req.system,
@@ -927,15 +1474,20 @@ async def houses(req: HousesRequest):
     )
 
 
+def _chart_sync(
+    chart_req: ChartRequest, houses_req: HousesRequest
+) -> tuple[ChartPositions, HousesResponse]:
+    """Planets and houses for /v1/chart from one epoch context (one SPICE worker call)"""
+    ctx = _epoch_context(chart_req.birth_time, chart_req.ayanamsa)
+    return _chart_positions_sync(chart_req, ctx), _houses_sync(houses_req, ctx)
+
+
 @limiter.limit("10/minute")
 @app.post("/v1/chart")
 async def chart(request: Request, chart_req: ChartRequest):
     """Combined endpoint: planets + houses + aspects in one response"""
+    start_time = time.time()
     try:
-        # Calculate planets
-        planets_response = await calculate_planetary_positions(request, chart_req)
-
-        # Calculate houses
         houses_req = HousesRequest(
             birth_time=chart_req.birth_time,
             latitude=chart_req.latitude,
@@ -946,17 +1498,41 @@ async def chart(request: Request, chart_req: ChartRequest):
             system="placidus" if abs(chart_req.latitude) <= 66.5 else "whole-sign",
             mc_hemisphere="south",
         )
-        houses_response = await houses(houses_req)
 
-        # Calculate aspects
-        aspects = calc_aspects(planets_response.data)
+        # Planets and houses share the cache tiers of /calculate and /houses
+        positions_key = chart_cache_key(
+            chart_req, KERNEL_SET_TAG, SERVICE_VERSION, SPEED_METHOD
+        )
+        houses_key = houses_cache_key(houses_req, KERNEL_SET_TAG, SERVICE_VERSION)
+        with stage("cache"):
+            positions: ChartPositions | None = await result_cache.get_async(positions_key)
+            houses_response: HousesResponse | None = await result_cache.get_async(houses_key)
+        if positions is None or houses_response is None:
+            try:
+                computed = await _run_spice(_chart_sync, chart_req, houses_req)
+            except CALCULATION_ERRORS as e:
+                _calculation_failed(chart_req, e, start_time)
+            positions, houses_response = computed
+            with stage("cache"):
+                await result_cache.put_async(positions_key, replace(positions, body_latency_ms=()))
+                await result_cache.put_async(houses_key, houses_response)
+        planets_response = _calculation_response(chart_req, positions, start_time)
 
-        return {
-            "planets": planets_response.data,
-            "houses": houses_response,
-            "aspects": aspects,
-            "meta": planets_response.meta,
-        }
+        # Calculate aspects
+        with stage("aspects"):
+            aspects = calc_aspects(planets_response.data)
+
+        # Serialize here (as FastAPI would) so the cost shows up as its own stage
+        with stage("serialize"):
+            content = jsonable_encoder(
+                {
+                    "planets": planets_response.data,
+                    "houses": houses_response,
+                    "aspects": aspects,
+                    "meta": planets_response.meta,
+                }
+            )
+        return JSONResponse(content)
     except HTTPException:
         raise
     except Exception as e:
@@ -1020,7 +1596,460 @@ async def calculate_csv(request: Request, chart_req: ChartRequest):
         raise HTTPException(status_code=status_code, detail=detail)
 
 
+def _batch_sync(charts: list[ChartRequest]) -> list[ChartPositions | tuple[int, str]]:
+    """
+    /calculate positions for each chart, in input order (runs in a SPICE worker when
+    the pool is on). A chart that fails yields its mapped (status_code, detail).
+
+    Charts at the same instant and ayanamsa share one epoch context (str2et,
+    ayanamsa, precession rotation).
+    """
+    contexts: dict[tuple[datetime, str], EpochContext] = {}
+    results: list[ChartPositions | tuple[int, str]] = []
+    for chart in charts:
+        try:
+            ctx = contexts.get((chart.birth_time, chart.ayanamsa))
+            if ctx is None:
+                ctx = _epoch_context(chart.birth_time, chart.ayanamsa)
+                contexts[(chart.birth_time, chart.ayanamsa)] = ctx
+            results.append(_chart_positions_sync(chart, ctx))
+        except CALCULATION_ERRORS as e:
+            results.append(map_error(e))
+    return results
+
+
+def _batch_item(
+    index: int, chart: ChartRequest, result: ChartPositions | tuple[int, str]
+) -> BatchChartItem:
+    if isinstance(result, tuple):
+        status_code, detail = result
+        return BatchChartItem(
+            index=index, status_code=status_code, zodiac=chart.zodiac, error=detail
+        )
+    ayanamsa_deg = result.ayanamsa_deg
+    return BatchChartItem(
+        index=index,
+        zodiac=chart.zodiac,
+        ayanamsa_deg=round(ayanamsa_deg, 6) if ayanamsa_deg is not None else None,
+        precision=result.precision,
+        data=result.data,
+    )
+
+
+@limiter.limit("10/minute")
+@app.post("/v1/calculate/batch", response_model=BatchChartResponse)
+async def calculate_planetary_positions_batch(
+    request: Request, batch: BatchChartRequest
+) -> BatchChartResponse:
+    """Calculate many charts in one SPICE worker call
+
+    Each chart goes through the /calculate pipeline and result cache; the misses
+    are computed together, sharing one epoch context per instant. Results are
+    returned in input order; a failing chart yields an item with an error
+    instead of failing the whole batch.
+    """
+    start_time = time.time()
+    keys = [
+        chart_cache_key(c, KERNEL_SET_TAG, SERVICE_VERSION, SPEED_METHOD) for c in batch.charts
+    ]
+    results: dict[Hashable, ChartPositions | tuple[int, str]] = {}
+    missing: dict[Hashable, ChartRequest] = {}
+    with stage("cache"):
+        for key, chart in zip(keys, batch.charts, strict=True):
+            if key in results or key in missing:
+                continue
+            cached = await result_cache.get_async(key)
+            if cached is None:
+                missing[key] = chart
+            else:
+                results[key] = cached
+
+    if missing:
+        try:
+            computed = await _run_spice(_batch_sync, list(missing.values()))
+        except CALCULATION_ERRORS as e:
+            status_code, detail = map_error(e)
+            raise HTTPException(status_code=status_code, detail=detail) from e
+        with stage("cache"):
+            for key, result in zip(missing, computed, strict=True):
+                if isinstance(result, ChartPositions):
+                    await result_cache.put_async(key, replace(result, body_latency_ms=()))
+                results[key] = result
+
+    items = [
+        _batch_item(i, chart, results[key])
+        for i, (chart, key) in enumerate(zip(batch.charts, keys, strict=True))
+    ]
+    failed = sum(1 for r in items if r.error is not None)
+
+    # One summary record per batch rather than one per body
+    log_calculation(
+        "BATCH",
+        0,
+        ECL_FRAME,
+        ABCORR,
+        "mixed",
+        (time.time() - start_time) * 1000,
+        failed == 0,
+        f"{failed}/{len(items)} charts failed" if failed else None,
+    )
+
+    meta = BatchMeta(
+        service_version=SERVICE_VERSION,
+        spice_version=spice.tkvrsn("TOOLKIT"),
+        kernel_set_tag=KERNEL_SET_TAG,
+        ecliptic_frame=ECL_FRAME,
+        count=len(items),
+        failed=failed,
+        request_id=str(uuid.uuid4()),
+        timestamp=time.time(),
+    )
+    return BatchChartResponse(results=items, meta=meta)
+
+
+# Rows evaluated per chunk of a time series; bounds memory and event-loop hold time
+SERIES_CHUNK_SIZE = 512
+
+
+def _series_chunk_rows(req: EphemerisSeriesRequest, times: list[datetime]) -> list[dict[str, Any]]:
+    """Evaluate one chunk of a time series and return its NDJSON-ready rows"""
+    iso = [t.isoformat().replace("+00:00", "Z") for t in times]
+    ets = np.asarray(spice.str2et(iso), dtype=float)
+
+    # spkcpo has no array form; frame choice and observer vector are memoized lookups
+    observers = [
+        _observer_frame_and_position(float(et), req.latitude, req.longitude, req.elevation)
+        for et in ets
+    ]
+
+    columns: dict[str, tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+    for name in req.bodies:
+        body_id = AVAILABLE_BODIES[name]
+        pos = np.array(
+            [
+                _topocentric_from_observer(body_id, float(et), obs_frame, obs_pos)
+                for et, (obs_frame, obs_pos) in zip(ets, observers, strict=True)
+            ]
+        )
+        columns[name] = to_ecliptic_of_date(pos, ets)
+
+    ayanamsas = calculate_ayanamsa(req.ayanamsa, ets) if req.zodiac == "sidereal" else None
+
+    rows = []
+    for i, (utc, et) in enumerate(zip(iso, ets, strict=True)):
+        ay = float(ayanamsas[i]) if ayanamsas is not None else None
+        bodies = {}
+        for name, (lon, lat, dist) in columns.items():
+            out_lon = (lon[i] - ay) % 360 if ay is not None else lon[i]
+            bodies[name] = {
+                "longitude": round(float(out_lon), 6),
+                "latitude": round(float(lat[i]), 6),
+                "distance": round(float(dist[i]), 8),
+            }
+        rows.append(
+            {
+                "time": utc,
+                "et": float(et),
+                "ayanamsa_deg": round(ay, 6) if ay is not None else None,
+                "bodies": bodies,
+            }
+        )
+    return rows
+
+
+async def _series_ndjson(req: EphemerisSeriesRequest) -> AsyncIterator[str]:
+    """Stream a time series chunk by chunk so memory stays flat for long ranges"""
+    step = timedelta(seconds=req.step_seconds)
+    total = req.point_count()
+
+    for offset in range(0, total, SERIES_CHUNK_SIZE):
+        stop = min(offset + SERIES_CHUNK_SIZE, total)
+        times = [req.start + step * k for k in range(offset, stop)]
+        try:
+            rows = await _run_spice(_series_chunk_rows, req, times)
+        except CALCULATION_ERRORS as e:
+            # Headers are already sent; report the failure in-band and stop
+            status_code, detail = map_error(e)
+            yield json.dumps({"error": detail, "status_code": status_code}) + "\n"
+            return
+
+        yield "".join(json.dumps(row) + "\n" for row in rows)
+        # Let other requests on this worker run between chunks (inline mode)
+        await asyncio.sleep(0)
+
+
+@limiter.limit("10/minute")
+@app.post("/v1/ephemeris/series")
+async def ephemeris_series(request: Request, req: EphemerisSeriesRequest) -> StreamingResponse:
+    """Stream body positions over a date range at a fixed step as NDJSON
+
+    Each line is one sample instant: {"time", "et", "ayanamsa_deg", "bodies"}.
+    Epochs are evaluated in chunks with vectorized precession; rows are emitted
+    as each chunk completes.
+    """
+    try:
+        # Validate both ends up front so range errors surface as HTTP errors
+        await _run_spice(_series_chunk_rows, req, [req.start, req.end])
+    except CALCULATION_ERRORS as e:
+        status_code, detail = map_error(e)
+        raise HTTPException(status_code=status_code, detail=detail)
+
+    return StreamingResponse(_series_ndjson(req), media_type="application/x-ndjson")
+
+
+def _houses_sweep_sync(req: HousesSweepRequest) -> HousesSweepResponse:
+    """Vectorized houses over the sweep window (runs in a SPICE worker when the pool is on)"""
+    sweep = sweep_houses(req, calculate_ayanamsa)
+    sidereal = req.zodiac == "sidereal"
+    return HousesSweepResponse(
+        system=req.system,
+        frame=ECL_FRAME,
+        coordinate_system=COORD_SYSTEM,
+        ecliptic_model=OBLIQUITY_MODEL,
+        zodiac=req.zodiac,
+        ayanamsa=req.ayanamsa if sidereal else None,
+        ayanamsa_deg=round(float(sweep.ayanamsa_deg[0]), 6) if sidereal else None,
+        start=req.start.isoformat().replace("+00:00", "Z"),
+        step_seconds=req.step_seconds,
+        count=len(sweep.offsets_s),
+        asc=np.round(sweep.asc, 6).tolist(),
+        mc=np.round(sweep.mc, 6).tolist(),
+        cusps=np.round(sweep.cusps.T, 6).tolist(),
+        sign_changes=[
+            HouseSignChange(
+                angle=c.angle,
+                time=(req.start + timedelta(seconds=c.offset_s))
+                .isoformat(timespec="milliseconds")
+                .replace("+00:00", "Z"),
+                from_sign=SIGNS[c.from_sign],
+                to_sign=SIGNS[c.to_sign],
+            )
+            for c in sweep.sign_changes
+        ],
+    )
+
+
+@limiter.limit("10/minute")
+@app.post("/v1/houses/sweep", response_model=HousesSweepResponse)
+async def houses_sweep(request: Request, req: HousesSweepRequest) -> HousesSweepResponse:
+    """ASC, MC and cusps at every step of a time window, for birth-time rectification
+
+    All steps are evaluated at once with array math and returned as columns
+    (index i is start + i * step_seconds), together with the instants, to the
+    millisecond, at which ASC or MC changes sign.
+    """
+    if req.system == "placidus":
+        _check_placidus_latitude(req.latitude)
+    try:
+        return await _run_spice(_houses_sweep_sync, req)
+    except CALCULATION_ERRORS as e:
+        status_code, detail = map_error(e)
+        raise HTTPException(status_code=status_code, detail=detail) from e
+
+
+# Latitude rows of ASC/DSC lines solved per streamed chunk (all bodies at once)
+ASTROCARTOGRAPHY_CHUNK_ROWS = 2048
+
+
+def _astrocartography_sync(
+    req: AstrocartographyRequest,
+) -> tuple[float, float, np.ndarray, np.ndarray, np.ndarray]:
+    """GMST, ayanamsa and geocentric longitude/RA/Dec of date per body at the instant"""
+    ctx = _epoch_context(req.birth_time, req.ayanamsa)
+    positions = []
+    for name in req.bodies:
+        count_spice_calls()
+        pos, _ = spice.spkpos(AVAILABLE_BODIES[name], ctx.et, "J2000", ABCORR, "EARTH")
+        positions.append(pos)
+    lon, lat, _ = spherical_from_rotation(np.array(positions), ctx.ecliptic_rotation)
+    ra, dec = equatorial_from_ecliptic(lon, lat, ctx.eps_deg)
+    return ctx.gmst_deg, ctx.ayanamsa_deg, lon, ra, dec
+
+
+async def _astrocartography_geojson(
+    req: AstrocartographyRequest,
+    gmst_deg: float,
+    ayanamsa_deg: float,
+    lon: np.ndarray,
+    ra: np.ndarray,
+    dec: np.ndarray,
+) -> AsyncIterator[str]:
+    """Stream a GeoJSON FeatureCollection; ASC/DSC lines are solved chunk by chunk"""
+    sidereal = req.zodiac == "sidereal"
+    out_lon = (lon - ayanamsa_deg) % 360 if sidereal else lon
+    meta = {
+        "birth_time": req.birth_time.isoformat().replace("+00:00", "Z"),
+        "zodiac": req.zodiac,
+        "ayanamsa": req.ayanamsa if sidereal else None,
+        "ayanamsa_deg": round(ayanamsa_deg, 6) if sidereal else None,
+        "gmst_deg": round(gmst_deg, 6),
+        "resolution_deg": req.resolution_deg,
+        "bodies": {
+            name: {
+                "longitude": round(float(out_lon[i]), 6),
+                "ra": round(float(ra[i]), 6),
+                "dec": round(float(dec[i]), 6),
+            }
+            for i, name in enumerate(req.bodies)
+        },
+    }
+
+    def feature(name: str, angle: str, coordinates: list[list[float]]) -> str:
+        return json.dumps(
+            {
+                "type": "Feature",
+                "properties": {"body": name, "angle": angle},
+                "geometry": {"type": "LineString", "coordinates": coordinates},
+            }
+        )
+
+    yield '{"type": "FeatureCollection", "meta": ' + json.dumps(meta) + ', "features": ['
+
+    # MC/IC lines are meridians: one longitude per body, every latitude
+    lim = req.max_latitude
+    mc, ic = meridian_longitudes(ra, gmst_deg)
+    parts = [
+        feature(name, angle, [[round(float(x), 6), -lim], [round(float(x), 6), lim]])
+        for angle, lons in (("MC", mc), ("IC", ic))
+        if angle in req.angles
+        for name, x in zip(req.bodies, lons, strict=True)
+    ]
+    sep = ""
+    if parts:
+        yield ",".join(parts)
+        sep = ","
+
+    horizon = [angle for angle in ("ASC", "DSC") if angle in req.angles]
+    rows = req.latitude_rows() if horizon else 0
+    step = 2 * lim / max(rows, 1)
+    for first in range(0, rows, ASTROCARTOGRAPHY_CHUNK_ROWS):
+        # Chunks share their boundary latitude so consecutive pieces join up
+        lats = -lim + np.arange(first, min(first + ASTROCARTOGRAPHY_CHUNK_ROWS, rows) + 1) * step
+        asc, dsc = horizon_longitudes(ra, dec, gmst_deg, lats)
+        parts = [
+            feature(name, angle, np.round(piece, 6).tolist())
+            for angle, lons in zip(("ASC", "DSC"), (asc, dsc), strict=True)
+            if angle in horizon
+            for name, row in zip(req.bodies, lons, strict=True)
+            for piece in line_pieces(lats, row)
+        ]
+        if parts:
+            yield sep + ",".join(parts)
+            sep = ","
+        # Let other requests on this worker run between chunks
+        await asyncio.sleep(0)
+
+    yield "]}"
+
+
+@limiter.limit("10/minute")
+@app.post("/v1/astrocartography")
+async def astrocartography(request: Request, req: AstrocartographyRequest) -> StreamingResponse:
+    """Stream planetary angle lines (ASC, DSC, MC, IC) over the globe as GeoJSON
+
+    Body positions are computed once (one SPICE worker call); each line is then
+    solved in closed form over a latitude grid and streamed as LineString
+    features, so memory stays bounded at fine resolutions.
+    """
+    try:
+        gmst_deg, ayanamsa_deg, lon, ra, dec = await _run_spice(_astrocartography_sync, req)
+    except CALCULATION_ERRORS as e:
+        status_code, detail = map_error(e)
+        raise HTTPException(status_code=status_code, detail=detail) from e
+
+    return StreamingResponse(
+        _astrocartography_geojson(req, gmst_deg, ayanamsa_deg, lon, ra, dec),
+        media_type="application/geo+json",
+    )
+
+
+# Ephemeris evaluations allowed per event search (a year of Moon ingresses uses ~2,000)
+EVENT_SEARCH_MAX_EVALUATIONS = 20_000
+
+
+def _entered_sign(crossing: Crossing) -> int:
+    """Index of the sign entered at a sign-boundary crossing"""
+    boundary = round(crossing.longitude / 30.0)
+    return (boundary if crossing.direction > 0 else boundary - 1) % 12
+
+
+def _event_search_sync(req: EventSearchRequest) -> EventSearchResponse:
+    """Sign ingresses or longitude crossings of one body (runs in a SPICE worker)"""
+    body_id = AVAILABLE_BODIES[req.body]
+    sidereal = req.zodiac == "sidereal"
+    ingress = req.longitude is None
+    target_deg = 0.0 if req.longitude is None else req.longitude
+
+    def longitude_at(et: float) -> float:
+        """Geocentric ecliptic-of-date longitude in the requested zodiac"""
+        count_spice_calls()
+        pos, _ = spice.spkpos(body_id, et, "J2000", ABCORR, "EARTH")
+        lon = convert_to_ecliptic_of_date_spice(pos, et)["longitude"]
+        return (lon - calculate_ayanamsa(req.ayanamsa, et)) % 360 if sidereal else lon
+
+    count_spice_calls(2)
+    start_et = spice.str2et(req.start.isoformat().replace("+00:00", "Z"))
+    end_et = spice.str2et(req.end.isoformat().replace("+00:00", "Z"))
+    search = find_crossings(
+        longitude_at,
+        start_et,
+        end_et,
+        target_deg=target_deg,
+        period_deg=30.0 if ingress else 360.0,
+        speed_bounds=SPEED_BOUNDS_DEG_PER_DAY[req.body],
+        accept=lambda c: req.sign is None or SIGNS[_entered_sign(c)] == req.sign,
+        limit=req.limit,
+        max_evaluations=EVENT_SEARCH_MAX_EVALUATIONS,
+    )
+
+    count_spice_calls(len(search.crossings) + 1)
+    return EventSearchResponse(
+        body=req.body,
+        event="ingress" if ingress else "longitude",
+        zodiac=req.zodiac,
+        ayanamsa=req.ayanamsa if sidereal else None,
+        target_longitude=req.longitude,
+        events=[
+            EventItem(
+                time=spice.et2utc(c.et, "ISOC", 3) + "Z",
+                longitude=round(c.longitude, 6),
+                direction="direct" if c.direction > 0 else "retrograde",
+                sign=SIGNS[_entered_sign(c)] if ingress else None,
+            )
+            for c in search.crossings
+        ],
+        evaluations=search.evaluations,
+        searched_until=spice.et2utc(search.searched_until_et, "ISOC", 3) + "Z",
+    )
+
+
+@limiter.limit("10/minute")
+@app.post("/v1/events/search", response_model=EventSearchResponse)
+async def event_search(request: Request, req: EventSearchRequest) -> EventSearchResponse:
+    """Find when a body enters a sign or reaches a longitude
+
+    Scans with steps bounded by the body's speed limits (no crossing can be
+    skipped) and refines each bracketed crossing with Brent's method to 10 ms.
+    """
+    try:
+        return await _run_spice(_event_search_sync, req)
+    except CALCULATION_ERRORS as e:
+        status_code, detail = map_error(e)
+        raise HTTPException(status_code=status_code, detail=detail) from e
+
+
 # Time Resolution Models and Endpoint
+def _invalid_timezone_detail(name: str) -> str:
+    return f"Invalid timezone: {name}. Must be a valid IANA timezone name."
+
+
+def _unknown_location_detail(latitude: float, longitude: float) -> str:
+    return (
+        f"Could not determine timezone for coordinates ({latitude}, {longitude}). "
+        "Location may be in ocean or invalid. Consider using timezone_override."
+    )
+
+
 @limiter.limit("60/minute")
 @app.post("/v1/time/resolve", response_model=TimeResolveResponse)
 async def resolve_time(request: Request, req: TimeResolveRequest) -> TimeResolveResponse:
@@ -1048,6 +2077,11 @@ async def resolve_time(request: Request, req: TimeResolveRequest) -> TimeResolve
     Rate Limit:
         60 requests per minute per IP address
     """
+    cache_key = time_cache_key(req, pytz.__version__, SERVICE_VERSION)
+    cached = await result_cache.get_async(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         # 1. Find timezone from coordinates (or use override)
         if req.timezone_override:
@@ -1057,8 +2091,7 @@ async def resolve_time(request: Request, req: TimeResolveRequest) -> TimeResolve
                 tz_name = req.timezone_override
             except pytz.exceptions.UnknownTimeZoneError:
                 raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid timezone: {req.timezone_override}. Must be a valid IANA timezone name.",
+                    status_code=400, detail=_invalid_timezone_detail(req.timezone_override)
                 )
         else:
             # Use regional IANA timezones for accurate historical data
@@ -1067,7 +2100,7 @@ async def resolve_time(request: Request, req: TimeResolveRequest) -> TimeResolve
             if not tz_name:
                 raise HTTPException(
                     status_code=400,
-                    detail=f"Could not determine timezone for coordinates ({req.latitude}, {req.longitude}). Location may be in ocean or invalid. Consider using timezone_override.",
+                    detail=_unknown_location_detail(req.latitude, req.longitude),
                 )
 
         # 2. Parse local datetime
@@ -1084,12 +2117,14 @@ async def resolve_time(request: Request, req: TimeResolveRequest) -> TimeResolve
         offset_seconds = localized_dt.utcoffset().total_seconds() if localized_dt.utcoffset() else 0
         offset_hours = offset_seconds / 3600
 
-        return TimeResolveResponse(
+        response = TimeResolveResponse(
             utc_time=utc_dt.strftime("%Y-%m-%dT%H:%M:%SZ"),
             timezone=tz_name,
             offset_hours=round(offset_hours, 2),
             is_dst=is_dst,
         )
+        await result_cache.put_async(cache_key, response)
+        return response
 
     except HTTPException:
         raise
@@ -1097,6 +2132,192 @@ async def resolve_time(request: Request, req: TimeResolveRequest) -> TimeResolve
         raise HTTPException(status_code=500, detail=f"Time resolution failed: {str(e)}")
 
 
+# Rows per chunk when a batch time resolution is streamed
+TIME_BATCH_CHUNK_SIZE = 5000
+
+
+def _localize_distinct(
+    local_dts: list[datetime], tz_name: str
+) -> dict[datetime, tuple[str, float, bool] | Exception]:
+    """(utc_time, offset_hours, is_dst) or the failure, per distinct local datetime"""
+    if not local_dts:
+        return {}
+    try:
+        utc_dts, offsets, dst_flags = localize_datetimes(local_dts, tz_name)
+    except OverflowError:
+        utc_dts = None  # Dates at the ends of the datetime range: pytz per row, with its errors
+    if utc_dts is not None:
+        return {
+            local_dt: (utc_dt.strftime("%Y-%m-%dT%H:%M:%SZ"), round(offset_hours, 2), is_dst)
+            for local_dt, utc_dt, offset_hours, is_dst in zip(
+                local_dts, utc_dts, offsets, dst_flags, strict=True
+            )
+        }
+
+    tz = pytz.timezone(tz_name)
+    resolved: dict[datetime, tuple[str, float, bool] | Exception] = {}
+    for local_dt in local_dts:
+        try:
+            localized_dt, is_dst = _localize_datetime_with_dst_handling(local_dt, tz)
+            offset = localized_dt.utcoffset()
+            offset_hours = offset.total_seconds() / 3600 if offset else 0.0
+            resolved[local_dt] = (
+                localized_dt.astimezone(pytz.UTC).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                round(offset_hours, 2),
+                is_dst,
+            )
+        except (OverflowError, ValueError) as e:
+            resolved[local_dt] = e
+    return resolved
+
+
+def _time_resolve_batch_sync(
+    items: list[TimeResolveRequest], first_index: int = 0
+) -> tuple[list[TimeResolveBatchItem], int, int]:
+    """
+    Resolve rows with /v1/time/resolve semantics, grouped for bulk work.
+
+    Coordinates are deduplicated and resolved in one vectorized nearest-city
+    query; rows are then grouped by timezone and each distinct local time is
+    parsed once and localized once against the zone's transition table. Pure
+    Python/NumPy with no SPICE calls, so it runs in a thread, not the SPICE pool.
+    Returns (items in input order, distinct locations, distinct timezones).
+    """
+    results: list[TimeResolveBatchItem | None] = [None] * len(items)
+
+    def fail(i: int, status_code: int, detail: str) -> None:
+        results[i] = TimeResolveBatchItem(
+            index=first_index + i, status_code=status_code, error=detail
+        )
+
+    # 1. Timezone per row: overrides validated once per name, coordinates looked up once
+    zones: dict[str, pytz.BaseTzInfo | None] = {}
+
+    def zone(name: str) -> pytz.BaseTzInfo | None:
+        if name not in zones:
+            try:
+                zones[name] = pytz.timezone(name)
+            except pytz.exceptions.UnknownTimeZoneError:
+                zones[name] = None
+        return zones[name]
+
+    by_zone: dict[str, list[int]] = {}
+    by_location: dict[tuple[float, float], list[int]] = {}
+    for i, req in enumerate(items):
+        if req.timezone_override:
+            if zone(req.timezone_override) is None:
+                fail(i, 400, _invalid_timezone_detail(req.timezone_override))
+            else:
+                by_zone.setdefault(req.timezone_override, []).append(i)
+        else:
+            by_location.setdefault((req.latitude, req.longitude), []).append(i)
+
+    if by_location:
+        coords = np.array(list(by_location), dtype=np.float64)
+        with stage("timezone_lookup"):
+            names = get_historical_timezones(coords[:, 0], coords[:, 1])
+        for (lat, lon), name in zip(by_location, names, strict=True):
+            rows = by_location[(lat, lon)]
+            if name:
+                by_zone.setdefault(name, []).extend(rows)
+            else:
+                for i in rows:
+                    fail(i, 400, _unknown_location_detail(lat, lon))
+
+    # 2. Parse each distinct local datetime string once
+    parsed: dict[str, datetime] = {}
+    parse_errors: dict[str, HTTPException] = {}
+    for text in {items[i].local_datetime for rows in by_zone.values() for i in rows}:
+        try:
+            parsed[text] = _parse_local_datetime(text)
+        except HTTPException as e:
+            parse_errors[text] = e
+
+    # 3. Localize per timezone: distinct local times in one transition-table lookup
+    with stage("localize"):
+        for name, rows in by_zone.items():
+            ok_rows = []
+            for i in rows:
+                error = parse_errors.get(items[i].local_datetime)
+                if error is not None:
+                    fail(i, error.status_code, error.detail)
+                else:
+                    ok_rows.append(i)
+            distinct = list(dict.fromkeys(parsed[items[i].local_datetime] for i in ok_rows))
+            resolved = _localize_distinct(distinct, name)
+            for i in ok_rows:
+                outcome = resolved[parsed[items[i].local_datetime]]
+                if isinstance(outcome, Exception):
+                    fail(i, 500, f"Time resolution failed: {outcome!s}")
+                    continue
+                utc_time, offset_hours, is_dst = outcome
+                results[i] = TimeResolveBatchItem(
+                    index=first_index + i,
+                    utc_time=utc_time,
+                    timezone=name,
+                    offset_hours=offset_hours,
+                    is_dst=is_dst,
+                )
+
+    return [r for r in results if r is not None], len(by_location), len(by_zone)
+
+
+async def _time_resolve_ndjson(items: list[TimeResolveRequest]) -> AsyncIterator[str]:
+    """Stream batch rows in input order, one chunk at a time"""
+    for offset in range(0, len(items), TIME_BATCH_CHUNK_SIZE):
+        chunk = items[offset : offset + TIME_BATCH_CHUNK_SIZE]
+        try:
+            rows, _, _ = await asyncio.to_thread(_time_resolve_batch_sync, chunk, offset)
+        except (OSError, ValueError) as e:
+            # Headers are already sent; report the failure in-band and stop
+            status_code, detail = map_error(e)
+            yield json.dumps({"error": detail, "status_code": status_code}) + "\n"
+            return
+        yield "".join(row.model_dump_json(exclude_none=True) + "\n" for row in rows)
+        await asyncio.sleep(0)
+
+
+@limiter.limit("10/minute")
+@app.post("/v1/time/resolve/batch", response_model=TimeResolveBatchResponse)
+async def resolve_time_batch(
+    request: Request, batch: TimeResolveBatchRequest, stream: bool = False
+) -> TimeResolveBatchResponse | StreamingResponse:
+    """
+    Resolve many local datetimes to UTC (bulk CSV imports).
+
+    Each row follows /v1/time/resolve: timezone_override or historical timezone
+    from coordinates, then DST-aware localization (ambiguous → standard time,
+    non-existent → the DST side). Results are in input order; a failing row
+    yields an item with status_code and error instead of failing the batch.
+
+    With ?stream=true rows are sent as NDJSON as each chunk completes.
+    """
+    if stream:
+        return StreamingResponse(
+            _time_resolve_ndjson(batch.items), media_type="application/x-ndjson"
+        )
+
+    try:
+        items, locations, timezones = await asyncio.to_thread(
+            _time_resolve_batch_sync, batch.items
+        )
+    except (OSError, ValueError) as e:
+        status_code, detail = map_error(e)
+        raise HTTPException(status_code=status_code, detail=detail) from e
+
+    meta = TimeResolveBatchMeta(
+        service_version=SERVICE_VERSION,
+        tz_database=pytz.__version__,
+        count=len(items),
+        failed=sum(1 for item in items if item.error is not None),
+        locations=locations,
+        timezones=timezones,
+        request_id=str(uuid.uuid4()),
+        timestamp=time.time(),
+    )
+    return TimeResolveBatchResponse(results=items, meta=meta)
+
+
 if __name__ == "__main__":
     import os
 
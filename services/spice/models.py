@@ -4,15 +4,33 @@ Pydantic models for API requests and responses.
 This module contains all data models used by the Involution SPICE Service API.
 """
 
+import math
 from datetime import UTC, datetime
 from typing import Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 # Type aliases
 Zodiac = Literal["tropical", "sidereal"]
+Precision = Literal["research", "fast"]
 HouseSystem = Literal["placidus", "whole-sign", "equal"]
 McHemisphere = Literal["south", "north", "auto"]
+SweepAngle = Literal["asc", "mc"]
+AngleLine = Literal["ASC", "DSC", "MC", "IC"]
+ZodiacSign = Literal[
+    "Aries",
+    "Taurus",
+    "Gemini",
+    "Cancer",
+    "Leo",
+    "Virgo",
+    "Libra",
+    "Scorpio",
+    "Sagittarius",
+    "Capricorn",
+    "Aquarius",
+    "Pisces",
+]
 
 # Available celestial bodies for calculation
 AVAILABLE_BODIES = {
@@ -26,6 +44,9 @@ AVAILABLE_BODIES = {
     # TODO: Add Uranus, Neptune, Pluto, True Node, Mean Node, ASC, MC
 }
 
+# Astrocartography angle lines, in the order they are drawn by default
+ANGLES: tuple[AngleLine, ...] = ("ASC", "DSC", "MC", "IC")
+
 
 # ============================================================================
 # Planetary Position Models
@@ -45,6 +66,10 @@ class ChartRequest(BaseModel):
     zodiac: Zodiac = "sidereal"
     ayanamsa: Literal["lahiri", "fagan_bradley"] = "lahiri"
     bodies: list[str] = Field(default_factory=lambda: list(AVAILABLE_BODIES.keys()))
+    precision: Precision = Field(
+        default="research",
+        description="research: SPICE per body; fast: precomputed Chebyshev tables (UI previews)",
+    )
 
     @field_validator("birth_time")
     @classmethod
@@ -91,6 +116,7 @@ class ApiMeta(BaseModel):
     ecliptic_frame: str
     zodiac: Zodiac
     ayanamsa_deg: float | None
+    precision: Precision = "research"  # tier actually used (fast falls back to research)
     request_id: str
     timestamp: float
 
@@ -102,6 +128,101 @@ class CalculationResponse(BaseModel):
     meta: ApiMeta
 
 
+# Upper bound on charts per batch request; larger jobs are split client-side
+MAX_BATCH_CHARTS = 5000
+
+
+class BatchChartRequest(BaseModel):
+    """Request model for computing many charts in one call."""
+
+    charts: list[ChartRequest] = Field(..., min_length=1, max_length=MAX_BATCH_CHARTS)
+
+
+class BatchChartItem(BaseModel):
+    """Result for one chart of a batch, in input order; failures carry an error."""
+
+    index: int
+    status_code: int = 200
+    zodiac: Zodiac
+    ayanamsa_deg: float | None = None
+    precision: Precision = "research"
+    data: dict[str, PlanetPosition] | None = None
+    error: str | None = None
+
+
+class BatchMeta(BaseModel):
+    """Metadata for batch responses."""
+
+    service_version: str
+    spice_version: str
+    kernel_set_tag: str
+    ecliptic_frame: str
+    count: int
+    failed: int
+    request_id: str
+    timestamp: float
+
+
+class BatchChartResponse(BaseModel):
+    """Response model for batch planetary position calculations."""
+
+    results: list[BatchChartItem]
+    meta: BatchMeta
+
+
+# ============================================================================
+# Ephemeris Time-Series Models
+# ============================================================================
+
+# Upper bound on rows per time-series request (e.g. 10-minute steps over ~9.5 years)
+MAX_SERIES_POINTS = 500_000
+
+
+class EphemerisSeriesRequest(BaseModel):
+    """Request model for body positions over a date range at a fixed step."""
+
+    start: datetime = Field(..., description="ISO 8601 with timezone, first sample instant")
+    end: datetime = Field(
+        ..., description="ISO 8601 with timezone, last sample instant (inclusive)"
+    )
+    step_seconds: float = Field(3600.0, ge=60, description="Sampling step in seconds (>= 60)")
+    latitude: float = Field(..., ge=-90, le=90, description="Degrees, -90..90")
+    longitude: float = Field(..., ge=-180, le=180, description="Degrees, -180..180")
+    elevation: float = Field(0.0, ge=-500, le=10000, description="Meters, -500..10000")
+    zodiac: Zodiac = "sidereal"
+    ayanamsa: Literal["lahiri", "fagan_bradley"] = "lahiri"
+    bodies: list[str] = Field(default_factory=lambda: list(AVAILABLE_BODIES.keys()))
+
+    @field_validator("start", "end")
+    @classmethod
+    def ensure_timezone_and_utc(cls, v: datetime) -> datetime:
+        """Ensure range endpoints have timezone and convert to UTC."""
+        if v.tzinfo is None or v.tzinfo.utcoffset(v) is None:
+            raise ValueError("start/end must include a timezone (Z or ±HH:MM)")
+        return v.astimezone(UTC)
+
+    @field_validator("bodies")
+    @classmethod
+    def validate_bodies(cls, v: list[str]) -> list[str]:
+        """Validate requested celestial bodies."""
+        return ChartRequest.validate_bodies(v)
+
+    @model_validator(mode="after")
+    def validate_range(self) -> "EphemerisSeriesRequest":
+        """Ensure the range is ordered and within the row limit."""
+        if self.end < self.start:
+            raise ValueError("end must not be before start")
+        if self.point_count() > MAX_SERIES_POINTS:
+            raise ValueError(
+                f"Range/step yields more than {MAX_SERIES_POINTS} rows; split the request"
+            )
+        return self
+
+    def point_count(self) -> int:
+        """Number of sample instants in [start, end]."""
+        return int((self.end - self.start).total_seconds() // self.step_seconds) + 1
+
+
 # ============================================================================
 # House System Models
 # ============================================================================
@@ -143,6 +264,189 @@ class HousesResponse(BaseModel):
     cusps: list[float]  # 12 cusp longitudes (deg), 0..360
 
 
+MAX_HOUSES_SWEEP_STEPS = 20_000
+
+
+class HousesSweepRequest(BaseModel):
+    """Request model for house angles and cusps over a time window (rectification)."""
+
+    start: datetime = Field(..., description="ISO 8601 with timezone, first candidate time")
+    end: datetime = Field(
+        ..., description="ISO 8601 with timezone, last candidate time (inclusive)"
+    )
+    step_seconds: float = Field(
+        default=60.0, ge=1, description="Sampling step in seconds (>= 1)"
+    )
+    latitude: float = Field(..., ge=-90, le=90)
+    longitude: float = Field(..., ge=-180, le=180)  # east +
+    elevation: float = Field(default=0.0, ge=-500, le=10000)
+    zodiac: Zodiac = "sidereal"
+    ayanamsa: Literal["lahiri", "fagan_bradley"] = "lahiri"
+    system: HouseSystem = "placidus"
+    mc_hemisphere: McHemisphere = "south"
+
+    @field_validator("start", "end")
+    @classmethod
+    def ensure_timezone_and_utc(cls, v: datetime) -> datetime:
+        """Ensure window endpoints have timezone and convert to UTC."""
+        if v.tzinfo is None or v.tzinfo.utcoffset(v) is None:
+            raise ValueError("start/end must include a timezone (Z or ±HH:MM)")
+        return v.astimezone(UTC)
+
+    @model_validator(mode="after")
+    def validate_range(self) -> "HousesSweepRequest":
+        """Ensure the window is ordered and within the step limit."""
+        if self.end < self.start:
+            raise ValueError("end must not be before start")
+        if self.point_count() > MAX_HOUSES_SWEEP_STEPS:
+            raise ValueError(
+                f"Window/step yields more than {MAX_HOUSES_SWEEP_STEPS} steps; "
+                "narrow the window or increase step_seconds"
+            )
+        return self
+
+    def point_count(self) -> int:
+        """Number of candidate times in [start, end]."""
+        return int((self.end - self.start).total_seconds() // self.step_seconds) + 1
+
+
+class HouseSignChange(BaseModel):
+    """ASC or MC entering a new sign within the sweep window."""
+
+    angle: SweepAngle
+    time: str  # ISO UTC, millisecond precision
+    from_sign: str
+    to_sign: str
+
+
+class HousesSweepResponse(BaseModel):
+    """Columnar response for a houses sweep; index i is start + i * step_seconds."""
+
+    system: HouseSystem
+    frame: str
+    coordinate_system: str
+    ecliptic_model: str
+    zodiac: Zodiac
+    ayanamsa: str | None
+    ayanamsa_deg: float | None  # at the window start
+    start: str
+    step_seconds: float
+    count: int
+    asc: list[float]
+    mc: list[float]
+    cusps: list[list[float]]  # cusps[h] = cusp h+1 at every step (deg), 0..360
+    sign_changes: list[HouseSignChange]
+
+
+# ============================================================================
+# Astrocartography Models
+# ============================================================================
+
+
+class AstrocartographyRequest(BaseModel):
+    """Request model for planetary angle lines over the globe at one instant."""
+
+    birth_time: datetime = Field(..., description="ISO 8601 with tz, e.g. 2024-06-21T18:00:00Z")
+    zodiac: Zodiac = "sidereal"
+    ayanamsa: Literal["lahiri", "fagan_bradley"] = "lahiri"
+    bodies: list[str] = Field(default_factory=lambda: list(AVAILABLE_BODIES.keys()))
+    angles: list[AngleLine] = Field(default_factory=lambda: list(ANGLES))
+    resolution_deg: float = Field(
+        0.5, ge=0.001, le=5, description="Latitude sampling of ASC/DSC lines (degrees)"
+    )
+    max_latitude: float = Field(85.0, gt=0, le=89, description="Lines span ±max_latitude")
+
+    @field_validator("birth_time")
+    @classmethod
+    def ensure_timezone_and_utc(cls, v: datetime) -> datetime:
+        """Ensure birth_time has timezone and convert to UTC."""
+        if v.tzinfo is None or v.tzinfo.utcoffset(v) is None:
+            raise ValueError("birth_time must include a timezone (Z or ±HH:MM)")
+        return v.astimezone(UTC)
+
+    @field_validator("bodies")
+    @classmethod
+    def validate_bodies(cls, v: list[str]) -> list[str]:
+        """Validate requested celestial bodies."""
+        return ChartRequest.validate_bodies(v)
+
+    def latitude_rows(self) -> int:
+        """Number of latitude intervals between -max_latitude and +max_latitude."""
+        return max(1, math.ceil(2 * self.max_latitude / self.resolution_deg))
+
+
+# ============================================================================
+# Event Search Models
+# ============================================================================
+
+# Upper bound on events returned by one search request
+MAX_EVENTS = 100
+
+
+class EventSearchRequest(BaseModel):
+    """Request model for finding when a body enters a sign or reaches a longitude."""
+
+    body: str = Field(..., description="One of AVAILABLE_BODIES, e.g. Mars")
+    start: datetime = Field(..., description="ISO 8601 with timezone, search from")
+    end: datetime = Field(..., description="ISO 8601 with timezone, search until")
+    zodiac: Zodiac = "sidereal"
+    ayanamsa: Literal["lahiri", "fagan_bradley"] = "lahiri"
+    sign: ZodiacSign | None = Field(default=None, description="Only ingresses into this sign")
+    longitude: float | None = Field(
+        default=None,
+        ge=0,
+        lt=360,
+        description="Find crossings of this longitude instead of ingresses",
+    )
+    limit: int = Field(default=10, ge=1, le=MAX_EVENTS)
+
+    @field_validator("start", "end")
+    @classmethod
+    def ensure_timezone_and_utc(cls, v: datetime) -> datetime:
+        """Ensure window endpoints have timezone and convert to UTC."""
+        if v.tzinfo is None or v.tzinfo.utcoffset(v) is None:
+            raise ValueError("start/end must include a timezone (Z or ±HH:MM)")
+        return v.astimezone(UTC)
+
+    @field_validator("body")
+    @classmethod
+    def validate_body(cls, v: str) -> str:
+        """Validate the requested celestial body."""
+        ChartRequest.validate_bodies([v])
+        return v
+
+    @model_validator(mode="after")
+    def validate_search(self) -> "EventSearchRequest":
+        """Ensure the window is ordered and the target is unambiguous."""
+        if self.end <= self.start:
+            raise ValueError("end must be after start")
+        if self.sign is not None and self.longitude is not None:
+            raise ValueError("Give either sign or longitude, not both")
+        return self
+
+
+class EventItem(BaseModel):
+    """One crossing; longitude is in the requested zodiac."""
+
+    time: str  # ISO UTC, millisecond precision
+    longitude: float
+    direction: Literal["direct", "retrograde"]
+    sign: ZodiacSign | None = None  # sign entered (ingress searches)
+
+
+class EventSearchResponse(BaseModel):
+    """Response model for event searches."""
+
+    body: str
+    event: Literal["ingress", "longitude"]
+    zodiac: Zodiac
+    ayanamsa: str | None
+    target_longitude: float | None
+    events: list[EventItem]
+    evaluations: int  # ephemeris evaluations used
+    searched_until: str  # ISO UTC; before `end` if `limit` or the evaluation budget stopped it
+
+
 # ============================================================================
 # Time Resolution Models
 # ============================================================================
@@ -157,7 +461,8 @@ class TimeResolveRequest(BaseModel):
     latitude: float = Field(..., ge=-90, le=90, description="Latitude in degrees")
     longitude: float = Field(..., ge=-180, le=180, description="Longitude in degrees")
     timezone_override: str | None = Field(
-        None, description="Manual timezone override (IANA timezone name, e.g. 'America/Chicago')"
+        default=None,
+        description="Manual timezone override (IANA timezone name, e.g. 'America/Chicago')",
     )
 
 
@@ -168,3 +473,47 @@ class TimeResolveResponse(BaseModel):
     timezone: str = Field(..., description="IANA timezone identifier")
     offset_hours: float = Field(..., description="UTC offset in hours at the given datetime")
     is_dst: bool = Field(..., description="Whether daylight saving time was active")
+
+
+# Upper bound on rows per batch time-resolution request (bulk CSV imports)
+MAX_BATCH_TIME_RESOLVE = 50_000
+
+
+class TimeResolveBatchRequest(BaseModel):
+    """Request model for resolving many local datetimes in one call."""
+
+    items: list[TimeResolveRequest] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_TIME_RESOLVE
+    )
+
+
+class TimeResolveBatchItem(BaseModel):
+    """Result for one row of a batch, in input order; failures carry an error."""
+
+    index: int
+    status_code: int = 200
+    utc_time: str | None = None
+    timezone: str | None = None
+    offset_hours: float | None = None
+    is_dst: bool | None = None
+    error: str | None = None
+
+
+class TimeResolveBatchMeta(BaseModel):
+    """Metadata for batch time-resolution responses."""
+
+    service_version: str
+    tz_database: str
+    count: int
+    failed: int
+    locations: int = Field(..., description="Distinct coordinates looked up")
+    timezones: int = Field(..., description="Distinct timezones the rows resolved to")
+    request_id: str
+    timestamp: float
+
+
+class TimeResolveBatchResponse(BaseModel):
+    """Response model for batch local datetime to UTC conversion."""
+
+    results: list[TimeResolveBatchItem]
+    meta: TimeResolveBatchMeta
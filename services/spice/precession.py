@@ -0,0 +1,192 @@
+"""
+Vectorized precession and obliquity engine.
+
+This module builds the J2000 → ecliptic-of-date rotation (IAU 2006 precession
+angles, IAU 1980 mean obliquity) for arrays of epochs in one shot, and converts
+(N, 3) J2000 position arrays to ecliptic longitude, latitude and distance.
+
+Single-chart code uses it with N=1 through the per-epoch memo
+(ecliptic_matrix), so every body and house computed at the same ET shares
+one matrix; batch and time-series code pass whole epoch arrays.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+# Julian Date of J2000.0 and seconds per day (same values as spice.j2000()/spice.spd())
+J2000_JD = 2451545.0
+SECONDS_PER_DAY = 86400.0
+AU_KM = 149597870.7
+
+
+def centuries_since_j2000(ets: np.ndarray | float) -> np.ndarray:
+    """
+    Julian centuries of TT since J2000.0.
+
+    Args:
+        ets: SPICE ephemeris time(s), seconds past J2000 (TDB ≈ TT)
+
+    Returns:
+        T as a float array with the shape of ets
+    """
+    jd_tt = J2000_JD + np.asarray(ets, dtype=float) / SECONDS_PER_DAY
+    return (jd_tt - 2451545.0) / 36525.0
+
+
+def mean_obliquity_deg(T: np.ndarray | float) -> np.ndarray:
+    """IAU 1980 mean obliquity of the ecliptic in degrees for T centuries since J2000."""
+    T = np.asarray(T, dtype=float)
+    return 23.43929111 - (46.8150 * T + 0.00059 * T**2 - 0.001813 * T**3) / 3600.0
+
+
+def precession_angles(T: np.ndarray | float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    IAU 2006 equatorial precession angles.
+
+    Args:
+        T: Julian centuries since J2000.0 (scalar or array)
+
+    Returns:
+        Tuple of (zeta_A, z_A, theta_A) in radians
+    """
+    T = np.asarray(T, dtype=float)
+    zeta_A = np.radians((2306.2181 * T + 0.30188 * T**2 + 0.017998 * T**3) / 3600.0)
+    z_A = np.radians((2306.2181 * T + 1.09468 * T**2 + 0.018203 * T**3) / 3600.0)
+    theta_A = np.radians((2004.3109 * T - 0.42665 * T**2 - 0.041833 * T**3) / 3600.0)
+    return zeta_A, z_A, theta_A
+
+
+def _rot1(angle: np.ndarray) -> np.ndarray:
+    """Stacked rotations about X by angle (frame rotation convention), shape (N, 3, 3)."""
+    c, s = np.cos(angle), np.sin(angle)
+    m = np.zeros(angle.shape + (3, 3))
+    m[..., 0, 0] = 1.0
+    m[..., 1, 1], m[..., 1, 2] = c, s
+    m[..., 2, 1], m[..., 2, 2] = -s, c
+    return m
+
+
+def _rot2(angle: np.ndarray) -> np.ndarray:
+    """Stacked rotations about Y by angle (frame rotation convention), shape (N, 3, 3)."""
+    c, s = np.cos(angle), np.sin(angle)
+    m = np.zeros(angle.shape + (3, 3))
+    m[..., 0, 0], m[..., 0, 2] = c, -s
+    m[..., 1, 1] = 1.0
+    m[..., 2, 0], m[..., 2, 2] = s, c
+    return m
+
+
+def _rot3(angle: np.ndarray) -> np.ndarray:
+    """Stacked rotations about Z by angle (frame rotation convention), shape (N, 3, 3)."""
+    c, s = np.cos(angle), np.sin(angle)
+    m = np.zeros(angle.shape + (3, 3))
+    m[..., 0, 0], m[..., 0, 1] = c, s
+    m[..., 1, 0], m[..., 1, 1] = -s, c
+    m[..., 2, 2] = 1.0
+    return m
+
+
+def precession_matrices(T: np.ndarray | float) -> np.ndarray:
+    """
+    Precession matrices J2000.0 → mean equator of date.
+
+    P = R3(-z_A) · R2(theta_A) · R3(-zeta_A)
+
+    Args:
+        T: Julian centuries since J2000.0, shape (N,) or scalar
+
+    Returns:
+        Rotation matrices, shape (N, 3, 3) (or (3, 3) for scalar T)
+    """
+    zeta_A, z_A, theta_A = precession_angles(T)
+    return _rot3(-z_A) @ _rot2(theta_A) @ _rot3(-zeta_A)
+
+
+def ecliptic_matrices(ets: np.ndarray | float) -> np.ndarray:
+    """
+    Rotations J2000 equatorial → ecliptic of date for an array of epochs.
+
+    1) J2000 equatorial → mean equatorial of date (precession)
+    2) Mean equatorial of date → ecliptic of date (obliquity rotation)
+
+    Args:
+        ets: SPICE ephemeris times, shape (N,) or scalar
+
+    Returns:
+        Rotation matrices, shape (N, 3, 3) (or (3, 3) for scalar et)
+    """
+    T = centuries_since_j2000(ets)
+    eps = np.radians(mean_obliquity_deg(T))
+    return _rot1(eps) @ precession_matrices(T)
+
+
+@lru_cache(maxsize=4096)
+def ecliptic_matrix(et: float) -> np.ndarray:
+    """
+    Memoized J2000 → ecliptic-of-date rotation for one epoch.
+
+    All bodies (and speed, houses) evaluated at the same ET share this matrix.
+    The returned array is read-only.
+    """
+    m = ecliptic_matrices(float(et))
+    m.flags.writeable = False
+    return m
+
+
+def ecliptic_matrix_rate(et: float, half_step: float = 43200.0) -> np.ndarray:
+    """Time derivative (per second) of the ecliptic-of-date rotation, central difference."""
+    m = ecliptic_matrices(np.array([et - half_step, et + half_step]))
+    return (m[1] - m[0]) / (2 * half_step)
+
+
+def spherical_from_rotation(
+    pos_j2000: np.ndarray, rotation: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Rotate (N, 3) J2000 vectors and convert to spherical ecliptic coordinates.
+
+    Args:
+        pos_j2000: Positions in km, shape (N, 3)
+        rotation: One (3, 3) matrix shared by all rows, or (N, 3, 3) per row
+
+    Returns:
+        Tuple of (longitude_deg in [0, 360), latitude_deg, distance_au) arrays
+    """
+    pos = np.asarray(pos_j2000, dtype=float)
+    r_km = np.linalg.norm(pos, axis=-1)
+    unit = pos / r_km[..., None]
+    if rotation.ndim == 2:
+        v = unit @ rotation.T
+    else:
+        v = np.einsum("nij,nj->ni", rotation, unit)
+
+    lon = (np.degrees(np.arctan2(v[..., 1], v[..., 0])) + 360.0) % 360.0
+    lat = np.degrees(np.arcsin(np.clip(v[..., 2], -1.0, 1.0)))
+    return lon, lat, r_km / AU_KM
+
+
+def to_ecliptic_of_date(
+    pos_j2000: np.ndarray, ets: np.ndarray | float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Convert (N, 3) J2000 positions at N epochs to ecliptic of date.
+
+    A scalar ET (or an array holding a single repeated epoch) uses the memoized
+    matrix; otherwise stacked matrices are built for all epochs at once.
+
+    Args:
+        pos_j2000: Positions in km, shape (N, 3)
+        ets: Epochs, scalar or shape (N,)
+
+    Returns:
+        Tuple of (longitude_deg, latitude_deg, distance_au) arrays of length N
+    """
+    ets_arr = np.asarray(ets, dtype=float)
+    if ets_arr.ndim == 0:
+        rotation = ecliptic_matrix(float(ets_arr))
+    elif ets_arr.size and np.all(ets_arr == ets_arr[0]):
+        rotation = ecliptic_matrix(float(ets_arr[0]))
+    else:
+        rotation = ecliptic_matrices(ets_arr)
+    return spherical_from_rotation(np.atleast_2d(pos_j2000), rotation)
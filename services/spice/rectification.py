@@ -0,0 +1,165 @@
+"""
+Birth-time rectification sweep: house angles and cusps over a time window.
+
+For each step of a window at one location, ASC, MC and the 12 cusps come from
+the houses.py formulas evaluated as NumPy arrays over all steps at once
+(instead of one /houses call per candidate time). Where ASC or MC enters a new
+sign between two steps, the instant is refined by bisection to
+SIGN_CHANGE_RESOLUTION_S.
+"""
+
+import math
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+import numpy as np
+import spiceypy as spice
+from houses import (
+    _asc_based_cusps_arrays,
+    _asc_mc_arrays,
+    _gmst_deg,
+    _obliquity_deg,
+    _placidus_cusps_arrays,
+    _wrap360,
+)
+from models import HousesSweepRequest, SweepAngle
+from timing import count_spice_calls
+
+# Sign ingress times are reported to the millisecond
+SIGN_CHANGE_RESOLUTION_S = 0.001
+
+# A step can cross several signs near the polar circles; bounded refinement rounds
+MAX_SIGNS_PER_STEP = 12
+
+
+@dataclass(frozen=True)
+class SignChange:
+    """ASC or MC entering a new sign (signs 0..11, Aries first)"""
+
+    angle: SweepAngle
+    offset_s: float  # seconds after the window start
+    from_sign: int
+    to_sign: int
+
+
+@dataclass(frozen=True)
+class HouseSweep:
+    """Angles and cusps per step in the requested zodiac (picklable for the worker pool)"""
+
+    offsets_s: np.ndarray  # seconds after the window start, shape (N,)
+    ayanamsa_deg: np.ndarray  # shape (N,)
+    asc: np.ndarray  # shape (N,)
+    mc: np.ndarray  # shape (N,)
+    cusps: np.ndarray  # shape (N, 12)
+    sign_changes: list[SignChange]
+
+
+def _iso_z(t: datetime) -> str:
+    return t.isoformat().replace("+00:00", "Z")
+
+
+def _sign_index(longitude: np.ndarray) -> np.ndarray:
+    return np.floor(longitude / 30.0).astype(np.int64) % 12
+
+
+def _ephemeris_times(start: datetime, offsets_s: np.ndarray) -> np.ndarray:
+    """ET per step: UTC offsets added to the start ET unless a leap second falls inside"""
+    count_spice_calls(2)
+    et0 = spice.str2et(_iso_z(start))
+    et_end = spice.str2et(_iso_z(start + timedelta(seconds=float(offsets_s[-1]))))
+    ets = et0 + offsets_s
+    if abs(ets[-1] - et_end) < SIGN_CHANGE_RESOLUTION_S:
+        return ets
+    count_spice_calls(len(offsets_s))
+    iso = [_iso_z(start + timedelta(seconds=float(o))) for o in offsets_s]
+    return np.asarray(spice.str2et(iso), dtype=float)
+
+
+def sweep_houses(
+    req: HousesSweepRequest, calculate_ayanamsa_func: Callable[[str, np.ndarray], np.ndarray]
+) -> HouseSweep:
+    """
+    ASC, MC and cusps at every step of the request window, plus sign ingresses.
+
+    Args:
+        req: Window, step, location and house system
+        calculate_ayanamsa_func: Function to calculate ayanamsa value (accepts arrays)
+
+    Returns:
+        HouseSweep with per-step columns and ASC/MC sign changes in time order
+    """
+    offsets_s = np.arange(req.point_count(), dtype=float) * req.step_seconds
+    ets = _ephemeris_times(req.start, offsets_s)
+    start_ts = req.start.timestamp()
+    sidereal = req.zodiac == "sidereal"
+
+    def angles(offsets: np.ndarray, et: np.ndarray) -> tuple[np.ndarray, ...]:
+        """(eps, gmst, ayanamsa, asc, mc) with asc/mc in the requested zodiac"""
+        jd_ut = (start_ts + offsets) / 86400.0 + 2440587.5
+        eps_deg = _obliquity_deg(jd_ut)
+        gmst_deg = _gmst_deg(jd_ut)
+        asc, mc = _asc_mc_arrays(eps_deg, gmst_deg, req.latitude, req.longitude, req.mc_hemisphere)
+        ay = np.asarray(calculate_ayanamsa_func(req.ayanamsa, et), dtype=float)
+        if sidereal:
+            asc, mc = _wrap360(asc - ay), _wrap360(mc - ay)
+        return eps_deg, gmst_deg, ay, asc, mc
+
+    eps_deg, gmst_deg, ay, asc, mc = angles(offsets_s, ets)
+
+    if req.system == "placidus":
+        asc_tropical = _wrap360(asc + ay) if sidereal else asc
+        trop = _placidus_cusps_arrays(eps_deg, gmst_deg, req.latitude, req.longitude, asc_tropical)
+        cusps = _wrap360(trop - ay[:, None]) if sidereal else _wrap360(trop)
+    else:
+        cusps = _asc_based_cusps_arrays(asc, req.system)
+
+    changes = [
+        *_sign_changes("asc", asc, offsets_s, ets, lambda o, et: angles(o, et)[3]),
+        *_sign_changes("mc", mc, offsets_s, ets, lambda o, et: angles(o, et)[4]),
+    ]
+    changes.sort(key=lambda c: c.offset_s)
+    return HouseSweep(offsets_s, ay, asc, mc, cusps, changes)
+
+
+def _sign_changes(
+    angle: SweepAngle,
+    longitudes: np.ndarray,
+    offsets_s: np.ndarray,
+    ets: np.ndarray,
+    evaluate: Callable[[np.ndarray, np.ndarray], np.ndarray],
+) -> list[SignChange]:
+    """
+    Ingress instants of one angle between the sampled steps.
+
+    Every step whose endpoints fall in different signs is bisected (all such
+    steps at once) until the change is bracketed to SIGN_CHANGE_RESOLUTION_S.
+    If the step crossed more than one sign, the rest of it is searched again.
+    """
+    signs = _sign_index(longitudes)
+    idx = np.nonzero(signs[1:] != signs[:-1])[0]
+    # Within a step ET advances with UTC, so ET = step ET + seconds into the step
+    step_offset, step_et = offsets_s[idx], ets[idx]
+    lo, end = offsets_s[idx], offsets_s[idx + 1]
+    from_sign, end_sign = signs[idx], signs[idx + 1]
+
+    changes: list[SignChange] = []
+    for _ in range(MAX_SIGNS_PER_STEP):
+        if len(lo) == 0:
+            break
+        hi = end.copy()
+        widest = float(np.max(hi - lo))
+        for _ in range(max(0, math.ceil(math.log2(widest / SIGN_CHANGE_RESOLUTION_S)))):
+            mid = (lo + hi) / 2
+            same = _sign_index(evaluate(mid, step_et + (mid - step_offset))) == from_sign
+            lo, hi = np.where(same, mid, lo), np.where(same, hi, mid)
+        to_sign = _sign_index(evaluate(hi, step_et + (hi - step_offset)))
+        changes += [
+            SignChange(angle, float(t), int(a), int(b))
+            for t, a, b in zip(hi, from_sign, to_sign, strict=True)
+        ]
+
+        more = to_sign != end_sign
+        lo, end, from_sign, end_sign = hi[more], end[more], to_sign[more], end_sign[more]
+        step_offset, step_et = step_offset[more], step_et[more]
+    return changes
@@ -0,0 +1,216 @@
+"""
+In-process LRU cache for deterministic chart results.
+
+A chart's positions depend only on the canonicalized request and on the kernel
+set / service version that produced them, so repeated requests (saved profiles,
+page refreshes, zodiac toggles) can skip SPICE entirely. Entries are evicted
+least-recently-used when either the entry count or the approximate memory
+bound is exceeded.
+
+House cusps and time resolution use the same cache under their own key
+namespaces. An optional SharedCache tier lets a miss in one HTTP worker be a
+hit from another and keeps results across restarts. Its SQLite I/O blocks, so
+async handlers use get_async/put_async, which run it in a thread.
+"""
+
+import asyncio
+import hashlib
+import pickle
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+from models import ChartRequest, HousesRequest, TimeResolveRequest
+from shared_cache import SharedCache
+
+# Coordinate quantization for cache keys: 1e-6° is ~0.1 m on the ground and 1 cm
+# of elevation, both far below what changes a position at 6-decimal output
+COORD_DECIMALS = 6
+ELEVATION_DECIMALS = 2
+
+
+def chart_cache_key(
+    chart: ChartRequest, kernel_set_tag: str, service_version: str, speed_method: str
+) -> Hashable:
+    """
+    Canonical key for a chart request.
+
+    birth_time is already normalized to UTC by the model, so equivalent instants
+    given in different offsets share a key. The ayanamsa is dropped for tropical
+    charts, where it does not affect the result. speed_method (SPEED_METHOD) is
+    part of the key because it changes the speeds, so processes configured
+    differently never share entries through the shared tier.
+    """
+    return (
+        "chart",
+        kernel_set_tag,
+        service_version,
+        speed_method,
+        chart.birth_time.isoformat(),
+        round(chart.latitude, COORD_DECIMALS) + 0.0,
+        round(chart.longitude, COORD_DECIMALS) + 0.0,
+        round(chart.elevation, ELEVATION_DECIMALS) + 0.0,
+        chart.zodiac,
+        chart.ayanamsa if chart.zodiac == "sidereal" else None,
+        tuple(chart.bodies),
+        chart.precision,
+    )
+
+
+def houses_cache_key(req: HousesRequest, kernel_set_tag: str, service_version: str) -> Hashable:
+    """Canonical key for a house cusp request (same rules as chart_cache_key)"""
+    return (
+        "houses",
+        kernel_set_tag,
+        service_version,
+        req.birth_time.isoformat(),
+        round(req.latitude, COORD_DECIMALS) + 0.0,
+        round(req.longitude, COORD_DECIMALS) + 0.0,
+        round(req.elevation, ELEVATION_DECIMALS) + 0.0,
+        req.zodiac,
+        req.ayanamsa if req.zodiac == "sidereal" else None,
+        req.system,
+        req.mc_hemisphere,
+    )
+
+
+def time_cache_key(req: TimeResolveRequest, tz_version: str, service_version: str) -> Hashable:
+    """Canonical key for a time resolution request, tied to the timezone database version"""
+    return (
+        "time",
+        tz_version,
+        service_version,
+        req.local_datetime.strip(),
+        round(req.latitude, COORD_DECIMALS) + 0.0,
+        round(req.longitude, COORD_DECIMALS) + 0.0,
+        req.timezone_override,
+    )
+
+
+def _shared_key(key: Hashable) -> str:
+    """Stable string form of a key for the shared tier (keys hold only str/float/None)"""
+    return hashlib.sha256(repr(key).encode()).hexdigest()
+
+
+class ResultCache:
+    """
+    Size- and memory-bounded LRU cache.
+
+    Args:
+        max_entries: Maximum number of cached results (0 disables the cache)
+        max_bytes: Approximate memory bound, measured as each value's pickled size
+        shared: Optional node-wide tier consulted on a miss and written on put
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 4096,
+        max_bytes: int = 32 * 1024 * 1024,
+        shared: SharedCache | None = None,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.shared = shared
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.shared_hits = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.max_bytes > 0
+
+    def get(self, key: Hashable) -> Any | None:
+        """Cached value for key (marking it most recently used), or None"""
+        value = self._memory_get(key)
+        if value is None and self.shared is not None:
+            value = self._shared_value(key, self.shared.get(_shared_key(key)))
+        if value is None:
+            self.misses += 1
+        return value
+
+    async def get_async(self, key: Hashable) -> Any | None:
+        """get() with the shared tier lookup in a thread, off the event loop"""
+        value = self._memory_get(key)
+        if value is None and self.shared is not None:
+            blob = await asyncio.to_thread(self.shared.get, _shared_key(key))
+            value = self._shared_value(key, blob)
+        if value is None:
+            self.misses += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store value in memory and the shared tier, evicting LRU entries to stay within bounds"""
+        if not self.enabled and self.shared is None:
+            return
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if self.shared is not None:
+            self.shared.put(_shared_key(key), blob)
+        self._store(key, value, len(blob))
+
+    async def put_async(self, key: Hashable, value: Any) -> None:
+        """put() with the shared tier write in a thread, off the event loop"""
+        if not self.enabled and self.shared is None:
+            return
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        self._store(key, value, len(blob))
+        if self.shared is not None:
+            await asyncio.to_thread(self.shared.put, _shared_key(key), blob)
+
+    def _memory_get(self, key: Hashable) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def _shared_value(self, key: Hashable, blob: bytes | None) -> Any | None:
+        """Decode a shared-tier blob and keep it in memory; None if absent or unreadable"""
+        if blob is None:
+            return None
+        try:
+            # The shared file is private to this service and holds only our own pickles
+            value = pickle.loads(blob)  # nosec B301
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, TypeError):
+            return None  # written by an incompatible build; recompute
+        self.shared_hits += 1
+        self._store(key, value, len(blob))
+        return value
+
+    def _store(self, key: Hashable, value: Any, size: int) -> None:
+        if not self.enabled or size > self.max_bytes:
+            return
+
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old[1]
+        self._entries[key] = (value, size)
+        self._bytes += size
+
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._bytes -= evicted_size
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Counters and current occupancy for /metrics"""
+        lookups = self.hits + self.shared_hits + self.misses
+        return {
+            "hits": self.hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round((self.hits + self.shared_hits) / lookups, 4) if lookups else 0.0,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "shared": self.shared.stats() if self.shared is not None else None,
+        }
@@ -0,0 +1,169 @@
+"""
+Node-local result cache shared by all HTTP workers.
+
+Each gunicorn worker has its own ResultCache, so with WORKERS > 1 hit rates
+drop and every restart starts cold. This tier is an SQLite file in WAL mode:
+readers never block each other or the writer, every worker on the node sees
+the same entries, and the file survives restarts. It stores opaque blobs under
+string keys; ResultCache handles keying and (de)serialization.
+
+The cache is best-effort: any SQLite or I/O error (locked, corrupt, disk full) is
+counted and treated as a miss so a request never fails because of it.
+
+Calls block on SQLite: at most busy_timeout_s waiting for another worker's
+write lock, plus the I/O itself. ResultCache.get_async/put_async run them in a
+thread so a contended file never stalls the event loop.
+"""
+
+import contextlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Any
+
+# Seconds between access-time updates on hits (LRU order is approximate)
+TOUCH_INTERVAL_S = 60.0
+
+# Size check runs every N writes; trimming goes down to this fraction of the bound
+TRIM_EVERY = 64
+TRIM_TARGET = 0.9
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed);
+"""
+
+
+class SharedCache:
+    """
+    Size-bounded key/blob store in an SQLite WAL file.
+
+    Args:
+        path: SQLite file; created (with parent directory) if missing
+        max_bytes: Total value bytes kept before least-recently-used entries are trimmed
+        busy_timeout_s: How long a write waits for another worker's lock before giving up
+            (SQLite busy_timeout); keep it short, callers wait this long at worst
+    """
+
+    def __init__(
+        self, path: str, max_bytes: int = 256 * 1024 * 1024, busy_timeout_s: float = 0.05
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.busy_timeout_s = busy_timeout_s
+        self._conn: sqlite3.Connection | None = None
+        self._pid: int | None = None
+        self._lock = threading.Lock()
+        self._writes_since_trim = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.errors = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        """Per-process connection; reopened after fork so workers never share a handle"""
+        if self._conn is None or self._pid != os.getpid():
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(
+                self.path,
+                timeout=self.busy_timeout_s,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    def get(self, key: str) -> bytes | None:
+        """Stored blob for key, or None on a miss or any SQLite error"""
+        now = time.time()
+        with self._lock:
+            try:
+                conn = self._connection()
+                row = conn.execute(
+                    "SELECT value, accessed FROM results WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    self.misses += 1
+                    return None
+                if row[1] < now - TOUCH_INTERVAL_S:
+                    # The access time is advisory; a busy writer never turns a hit into a miss
+                    with contextlib.suppress(sqlite3.OperationalError):
+                        conn.execute("UPDATE results SET accessed = ? WHERE key = ?", (now, key))
+            except (sqlite3.Error, OSError):
+                self.errors += 1
+                return None
+        self.hits += 1
+        value: bytes = row[0]
+        return value
+
+    def put(self, key: str, value: bytes) -> None:
+        """Store value under key; trims the file back under max_bytes periodically"""
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            try:
+                conn = self._connection()
+                conn.execute(
+                    "INSERT OR REPLACE INTO results (key, value, size, accessed) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, value, len(value), time.time()),
+                )
+                self._writes_since_trim += 1
+                if self._writes_since_trim >= TRIM_EVERY:
+                    self._writes_since_trim = 0
+                    self._trim(conn)
+            except (sqlite3.Error, OSError):
+                self.errors += 1
+
+    def _trim(self, conn: sqlite3.Connection) -> None:
+        """Delete least-recently-used entries until the total is under TRIM_TARGET of the bound"""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        excess = total - int(self.max_bytes * TRIM_TARGET)
+        doomed = []
+        for key, size in conn.execute("SELECT key, size FROM results ORDER BY accessed"):
+            if excess <= 0:
+                break
+            doomed.append((key,))
+            excess -= size
+        conn.executemany("DELETE FROM results WHERE key = ?", doomed)
+        self.evictions += len(doomed)
+
+    def stats(self) -> dict[str, Any]:
+        """This worker's counters plus the file's current occupancy"""
+        entries = size = None
+        with self._lock:
+            try:
+                entries, size = (
+                    self._connection()
+                    .execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results")
+                    .fetchone()
+                )
+            except (sqlite3.Error, OSError):
+                self.errors += 1
+        return {
+            "path": self.path,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "errors": self.errors,
+            "entries": entries,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
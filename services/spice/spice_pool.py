@@ -0,0 +1,297 @@
+"""
+Pool of single-threaded SPICE worker processes.
+
+CSPICE is not thread-safe, so SPICE work cannot move to threads. Instead each
+worker process loads the kernels once (via the initializer) and serves one call
+at a time over a pipe. The FastAPI layer awaits results without blocking the
+event loop, so /health and light requests stay responsive while a batch runs.
+
+- Bounded: at most ``size + max_queue`` calls are admitted; more raise SpicePoolBusy
+- Timeouts: a call exceeding its timeout raises SpiceCallTimeout; the worker is
+  killed (CSPICE calls cannot be interrupted) and a fresh one is started
+- Crashes: a worker that dies mid-call raises SpiceWorkerError and is replaced
+- Cancellation: a caller cancelled mid-call (e.g. client disconnect) also gets
+  its worker replaced, so the abandoned reply never reaches the next caller
+
+Functions and arguments are pickled, so callables must be module-level.
+"""
+
+import asyncio
+import multiprocessing
+import pickle
+import time
+from collections.abc import Callable
+from multiprocessing.connection import Connection
+from typing import Any
+
+
+class SpicePoolBusy(Exception):
+    """Raised when the pool's bounded queue is full."""
+
+
+class SpiceCallTimeout(Exception):
+    """Raised when a SPICE call exceeds its timeout."""
+
+
+class SpiceWorkerError(Exception):
+    """Raised when a worker fails in a way that cannot be re-raised as-is."""
+
+
+def _portable_exception(
+    e: BaseException,
+) -> tuple[type[BaseException], tuple[Any, ...], dict[str, Any]]:
+    """
+    (class, args, attributes) for re-raising e in the parent.
+
+    Many exceptions (HTTPException, SpiceyError) take keyword-only or extra
+    constructor arguments and do not round-trip through pickle; rebuilding from
+    __dict__ avoids calling their __init__. Unpicklable ones become SpiceWorkerError.
+    """
+    parts = (type(e), e.args, dict(getattr(e, "__dict__", {})))
+    try:
+        pickle.dumps(parts)
+        return parts
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return (SpiceWorkerError, (str(e),), {})
+
+
+def _rebuild_exception(
+    parts: tuple[type[BaseException], tuple[Any, ...], dict[str, Any]],
+) -> BaseException:
+    cls, args, state = parts
+    exc: BaseException = cls.__new__(cls)
+    exc.args = args
+    exc.__dict__.update(state)
+    return exc
+
+
+def _worker_main(conn: Connection, initializer: Callable[[], None] | None) -> None:
+    """Worker loop: initialize once, then run (fn, args) requests until the pipe closes"""
+    try:
+        if initializer is not None:
+            initializer()
+        conn.send(("ready", None))
+    except BaseException as e:
+        # Report the init failure to the parent; the worker then exits with it
+        conn.send(("init_error", str(e)))
+        raise
+
+    while True:
+        try:
+            fn, args = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            return
+        try:
+            conn.send(("ok", fn(*args)))
+        except KeyboardInterrupt:
+            return
+        except Exception as e:  # noqa: BLE001 - whatever fn raised is re-raised in the caller
+            conn.send(("error", _portable_exception(e)))
+
+
+class _Worker:
+    """One worker process and the parent end of its pipe."""
+
+    def __init__(self, ctx: Any, initializer: Callable[[], None] | None):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_worker_main, args=(child_conn, initializer), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+
+    async def _receive(self, timeout: float | None) -> tuple[str, Any]:
+        """Wait for the next message without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        readable: asyncio.Future[None] = loop.create_future()
+        fd = self.conn.fileno()
+
+        def wake() -> None:
+            if not readable.done():
+                readable.set_result(None)
+
+        loop.add_reader(fd, wake)
+        try:
+            await asyncio.wait_for(readable, timeout)
+        finally:
+            loop.remove_reader(fd)
+        try:
+            message: tuple[str, Any] = self.conn.recv()
+        except (EOFError, OSError) as e:
+            raise SpiceWorkerError(f"SPICE worker exited: {e}") from e
+        return message
+
+    async def wait_ready(self, timeout: float) -> None:
+        status, payload = await self._receive(timeout)
+        if status != "ready":
+            raise SpiceWorkerError(f"SPICE worker failed to initialize: {payload}")
+
+    async def call(
+        self, fn: Callable[..., Any], args: tuple[Any, ...], timeout: float
+    ) -> tuple[str, Any]:
+        """Send one call and wait for its ("ok", result) or ("error", exception parts) reply"""
+        try:
+            self.conn.send((fn, args))
+        except (BrokenPipeError, OSError) as e:
+            raise SpiceWorkerError(f"SPICE worker unavailable: {e}") from e
+        return await self._receive(timeout)
+
+    def kill(self) -> None:
+        try:
+            self.conn.close()
+        finally:
+            if self.process.is_alive():
+                self.process.kill()
+            self.process.join(timeout=5)
+
+
+class SpicePool:
+    """
+    Fixed-size pool of SPICE worker processes with a bounded admission queue.
+
+    Args:
+        size: Number of worker processes
+        initializer: Module-level callable run once in each worker (e.g. furnsh)
+        max_queue: Calls allowed to wait for a free worker beyond ``size`` running
+        timeout_s: Default per-call timeout in seconds
+        start_method: multiprocessing start method; "spawn" keeps workers free of
+            the parent's CSPICE and event-loop state
+        init_timeout_s: Time allowed for a worker to load kernels
+    """
+
+    def __init__(
+        self,
+        size: int,
+        initializer: Callable[[], None] | None = None,
+        max_queue: int = 64,
+        timeout_s: float = 25.0,
+        start_method: str = "spawn",
+        init_timeout_s: float = 120.0,
+    ):
+        if size < 1:
+            raise ValueError("SPICE pool size must be at least 1")
+        self.size = size
+        self.max_queue = max_queue
+        self.timeout_s = timeout_s
+        self.init_timeout_s = init_timeout_s
+        self._initializer = initializer
+        self._ctx = multiprocessing.get_context(start_method)
+        self._idle: asyncio.Queue[_Worker] = asyncio.Queue()
+        self._workers: set[_Worker] = set()
+        self._admitted = 0
+        self._closed = False
+        self.counters = {"calls": 0, "rejected": 0, "timeouts": 0, "restarts": 0}
+
+    async def start(self) -> None:
+        """Start all workers and wait until each has loaded its kernels."""
+        workers = [_Worker(self._ctx, self._initializer) for _ in range(self.size)]
+        self._workers.update(workers)
+        try:
+            await asyncio.gather(*(w.wait_ready(self.init_timeout_s) for w in workers))
+        except BaseException:
+            self.close()
+            raise
+        for w in workers:
+            self._idle.put_nowait(w)
+
+    async def run(self, fn: Callable[..., Any], *args: Any, timeout: float | None = None) -> Any:
+        """
+        Run fn(*args) in a worker process.
+
+        Raises:
+            SpicePoolBusy: The bounded queue is full
+            SpiceCallTimeout: The call exceeded its timeout (worker is replaced)
+            SpiceWorkerError: The worker died or raised an unpicklable exception
+            Exception: Whatever fn raised, re-raised in the caller
+        """
+        if self._closed:
+            raise SpiceWorkerError("SPICE pool is closed")
+        if self._admitted >= self.size + self.max_queue:
+            self.counters["rejected"] += 1
+            raise SpicePoolBusy("SPICE worker queue is full")
+
+        self._admitted += 1
+        self.counters["calls"] += 1
+        deadline = time.monotonic() + (timeout if timeout is not None else self.timeout_s)
+        try:
+            try:
+                worker = await asyncio.wait_for(
+                    self._idle.get(), max(deadline - time.monotonic(), 0.0)
+                )
+            except TimeoutError as e:
+                self.counters["timeouts"] += 1
+                raise SpiceCallTimeout("Timed out waiting for a SPICE worker") from e
+
+            try:
+                status, payload = await worker.call(
+                    fn, args, max(deadline - time.monotonic(), 0.0)
+                )
+            except TimeoutError as e:
+                self.counters["timeouts"] += 1
+                self._replace(worker)
+                raise SpiceCallTimeout("SPICE call timed out") from e
+            except BaseException:
+                # The worker died, or this caller was cancelled while it computes:
+                # the reply would reach whoever called next, so the worker goes
+                self._replace(worker)
+                raise
+            # A reply, result or exception raised by fn, means the worker is free
+            self._idle.put_nowait(worker)
+            if status == "error":
+                raise _rebuild_exception(payload)
+            return payload
+        finally:
+            self._admitted -= 1
+
+    def _replace(self, worker: _Worker) -> None:
+        """Kill a stuck/dead worker and start a replacement in the background."""
+        self._workers.discard(worker)
+        worker.kill()
+        if self._closed:
+            return
+        self.counters["restarts"] += 1
+        replacement = _Worker(self._ctx, self._initializer)
+        self._workers.add(replacement)
+        asyncio.get_running_loop().create_task(self._admit_when_ready(replacement))
+
+    async def _admit_when_ready(self, worker: _Worker) -> None:
+        try:
+            await worker.wait_ready(self.init_timeout_s)
+        except (SpiceWorkerError, TimeoutError) as e:
+            print(f"✗ SPICE worker restart failed: {e}")
+            self._workers.discard(worker)
+            worker.kill()
+            return
+        self._idle.put_nowait(worker)
+
+    def stats(self) -> dict[str, Any]:
+        """Pool size, current load and lifetime counters"""
+        return {
+            "size": self.size,
+            "alive": sum(1 for w in self._workers if w.process.is_alive()),
+            "idle": self._idle.qsize(),
+            "in_flight": self._admitted,
+            "max_queue": self.max_queue,
+            "timeout_s": self.timeout_s,
+            **self.counters,
+        }
+
+    def close(self) -> None:
+        """Terminate all workers."""
+        self._closed = True
+        for w in list(self._workers):
+            w.kill()
+        self._workers.clear()
+
+
+_pool: SpicePool | None = None
+
+
+def set_pool(pool: SpicePool | None) -> None:
+    global _pool
+    _pool = pool
+
+
+def get_pool() -> SpicePool | None:
+    """The process-wide pool, or None when SPICE runs in the serving process."""
+    return _pool
@@ -0,0 +1,371 @@
+"""
+Prometheus-style counters and fixed-bucket histograms shared across workers.
+
+Every update is O(1): a counter add, or one bucket plus _sum/_count for a
+histogram observation. With TELEMETRY_DIR set, each process keeps its values in
+its own memory-mapped file in that directory and readers sum all files, so
+/metrics reports the whole gunicorn node no matter which worker answers (the
+same scheme as prometheus_client's multiprocess mode, without the dependency).
+Without a directory, values live in process memory.
+
+Files of exited workers keep counting, which keeps counters monotonic; point
+TELEMETRY_DIR at a directory that is empty when the server starts.
+"""
+
+import glob
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Collection, Iterable, Iterator
+from typing import Any
+
+# Upper bounds (seconds) of latency histogram buckets; +Inf is implicit
+LATENCY_BUCKETS_S = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+# name -> (type, help) for every exported metric
+METRICS: dict[str, tuple[str, str]] = {
+    "spice_http_requests_total": ("counter", "HTTP requests by endpoint and outcome"),
+    "spice_http_request_duration_seconds": (
+        "histogram",
+        "HTTP request latency by endpoint and outcome",
+    ),
+    "spice_body_duration_seconds": (
+        "histogram",
+        "SPICE time per body on the research path",
+    ),
+    "spice_stage_duration_seconds": (
+        "histogram",
+        "Time per pipeline stage per request (see Server-Timing)",
+    ),
+    "spice_calls_total": ("counter", "CSPICE calls made while serving requests"),
+    "spice_spkinsuffdata_errors_total": (
+        "counter",
+        "Calculations that failed for lack of ephemeris coverage",
+    ),
+}
+
+_INITIAL_FILE_SIZE = 64 * 1024
+_HEADER = struct.Struct("i4x")  # bytes used, padded to 8
+
+
+def _key(name: str, labels: dict[str, str]) -> str:
+    return json.dumps([name, sorted(labels.items())])
+
+
+def _outcome(status_code: int) -> str:
+    if status_code >= 500:
+        return "server_error"
+    if status_code >= 400:
+        return "client_error"
+    return "ok"
+
+
+class _MemoryValues:
+    """Values of a single process held in a dict"""
+
+    def __init__(self) -> None:
+        self._values: dict[str, float] = {}
+
+    def get(self, key: str) -> float:
+        return self._values.get(key, 0.0)
+
+    def set(self, key: str, value: float) -> None:
+        self._values[key] = value
+
+    def items(self) -> Iterator[tuple[str, float]]:
+        return iter(list(self._values.items()))
+
+
+class _FileValues:
+    """
+    Values of a single process in a memory-mapped file.
+
+    Layout: 8-byte header (bytes used), then entries of
+    [int32 key length][utf-8 key padded to 8][float64 value]. Entries are only
+    appended, and the header is updated after an entry is complete, so other
+    processes can read the file at any time.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "a+b")  # noqa: SIM115 - kept open for the mmap
+        if os.fstat(self._file.fileno()).st_size == 0:
+            self._file.truncate(_INITIAL_FILE_SIZE)
+        self._capacity = os.fstat(self._file.fileno()).st_size
+        self._map = mmap.mmap(self._file.fileno(), self._capacity)
+        self._used = _HEADER.unpack_from(self._map, 0)[0] or _HEADER.size
+        self._positions = {key: pos for key, pos, _ in _entries(self._map, self._used)}
+
+    def get(self, key: str) -> float:
+        pos = self._positions.get(key)
+        return struct.unpack_from("d", self._map, pos)[0] if pos is not None else 0.0
+
+    def set(self, key: str, value: float) -> None:
+        pos = self._positions.get(key)
+        if pos is None:
+            pos = self._append(key)
+        struct.pack_into("d", self._map, pos, value)
+
+    def items(self) -> Iterator[tuple[str, float]]:
+        for key, _, value in _entries(self._map, self._used):
+            yield key, value
+
+    def _append(self, key: str) -> int:
+        encoded = key.encode()
+        padded = encoded + b" " * (8 - (len(encoded) + 4) % 8)
+        entry = struct.pack(f"i{len(padded)}sd", len(encoded), padded, 0.0)
+        while self._used + len(entry) > self._capacity:
+            self._capacity *= 2
+            self._map.close()
+            self._file.truncate(self._capacity)
+            self._map = mmap.mmap(self._file.fileno(), self._capacity)
+        self._map[self._used : self._used + len(entry)] = entry
+        self._used += len(entry)
+        _HEADER.pack_into(self._map, 0, self._used)
+        pos = self._used - 8
+        self._positions[key] = pos
+        return pos
+
+
+def _entries(data: Any, used: int) -> Iterator[tuple[str, int, float]]:
+    """(key, value offset, value) for each entry of a values file"""
+    pos = _HEADER.size
+    while pos < used:
+        (length,) = struct.unpack_from("i", data, pos)
+        padded = length + (8 - (length + 4) % 8)
+        key = bytes(data[pos + 4 : pos + 4 + length]).decode()
+        value_pos = pos + 4 + padded
+        yield key, value_pos, struct.unpack_from("d", data, value_pos)[0]
+        pos = value_pos + 8
+
+
+def _read_file(path: str) -> Iterator[tuple[str, float]]:
+    """Entries of another process's values file (read-only snapshot)"""
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < _HEADER.size:
+        return
+    used = min(_HEADER.unpack_from(data, 0)[0], len(data))
+    for key, _, value in _entries(data, used):
+        yield key, value
+
+
+class Telemetry:
+    """
+    Counters, histograms and a short sliding window for the JSON /metrics summary.
+
+    Args:
+        directory: Shared directory for per-process value files (None = in memory)
+        window_minutes: Length of the error-rate window in the JSON summary
+    """
+
+    def __init__(self, directory: str | None = None, window_minutes: int = 5):
+        self.directory = directory
+        self.window_minutes = window_minutes
+        self._slots = window_minutes + 1
+        self._lock = threading.Lock()
+        self._values: _MemoryValues | _FileValues | None = None
+        self._pid: int | None = None
+
+    def _store(self) -> _MemoryValues | _FileValues:
+        """This process's values; a forked worker gets its own file"""
+        if self._values is None or self._pid != os.getpid():
+            if self.directory:
+                os.makedirs(self.directory, exist_ok=True)
+                path = os.path.join(self.directory, f"telemetry_{os.getpid()}.db")
+                self._values = _FileValues(path)
+            else:
+                self._values = _MemoryValues()
+            self._pid = os.getpid()
+        return self._values
+
+    def inc(self, name: str, labels: dict[str, str], amount: float = 1.0) -> None:
+        key = _key(name, labels)
+        with self._lock:
+            store = self._store()
+            store.set(key, store.get(key) + amount)
+
+    def observe(self, name: str, labels: dict[str, str], value: float) -> None:
+        """Add one observation to a histogram (one bucket, _sum and _count)"""
+        le = next((b for b in LATENCY_BUCKETS_S if value <= b), None)
+        bucket = _key(f"{name}_bucket", {**labels, "le": repr(le) if le else "+Inf"})
+        total = _key(f"{name}_sum", labels)
+        count = _key(f"{name}_count", labels)
+        with self._lock:
+            store = self._store()
+            for key, amount in ((bucket, 1.0), (total, value), (count, 1.0)):
+                store.set(key, store.get(key) + amount)
+
+    def record_request(
+        self, endpoint: str, status_code: int, seconds: float, summarize: bool = True
+    ) -> None:
+        """Count and time one HTTP request; summarize=False keeps it out of the JSON window"""
+        labels = {"endpoint": endpoint, "outcome": _outcome(status_code)}
+        self.inc("spice_http_requests_total", labels)
+        self.observe("spice_http_request_duration_seconds", labels, seconds)
+        if summarize:
+            self._window_add(requests=1.0, errors=1.0 if status_code >= 400 else 0.0)
+
+    def record_spkinsuffdata(self) -> None:
+        self.inc("spice_spkinsuffdata_errors_total", {})
+        self._window_add(spkinsuffdata=1.0)
+
+    def _window_add(self, **amounts: float) -> None:
+        """Per-minute ring of summary counters; a slot is reset when its minute comes round"""
+        minute = int(time.time() // 60)
+        slot = str(minute % self._slots)
+        minute_key = _key("_window_minute", {"slot": slot})
+        with self._lock:
+            store = self._store()
+            if store.get(minute_key) != minute:
+                store.set(minute_key, float(minute))
+                for field in ("requests", "errors", "spkinsuffdata"):
+                    store.set(_key(f"_window_{field}", {"slot": slot}), 0.0)
+            for field, amount in amounts.items():
+                key = _key(f"_window_{field}", {"slot": slot})
+                store.set(key, store.get(key) + amount)
+
+    def _sources(self) -> Iterable[Iterator[tuple[str, float]]]:
+        if self.directory:
+            with self._lock:
+                self._store()  # make sure this process's file exists
+            return [_read_file(p) for p in glob.glob(os.path.join(self.directory, "*.db"))]
+        with self._lock:
+            return [self._store().items()]
+
+    def collect(self) -> dict[str, float]:
+        """Exported series summed over all processes (window slots excluded)"""
+        totals: dict[str, float] = defaultdict(float)
+        for source in self._sources():
+            for key, value in source:
+                if not key.startswith('["_'):
+                    totals[key] += value
+        return dict(totals)
+
+    def window(self) -> dict[str, float]:
+        """Summary counters of the last window_minutes, summed over all processes"""
+        oldest = int(time.time() // 60) - self.window_minutes + 1
+        sums = {"requests": 0.0, "errors": 0.0, "spkinsuffdata": 0.0}
+        for source in self._sources():
+            slots: dict[str, dict[str, float]] = defaultdict(dict)
+            for key, value in source:
+                if key.startswith('["_window_'):
+                    name, labels = json.loads(key)
+                    slots[dict(labels)["slot"]][name[len("_window_") :]] = value
+            for values in slots.values():
+                if values.get("minute", 0.0) >= oldest:
+                    for field in sums:
+                        sums[field] += values.get(field, 0.0)
+        return sums
+
+    def histogram(
+        self, name: str, exclude: dict[str, Collection[str]] | None = None
+    ) -> list[tuple[float, float]]:
+        """Cumulative (upper bound, count) of a histogram summed over matching label sets"""
+        per_bound: dict[float, float] = defaultdict(float)
+        for key, value in self.collect().items():
+            metric, labels = json.loads(key)
+            if metric != f"{name}_bucket":
+                continue
+            label_map: dict[str, str] = dict(labels)
+            if exclude and any(label_map.get(k) in v for k, v in exclude.items()):
+                continue
+            per_bound[float(label_map["le"])] += value
+        cumulative, running = [], 0.0
+        for bound in (*LATENCY_BUCKETS_S, float("inf")):
+            running += per_bound.get(bound, 0.0)
+            cumulative.append((bound, running))
+        return cumulative
+
+    def render(self) -> str:
+        """All exported metrics in Prometheus text exposition format (0.0.4)"""
+        by_metric: dict[str, list[tuple[str, dict[str, str], float]]] = defaultdict(list)
+        for key, value in self.collect().items():
+            series, labels = json.loads(key)
+            base = next(
+                (m for m in METRICS if series in (m, f"{m}_bucket", f"{m}_sum", f"{m}_count")),
+                series,
+            )
+            by_metric[base].append((series, dict(labels), value))
+
+        lines = []
+        for base, (kind, help_text) in METRICS.items():
+            lines.append(f"# HELP {base} {help_text}")
+            lines.append(f"# TYPE {base} {kind}")
+            samples = by_metric.get(base, [])
+            if kind == "histogram":
+                samples = _cumulative_buckets(base, samples)
+            for series, labels, value in sorted(samples, key=_sample_order):
+                lines.append(f"{series}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _cumulative_buckets(
+    base: str, samples: list[tuple[str, dict[str, str], float]]
+) -> list[tuple[str, dict[str, str], float]]:
+    """Stored buckets are per-bucket counts; Prometheus wants cumulative ones with every le"""
+    counts: dict[tuple[tuple[str, str], ...], dict[str, float]] = defaultdict(dict)
+    out = []
+    for series, labels, value in samples:
+        if series == f"{base}_bucket":
+            le = labels.pop("le")
+            counts[tuple(sorted(labels.items()))][le] = value
+        else:
+            out.append((series, labels, value))
+    for label_items, per_le in counts.items():
+        running = 0.0
+        for bound in (*(repr(b) for b in LATENCY_BUCKETS_S), "+Inf"):
+            running += per_le.get(bound, 0.0)
+            out.append((f"{base}_bucket", {**dict(label_items), "le": bound}, running))
+    return out
+
+
+def _sample_order(sample: tuple[str, dict[str, str], float]) -> tuple[Any, ...]:
+    series, labels, _ = sample
+    le = labels.get("le")
+    bound = float("inf") if le == "+Inf" else float(le) if le is not None else -1.0
+    rest = sorted((k, v) for k, v in labels.items() if k != "le")
+    return (rest, series, bound)
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        (k, v.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'))
+        for k, v in labels.items()
+    )
+    return "{" + ",".join(f'{k}="{v}"' for k, v in escaped) + "}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def quantile(q: float, buckets: list[tuple[float, float]]) -> float:
+    """
+    Estimate the q-quantile from cumulative buckets, interpolating linearly
+    within the bucket (as PromQL histogram_quantile does).
+    """
+    total = buckets[-1][1] if buckets else 0.0
+    if total == 0:
+        return 0.0
+    rank = q * total
+    lower_bound, lower_count = 0.0, 0.0
+    for bound, count in buckets:
+        if count >= rank:
+            if bound == float("inf"):
+                return lower_bound
+            if count == lower_count:
+                return bound
+            return lower_bound + (bound - lower_bound) * (rank - lower_count) / (
+                count - lower_count
+            )
+        lower_bound, lower_count = bound, count
+    return lower_bound
@@ -0,0 +1,85 @@
+"""
+Tests for astrocartography lines (astrocartography.py, /v1/astrocartography)
+
+A body on the ecliptic must sit exactly on the house ASC/DSC along its
+ASC/DSC lines and culminate (LST = RA) along its MC line. The endpoint test
+uses the repo's leapseconds/PCK kernels and a small synthetic SPK, so it runs
+without DE440.
+"""
+
+import json
+import os
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+# Disable rate limiting for tests
+os.environ["DISABLE_RATE_LIMIT"] = "1"
+
+import main
+from astrocartography import (
+    equatorial_from_ecliptic,
+    horizon_longitudes,
+    line_pieces,
+    meridian_longitudes,
+)
+from epoch import epoch_context
+from houses import _asc_mc_tropical_and_sidereal
+
+
+def _gap(a: float, b: float) -> float:
+    return abs((a - b + 180.0) % 360.0 - 180.0)
+
+def test_lines_match_house_angles(kernels: None) -> None:
+    """Along its lines an ecliptic body is the house ASC/DSC, and culminates on the MC"""
+    ctx = epoch_context("1987-11-03T06:30:00Z", "lahiri", main.calculate_ayanamsa)
+    ecl_lon = np.arange(0.0, 360.0, 7.3)
+    ra, dec = equatorial_from_ecliptic(ecl_lon, np.zeros_like(ecl_lon), ctx.eps_deg)
+    lats = np.linspace(-60.0, 60.0, 25)
+    asc, dsc = horizon_longitudes(ra, dec, ctx.gmst_deg, lats)
+    mc, _ = meridian_longitudes(ra, ctx.gmst_deg)
+
+    for b, target in enumerate(ecl_lon):
+        assert _gap(_asc_mc_tropical_and_sidereal(ctx, 0.0, mc[b])["lst_deg"], ra[b]) < 1e-9
+        for j, lat in enumerate(lats):
+            rising = _asc_mc_tropical_and_sidereal(ctx, lat, asc[b, j])["asc_tropical"]
+            setting = _asc_mc_tropical_and_sidereal(ctx, lat, dsc[b, j])["asc_tropical"]
+            assert _gap(rising, target) < 1e-9
+            assert _gap(setting + 180.0, target) < 1e-9
+
+def test_circumpolar_latitudes_have_no_horizon_line() -> None:
+    asc, dsc = horizon_longitudes(np.array([0.0]), np.array([20.0]), 0.0, np.array([69.0, 71.0]))
+    assert not np.isnan(asc[0, 0]) and np.isnan(asc[0, 1]) and np.isnan(dsc[0, 1])
+
+def test_line_pieces_split_at_gaps_and_antimeridian() -> None:
+    lat = np.arange(11.0)
+    lon = np.array([170, 175, 179, -177, -172, np.nan, np.nan, 10, 11, 12, 13.0])
+    pieces = [p.tolist() for p in line_pieces(lat, lon)]
+    assert pieces == [
+        [[170.0, 0.0], [175.0, 1.0], [179.0, 2.0], [180.0, 2.25]],
+        [[-180.0, 2.25], [-177.0, 3.0], [-172.0, 4.0]],
+        [[10.0, 7.0], [11.0, 8.0], [12.0, 9.0], [13.0, 10.0]],
+    ]
+
+def test_endpoint_streams_geojson(kernels: None, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Chunked lines form one valid FeatureCollection within the latitude limit"""
+    monkeypatch.setattr(main, "ASTROCARTOGRAPHY_CHUNK_ROWS", 64)
+    body = {"birth_time": "2024-06-21T18:00:00Z", "bodies": ["Sun", "Moon"], "resolution_deg": 1}
+    r = TestClient(main.app).post("/v1/astrocartography", json=body)
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("application/geo+json")
+
+    collection = json.loads(r.text)
+    assert collection["type"] == "FeatureCollection"
+    assert set(collection["meta"]["bodies"]) == {"Sun", "Moon"}
+    features = collection["features"]
+    kinds = {(f["properties"]["body"], f["properties"]["angle"]) for f in features}
+    assert kinds == {(b, a) for b in ("Sun", "Moon") for a in ("ASC", "DSC", "MC", "IC")}
+    for f in features:
+        coords = np.array(f["geometry"]["coordinates"])
+        assert len(coords) >= 2
+        assert np.all(np.abs(coords[:, 0]) <= 180.0) and np.all(np.abs(coords[:, 1]) <= 85.0)
+
+    r = TestClient(main.app).post("/v1/astrocartography", json={**body, "bodies": ["Pluto"]})
+    assert r.status_code == 422
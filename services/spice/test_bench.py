@@ -0,0 +1,41 @@
+"""
+Tests for the benchmark runner's measurement and regression check (tools/bench.py)
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "tools"))
+
+from bench import MIN_DELTA_US, compare_results, measure
+
+
+def results(**medians: float) -> dict:
+    return {"results": {name: {"median_us": us} for name, us in medians.items()}}
+
+def test_measure_reports_per_call_microseconds() -> None:
+    """Rounds are calibrated so fast calls repeat; stats are ordered"""
+    stats = measure(lambda: sum(range(100)), rounds=5, min_round_s=0.001)
+    assert stats["rounds"] == 5
+    assert stats["calls_per_round"] > 1
+    assert 0 < stats["min_us"] <= stats["median_us"] <= stats["p95_us"]
+
+def test_compare_flags_regressions_beyond_threshold() -> None:
+    """Slower than threshold → regression; faster → improvement; within → ok"""
+    rows = compare_results(
+        results(a=100.0, b=100.0, c=100.0),
+        results(a=130.0, b=110.0, c=60.0),
+        threshold=0.2,
+    )
+    status = {row["name"]: row["status"] for row in rows}
+    assert status == {"a": "regression", "b": "ok", "c": "improvement"}
+    assert abs(rows[0]["change"] - 0.3) < 1e-12
+
+def test_compare_ignores_sub_microsecond_jitter() -> None:
+    """Large relative changes on tiny timings are not regressions"""
+    rows = compare_results(results(a=1.0), results(a=1.0 + MIN_DELTA_US / 2), threshold=0.2)
+    assert rows[0]["status"] == "ok"
+
+def test_compare_reports_new_and_missing() -> None:
+    rows = compare_results(results(old=10.0), results(new=10.0))
+    assert [(row["name"], row["status"]) for row in rows] == [("new", "new"), ("old", "missing")]
@@ -82,6 +82,48 @@ def test_calculate_endpoint_contract() -> None:
         assert "detail" in data
         assert isinstance(data["detail"], str)
 
+def test_batch_calculate_endpoint_contract() -> None:
+    """Contract test: /v1/calculate/batch returns one item per chart, in input order"""
+    client = get_client()
+
+    chart = {
+        "birth_time": "2024-06-21T18:00:00Z",
+        "latitude": 37.7749,
+        "longitude": -122.4194,
+        "elevation": 50,
+        "ayanamsa": "lahiri"
+    }
+    payload = {"charts": [chart, {**chart, "zodiac": "tropical"}, {**chart, "birth_time": "2000-01-01T12:00:00Z"}]}
+
+    r = client.post("/v1/calculate/batch", json=payload)
+
+    # Per-chart failures never fail the whole batch
+    assert r.status_code == 200
+    data = r.json()
+    assert set(data.keys()) == {"results", "meta"}
+
+    results = data["results"]
+    assert [item["index"] for item in results] == [0, 1, 2]
+    assert [item["zodiac"] for item in results] == ["sidereal", "tropical", "sidereal"]
+
+    meta = data["meta"]
+    assert meta["count"] == 3
+    assert meta["failed"] == sum(1 for item in results if item["error"] is not None)
+
+    for item in results:
+        if item["error"] is None:
+            assert item["status_code"] == 200
+            assert set(item["data"].keys()) == {"Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn"}
+        else:
+            # Error item contract (no kernels loaded in tests)
+            assert item["data"] is None
+            assert isinstance(item["error"], str)
+            assert item["status_code"] in [400, 422, 500]
+
+    # Empty batches are a validation error
+    r = client.post("/v1/calculate/batch", json={"charts": []})
+    assert r.status_code == 422
+
 def test_health_endpoint_contract() -> None:
     """Contract test: /health endpoint format"""
     client = get_client()
@@ -167,7 +209,7 @@ def test_metrics_endpoint_contract() -> None:
     data = r.json()
 
     # Metrics endpoint contract
-    required_fields = {"latency", "errors", "timestamp", "alerts"}
+    required_fields = {"latency", "errors", "cache", "timestamp", "alerts"}
     assert set(data.keys()) == required_fields
 
     # Latency metrics contract
@@ -188,6 +230,16 @@ def test_metrics_endpoint_contract() -> None:
     assert isinstance(errors["error_rate"], (int, float))
     assert 0 <= errors["error_rate"] <= 1
 
+    # Result cache contract
+    cache = data["cache"]
+    cache_required = {
+        "hits", "shared_hits", "misses", "evictions", "hit_rate",
+        "entries", "bytes", "max_entries", "max_bytes", "shared"
+    }
+    assert set(cache.keys()) == cache_required
+    for counter in ("hits", "misses", "evictions"):
+        assert isinstance(cache[counter], int)
+
     # Alerts contract
     alerts = data["alerts"]
     alert_required = {"high_latency", "spkinsuffdata", "high_error_rate"}
@@ -0,0 +1,101 @@
+"""
+Tests for the shared per-request epoch context (epoch.py)
+
+Planets and houses computed from one EpochContext must equal what each
+computes on its own, and /v1/chart must convert the instant only once.
+Uses the repo's leapseconds/PCK kernels and a small synthetic SPK, so it runs
+without DE440.
+"""
+
+import os
+from datetime import datetime
+
+import spiceypy as spice
+from fastapi.testclient import TestClient
+
+# Disable rate limiting for tests
+os.environ["DISABLE_RATE_LIMIT"] = "1"
+
+import main
+from epoch import epoch_context
+from houses import _asc_mc_tropical_and_sidereal, _placidus_cusps
+from models import ChartRequest, HousesRequest, Zodiac
+from precession import ecliptic_matrix
+
+EPOCHS = ["1600-03-01T00:00:00Z", "1987-11-03T06:30:00Z", "2024-06-21T18:00:00Z"]
+LOCATIONS = [(51.5, -0.12), (-33.9, 151.2), (64.1, -21.9)]
+
+def test_context_matches_individual_computations(kernels_with_earth_model: None) -> None:
+    """Each field is what the planet and house code computed for themselves"""
+    ctx = epoch_context("2024-06-21T18:00:00Z", "fagan_bradley", main.calculate_ayanamsa)
+    assert ctx.et == spice.str2et("2024-06-21T18:00:00Z")
+    assert ctx.ayanamsa_deg == main.calculate_ayanamsa("fagan_bradley", ctx.et)
+    assert ctx.ecliptic_rotation is ecliptic_matrix(ctx.et)
+    assert abs(ctx.T - 0.2447) < 1e-3
+
+def test_shared_context_gives_identical_outputs(kernels_with_earth_model: None) -> None:
+    """Planets and houses from one context equal separately computed ones"""
+    zodiacs: tuple[Zodiac, ...] = ("tropical", "sidereal")
+    for epoch in EPOCHS:
+        birth_time = datetime.fromisoformat(epoch)
+        for lat, lon in LOCATIONS:
+            for zodiac in zodiacs:
+                chart_req = ChartRequest(
+                    birth_time=birth_time, latitude=lat, longitude=lon, elevation=0.0, zodiac=zodiac
+                )
+                houses_req = HousesRequest(
+                    birth_time=birth_time,
+                    latitude=lat,
+                    longitude=lon,
+                    elevation=0.0,
+                    zodiac=zodiac,
+                    system="placidus",
+                )
+
+                positions, houses = main._chart_sync(chart_req, houses_req)
+                assert positions.data == main._chart_positions_sync(chart_req).data
+                assert houses == main._houses_sync(houses_req)
+
+                ctx = main._epoch_context(chart_req.birth_time, chart_req.ayanamsa)
+                asc_mc = _asc_mc_tropical_and_sidereal(ctx, lat, lon)
+                assert _placidus_cusps(ctx, lat, lon, zodiac, asc_mc=asc_mc) == _placidus_cusps(
+                    ctx, lat, lon, zodiac
+                )
+
+def test_chart_converts_the_instant_once(kernels_with_earth_model: None) -> None:
+    """/v1/chart reports one epoch stage and no per-step str2et"""
+    main.result_cache.clear()
+    r = TestClient(main.app).post(
+        "/v1/chart",
+        json={"birth_time": "1987-11-03T06:30:00Z", "latitude": 51.5, "longitude": -0.12},
+    )
+    assert r.status_code == 200
+    stages = [part.split(";")[0] for part in r.headers["server-timing"].split(", ")]
+    assert stages.count("epoch") == 1
+    assert "str2et" not in stages
+    assert len(r.json()["houses"]["cusps"]) == 12
+
+def test_batch_matches_calculate(kernels_with_earth_model: None) -> None:
+    """Each batch item equals /calculate for that chart, and computed charts are cached"""
+    main.result_cache.clear()
+    client = TestClient(main.app)
+    charts = [
+        {"birth_time": epoch, "latitude": lat, "longitude": lon, "zodiac": zodiac}
+        for epoch in EPOCHS
+        for lat, lon in LOCATIONS
+        for zodiac in ("tropical", "sidereal")
+    ]
+    r = client.post("/v1/calculate/batch", json={"charts": [*charts, charts[0]]})
+    assert r.status_code == 200
+    items = r.json()["results"]
+    assert r.json()["meta"]["failed"] == 0
+    stages = [part.split(";")[0] for part in r.headers["server-timing"].split(", ")]
+    assert "epoch" in stages and "spkcpo" in stages
+    assert items[-1]["data"] == items[0]["data"]
+
+    hits = main.result_cache.hits
+    for chart, item in zip(charts, items, strict=False):
+        single = client.post("/calculate", json=chart).json()
+        assert item["data"] == single["data"]
+        assert item["ayanamsa_deg"] == single["meta"]["ayanamsa_deg"]
+    assert main.result_cache.hits == hits + len(charts)
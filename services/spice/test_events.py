@@ -0,0 +1,112 @@
+"""
+Tests for the event search (events.py, /v1/events/search)
+
+The scan is checked on analytic longitudes with retrograde loops against
+dense sampling. The endpoint test uses the repo's leapseconds/PCK kernels and
+a small synthetic SPK, so it runs without DE440.
+"""
+
+import os
+from datetime import UTC, datetime
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+# Disable rate limiting for tests
+os.environ["DISABLE_RATE_LIMIT"] = "1"
+
+import main
+from events import _brent, _offset, find_crossings
+from houses import FloatOrArray
+from models import EventSearchRequest
+
+DAY = 86400.0
+
+def looping_longitude(et: FloatOrArray) -> FloatOrArray:
+    """Mean motion 0.2°/day with a 5° epicycle: retrograde for part of every 100 days"""
+    d = et / DAY
+    return (0.2 * d + 5.0 * np.sin(2 * np.pi * d / 100.0) + 0.123) % 360.0
+
+def sampled_crossings(target: float, period: float, days: float) -> np.ndarray:
+    """Crossing times by brute force on a 60 s grid (midpoints of straddling samples)"""
+    ts = np.arange(0.0, days * DAY, 60.0)
+    g = _offset(looping_longitude(ts), target, period)
+    straddles = (np.sign(g[1:]) != np.sign(g[:-1])) & (np.abs(np.diff(g)) < period / 2)
+    return ts[np.flatnonzero(straddles)] + 30.0
+
+def test_brent_finds_root() -> None:
+    def f(x: float) -> float:
+        return (x - 1.3) * (x * x + 1.0)
+
+    assert abs(_brent(f, 0.0, 4.0, f(0.0), f(4.0), 1e-12) - 1.3) < 1e-12
+
+def test_finds_every_crossing_through_retrograde_loops() -> None:
+    """Ingresses and a single longitude match brute-force sampling, both directions"""
+    for target, period in ((0.0, 30.0), (123.4, 360.0)):
+        search = find_crossings(
+            looping_longitude, 0.0, 2000 * DAY, target, period, (0.52, 0.12),
+            lambda c: True, 1000, 100_000,
+        )
+        times = np.array([c.et for c in search.crossings])
+        expected = sampled_crossings(target, period, 2000)
+        assert len(times) == len(expected)
+        assert np.max(np.abs(times - expected)) <= 30.0
+        assert search.searched_until_et == 2000 * DAY
+        for c in search.crossings:
+            # Sub-second: the body moves < 0.52°/day, so 1e-6° is ~0.2 s
+            assert abs(_offset(c.longitude, target, period)) < 1e-6
+    assert {c.direction for c in search.crossings} == {1}
+    ingresses = find_crossings(
+        looping_longitude, 0.0, 2000 * DAY, 0.0, 30.0, (0.52, 0.12), lambda c: True, 1000, 100_000
+    )
+    assert {c.direction for c in ingresses.crossings} == {1, -1}
+    assert ingresses.evaluations < 40 * len(ingresses.crossings)
+
+def test_limit_and_budget_stop_the_scan() -> None:
+    args = (looping_longitude, 0.0, 2000 * DAY, 0.0, 30.0, (0.52, 0.12))
+    limited = find_crossings(*args, lambda c: c.direction > 0, 3, 100_000)
+    assert len(limited.crossings) == 3 and all(c.direction > 0 for c in limited.crossings)
+    assert limited.searched_until_et < 2000 * DAY
+    budget = find_crossings(*args, lambda c: True, 1000, 50)
+    assert 50 <= budget.evaluations < 80
+    assert budget.searched_until_et < 2000 * DAY
+
+def test_validation() -> None:
+    start, end = datetime(2024, 1, 1, tzinfo=UTC), datetime(2025, 1, 1, tzinfo=UTC)
+    with pytest.raises(ValueError, match="either sign or longitude"):
+        EventSearchRequest(body="Mars", start=start, end=end, sign="Scorpio", longitude=215.0)
+    with pytest.raises(ValueError, match="end must be after start"):
+        EventSearchRequest(body="Mars", start=start, end=datetime(2023, 1, 1, tzinfo=UTC))
+    with pytest.raises(ValueError, match="Invalid bodies"):
+        EventSearchRequest(body="Pluto", start=start, end=end)
+
+def test_endpoint_reports_ingresses(kernels: None) -> None:
+    """Each reported ingress sits on a sign boundary and names the sign entered"""
+    client = TestClient(main.app)
+    body = {
+        "body": "Sun", "start": "2000-01-01T00:00:00Z", "end": "2010-01-01T00:00:00Z",
+        "zodiac": "tropical",
+    }
+    r = client.post("/v1/events/search", json=body)
+    assert r.status_code == 200
+    data = r.json()
+    assert data["event"] == "ingress" and data["ayanamsa"] is None
+    assert data["events"] and data["searched_until"] == "2010-01-01T00:00:00.000Z"
+    for event in data["events"]:
+        boundary = round(event["longitude"] / 30.0) * 30.0
+        assert abs(event["longitude"] - boundary) < 1e-6
+        start_of_sign = boundary if event["direction"] == "direct" else boundary - 30.0
+        assert event["sign"] == main.SIGNS[int(start_of_sign % 360 // 30)]
+
+    one_sign = client.post("/v1/events/search", json={**body, "sign": data["events"][0]["sign"]})
+    assert one_sign.status_code == 200
+    assert {e["sign"] for e in one_sign.json()["events"]} == {data["events"][0]["sign"]}
+
+    r = client.post("/v1/events/search", json={**body, "longitude": 100.0})
+    assert r.status_code == 200
+    for event in r.json()["events"]:
+        assert abs(event["longitude"] - 100.0) < 1e-6 and event["sign"] is None
+
+    r = client.post("/v1/events/search", json={**body, "start": "1400-01-01T00:00:00Z"})
+    assert r.status_code == 400
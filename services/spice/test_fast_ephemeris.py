@@ -0,0 +1,184 @@
+"""
+Tests for the fast precision tier (fast_ephemeris.py)
+
+Fitting, storage and evaluation are checked on a synthetic lunar-like track so no
+kernels are needed. The fast tier is compared against the research path with
+tables built, as tools/build_fast_ephemeris.py does, from the synthetic SPK.
+"""
+
+import math
+import os
+import sys
+from datetime import UTC, datetime
+from pathlib import Path
+
+import numpy as np
+import pytest
+import spiceypy as spice
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "tools"))
+
+# Disable rate limiting for tests
+os.environ["DISABLE_RATE_LIMIT"] = "1"
+
+import fast_ephemeris
+import main
+from build_fast_ephemeris import geocentric_sampler
+from fast_ephemeris import (
+    DEFAULT_SEGMENT_DAYS,
+    FAST_MAX_ERROR_DEG,
+    TABLE_DEGREE,
+    fit_segments,
+    load_tables,
+    save_tables,
+    topocentric_correction,
+)
+from main import app
+from models import AVAILABLE_BODIES, ChartRequest, Zodiac
+
+DAY = 86400.0
+
+def get_client() -> TestClient:
+    return TestClient(app)
+
+def moon_like(ets: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Mean motion plus the largest periodic lunar terms (equation of center, evection)"""
+    d = np.asarray(ets) / DAY
+    lon = 218.3 + 13.176396 * d + 6.289 * np.sin(2 * np.pi * d / 27.5546)
+    lon += 1.274 * np.sin(2 * np.pi * d / 31.812)
+    lat = 5.128 * np.sin(2 * np.pi * d / 27.2122)
+    dist = 0.00257 - 0.000139 * np.cos(2 * np.pi * d / 27.5546)
+    return lon % 360.0, lat, dist
+
+def moon_like_speed(ets: np.ndarray) -> np.ndarray:
+    d = np.asarray(ets) / DAY
+    return (
+        13.176396
+        + 6.289 * 2 * np.pi / 27.5546 * np.cos(2 * np.pi * d / 27.5546)
+        + 1.274 * 2 * np.pi / 31.812 * np.cos(2 * np.pi * d / 31.812)
+    )
+
+def build(tmp_path: Path) -> Path:
+    """Two years of synthetic Moon at the production segment length, saved and reloaded"""
+    start, end = -365.25 * DAY, 365.25 * DAY
+    coeffs, errors = fit_segments(moon_like, start, end, 8.0)
+    out = tmp_path / "chebyshev.npy"
+    meta = {"kernel_set_tag": "test-set"}
+    save_tables(out, {"Moon": (coeffs, errors)}, start, end, {"Moon": 8.0}, meta)
+    return out
+
+def test_fit_error_is_recorded_and_small(tmp_path: Path) -> None:
+    """Builder-measured error is far below the documented bound and stored in the index"""
+    tables = load_tables(build(tmp_path))
+    err = tables.max_error()["Moon"]
+    assert err["longitude_deg"] < 1e-7
+    assert err["latitude_deg"] < 1e-7
+    assert err["distance_au"] < 1e-12
+    assert err["longitude_deg"] < FAST_MAX_ERROR_DEG
+
+def test_evaluation_matches_track(tmp_path: Path) -> None:
+    """Random epochs (including segment edges and 0°/360° crossings) match the source"""
+    tables = load_tables(build(tmp_path))
+    ets = np.random.default_rng(7).uniform(tables.start_et, tables.end_et, 5000)
+    ets = np.concatenate([ets, [tables.start_et, tables.end_et, tables.start_et + 8 * DAY]])
+
+    lon, lat, dist, speed = tables.evaluate("Moon", ets)
+    lon_ref, lat_ref, dist_ref = moon_like(ets)
+
+    assert np.all((lon >= 0) & (lon < 360))
+    assert np.max(np.abs((lon - lon_ref + 180) % 360 - 180)) < 1e-7
+    assert np.max(np.abs(lat - lat_ref)) < 1e-7
+    assert np.max(np.abs(dist - dist_ref)) < 1e-12
+    assert np.max(np.abs(speed - moon_like_speed(ets))) < 1e-6
+
+def test_tables_are_memory_mapped_read_only(tmp_path: Path) -> None:
+    """Coefficients come from a read-only mapping; per-body and per-epoch paths agree"""
+    tables = load_tables(build(tmp_path))
+    assert not tables.coeffs.flags.writeable
+    assert tables.covers(0.0) and not tables.covers(tables.end_et + 1.0)
+
+    many = tables.evaluate_bodies(["Moon", "Moon"], 1.23e6)
+    one = tables.evaluate("Moon", 1.23e6)
+    for a, b in zip(many, one):
+        assert np.allclose(a, b[0], rtol=0, atol=1e-12)
+
+def test_tables_from_another_kernel_set_are_rejected(tmp_path: Path) -> None:
+    """Stale tables raise instead of being served for a different kernel set"""
+    path = build(tmp_path)
+    assert list(load_tables(path, "test-set").bodies) == ["Moon"]
+    with pytest.raises(ValueError, match="kernel set"):
+        load_tables(path, "2024-Q3")
+
+def test_topocentric_correction_parallax() -> None:
+    """Distant bodies are unmoved; the Moon shifts by at most its horizontal parallax"""
+    args = (0.0, 2451545.0, 51.5, -0.1, 0.0)
+    lon, lat, _ = topocentric_correction(np.array([120.0]), np.array([1.0]), np.array([1e6]), *args)
+    assert abs(lon[0] - 120.0) < 1e-8 and abs(lat[0] - 1.0) < 1e-8
+
+    dist = 0.00257
+    lon, lat, dist_t = topocentric_correction(
+        np.array([120.0]), np.array([1.0]), np.array([dist]), *args
+    )
+    shift = math.degrees(
+        math.acos(
+            math.cos(math.radians(lat[0])) * math.cos(math.radians(1.0))
+            * math.cos(math.radians(lon[0] - 120.0))
+            + math.sin(math.radians(lat[0])) * math.sin(math.radians(1.0))
+        )
+    )
+    horizontal_parallax = math.degrees(math.asin(6378.137 / (dist * 149597870.7)))
+    assert 0.0 < shift <= horizontal_parallax
+    assert abs(dist_t[0] - dist) * 149597870.7 <= 6378.137
+
+def test_precision_field_validation() -> None:
+    """precision accepts research|fast only"""
+    client = get_client()
+    payload = {"birth_time": "2024-06-21T18:00:00Z", "latitude": 0.0, "longitude": 0.0}
+    r = client.post("/calculate", json={**payload, "precision": "ultra"})
+    assert r.status_code == 422
+
+def test_fast_tier_matches_research_path(
+    kernels_with_earth_model: None, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Tables built from the synthetic SPK stay within FAST_MAX_ERROR_DEG of the SPICE path"""
+    # Four months inside one record of the synthetic SPK, where its tracks are smooth.
+    # Without a binary Earth PCK the research observer is in IAU_EARTH, which drifts
+    # from sidereal time (~0.08° by 2024), so the window sits just after J2000.
+    start_et, end_et = spice.str2et("2000-01-05T00:00:00"), spice.str2et("2000-05-05T00:00:00")
+    fitted = {
+        name: fit_segments(
+            geocentric_sampler(AVAILABLE_BODIES[name]), start_et, end_et, days, TABLE_DEGREE
+        )
+        for name, days in DEFAULT_SEGMENT_DAYS.items()
+    }
+    out = tmp_path / "chebyshev.npy"
+    meta = {"kernel_set_tag": main.KERNEL_SET_TAG}
+    save_tables(out, fitted, start_et, end_et, DEFAULT_SEGMENT_DAYS, meta)
+    monkeypatch.setenv("FAST_EPHEMERIS_PATH", str(out))
+    monkeypatch.setattr(fast_ephemeris, "_tables", None)  # restored after the test
+    assert fast_ephemeris.load_fast_tables(main.KERNEL_SET_TAG) is not None
+
+    epochs = [datetime(2000, 1, 7, 5, 17, tzinfo=UTC), datetime(2000, 3, 20, 18, 0, tzinfo=UTC)]
+    epochs.append(datetime(2000, 5, 2, 23, 59, tzinfo=UTC))
+    zodiacs: tuple[Zodiac, ...] = ("tropical", "sidereal")
+    for birth_time in epochs:
+        for lat, lon in ((37.7749, -122.4194), (-33.9, 151.2), (64.1, -21.9)):
+            for zodiac in zodiacs:
+                chart = ChartRequest(
+                    birth_time=birth_time, latitude=lat, longitude=lon, elevation=50.0,
+                    zodiac=zodiac, precision="fast",
+                )
+                fast = main._chart_positions_sync(chart)
+                assert fast.precision == "fast"
+                research = main._chart_positions_sync(
+                    chart.model_copy(update={"precision": "research"})
+                )
+                assert research.precision == "research"
+                for body, pos in fast.data.items():
+                    ref = research.data[body]
+                    # Arc along the sky: synthetic tracks can sit near the ecliptic poles
+                    d_lon = abs((pos.longitude - ref.longitude + 180) % 360 - 180)
+                    d_lon *= math.cos(math.radians(ref.latitude))
+                    assert d_lon <= FAST_MAX_ERROR_DEG, (body, birth_time, lat, zodiac)
+                    assert abs(pos.latitude - ref.latitude) <= FAST_MAX_ERROR_DEG, body
@@ -0,0 +1,175 @@
+"""
+Tests for the prebuilt GeoNames index (geonames_index.py)
+
+Uses a synthetic GeoNames dump; nearest-city answers are checked against a
+brute-force haversine scan.
+"""
+
+import json
+import random
+from pathlib import Path
+
+import numpy as np
+import pytest
+import time_resolution
+from geonames_index import (
+    NO_CITY,
+    GeoNamesIndex,
+    is_stale,
+    load_index,
+    parse_cities,
+    save_index,
+)
+from time_resolution import _haversine_distance
+
+ZONES = ["Europe/London", "America/Chicago", "Asia/Tokyo", "Australia/Sydney", "Africa/Cairo"]
+
+def write_dump(path: Path, n: int = 3000, seed: int = 3) -> None:
+    """GeoNames-style rows (19 tab-separated columns) plus a few unusable ones"""
+    rng = random.Random(seed)
+    lines = []
+    for i in range(n):
+        cols = [""] * 19
+        cols[0] = str(i)
+        cols[1] = f"City {i}"
+        cols[4] = f"{rng.uniform(-60, 70):.5f}"
+        cols[5] = f"{rng.uniform(-180, 180):.5f}"
+        cols[17] = rng.choice(ZONES)
+        lines.append("\t".join(cols))
+    lines.append("\t".join(["x"] * 4 + ["not-a-number", "0"] + [""] * 11 + ["UTC", ""]))
+    lines.append("\t".join(["y"] * 4 + ["10", "10"] + [""] * 11 + ["", ""]))  # no timezone
+    lines.append("too\tshort")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+def brute_force(
+    coords: np.ndarray, timezones: list[str], lat: float, lon: float, km: float
+) -> tuple[str, float] | None:
+    """(timezone, km) of the nearest city within km by haversine, else None"""
+    distances = [_haversine_distance(lat, lon, c_lat, c_lon) for c_lat, c_lon in coords]
+    i = int(np.argmin(distances))
+    return (timezones[i], distances[i]) if distances[i] <= km else None
+
+def test_parse_skips_unusable_rows(tmp_path: Path) -> None:
+    dump = tmp_path / "cities15000.txt"
+    write_dump(dump, n=10)
+    coords, timezones = parse_cities(dump)
+    assert coords.shape == (10, 2)
+    assert len(timezones) == 10
+    assert set(timezones) <= set(ZONES)
+
+def test_nearest_matches_brute_force(tmp_path: Path) -> None:
+    """Nearest city within the radius is exact in great-circle distance"""
+    dump = tmp_path / "cities15000.txt"
+    write_dump(dump, n=1500)
+    coords, timezones = parse_cities(dump)
+    index = GeoNamesIndex.build(coords, timezones)
+
+    rng = random.Random(11)
+    found = 0
+    for _ in range(300):
+        lat, lon = rng.uniform(-90, 90), rng.uniform(-180, 180)
+        expected = brute_force(coords, timezones, lat, lon, 400.0)
+        got = index.nearest(lat, lon, 400.0)
+        if expected is None:
+            assert got is None
+            continue
+        found += 1
+        assert got is not None
+        assert got[0] == expected[0]
+        assert got[1] == pytest.approx(expected[1], abs=1e-6)
+    assert found > 50
+
+def test_antimeridian_and_high_latitudes() -> None:
+    """Neighbours across ±180° and near the poles are found by true distance"""
+    coords = np.array([[0.0, 179.9], [0.0, 178.0], [80.0, 0.0], [78.0, 40.0]])
+    index = GeoNamesIndex.build(coords, ["Pacific/Fiji", "Pacific/Tarawa", "Arctic/A", "Arctic/B"])
+
+    hit = index.nearest(0.0, -179.9, 100.0)
+    assert hit is not None
+    tz, km = hit
+    assert tz == "Pacific/Fiji"
+    assert km == pytest.approx(_haversine_distance(0.0, -179.9, 0.0, 179.9), rel=1e-9)
+
+    # 40° of longitude at 80°N is ~770 km; 2° of latitude is ~222 km
+    arctic = index.nearest(79.0, 38.0, 1000.0)
+    assert arctic is not None and arctic[0] == "Arctic/B"
+    assert index.nearest(0.0, 90.0, 100.0) is None
+
+def test_vectorized_matches_single_queries(tmp_path: Path) -> None:
+    """nearest_within returns the same timezone and distance as per-point queries"""
+    dump = tmp_path / "cities15000.txt"
+    write_dump(dump)
+    index = GeoNamesIndex.build(*parse_cities(dump))
+
+    rng = np.random.default_rng(5)
+    lats = rng.uniform(-90, 90, 2000)
+    lons = rng.uniform(-180, 180, 2000)
+    tz_ids, distances = index.nearest_within(lats, lons, 250.0)
+
+    assert 0 < int(np.sum(tz_ids == NO_CITY)) < len(lats)
+    for i in range(len(lats)):
+        single = index.nearest(float(lats[i]), float(lons[i]), 250.0)
+        if single is None:
+            assert tz_ids[i] == NO_CITY
+            assert distances[i] == np.inf
+        else:
+            assert index.timezones[tz_ids[i]] == single[0]
+            assert distances[i] == pytest.approx(single[1], abs=1e-9)
+
+    empty_ids, empty_km = index.nearest_within(np.array([]), np.array([]), 100.0)
+    assert len(empty_ids) == len(empty_km) == 0
+
+def test_saved_index_is_memory_mapped(tmp_path: Path) -> None:
+    """The loaded index maps the file read-only and answers like the in-memory one"""
+    dump = tmp_path / "cities15000.txt"
+    write_dump(dump)
+    built = GeoNamesIndex.build(*parse_cities(dump))
+    path = tmp_path / "geonames.npy"
+    save_index(path, built, {"source_bytes": dump.stat().st_size})
+
+    loaded = load_index(path)
+    assert isinstance(loaded.cities.base, np.memmap)
+    assert not loaded.cities.flags.writeable
+    assert len(loaded) == len(built)
+    assert loaded.timezones == built.timezones
+    for lat, lon in [(51.5, -0.1), (-33.9, 151.2), (0.0, 179.9), (89.0, -179.0)]:
+        assert loaded.nearest(lat, lon, 2000.0) == built.nearest(lat, lon, 2000.0)
+
+    assert not is_stale(path, dump)
+    dump.write_text(dump.read_text() + "\n")
+    assert is_stale(path, dump)
+
+def test_rejects_unknown_format(tmp_path: Path) -> None:
+    dump = tmp_path / "cities15000.txt"
+    write_dump(dump, n=50)
+    path = tmp_path / "geonames.npy"
+    save_index(path, GeoNamesIndex.build(*parse_cities(dump)), {})
+    header = json.loads(path.with_suffix(".json").read_text())
+    header["format_version"] = 99
+    path.with_suffix(".json").write_text(json.dumps(header))
+    with pytest.raises(ValueError):
+        load_index(path)
+
+def test_empty_index_has_no_nearest() -> None:
+    index = GeoNamesIndex.build(np.empty((0, 2)), [])
+    assert index.nearest(0.0, 0.0, 100.0) is None
+    tz_ids, _ = index.nearest_within(np.array([0.0]), np.array([0.0]), 100.0)
+    assert tz_ids.tolist() == [NO_CITY]
+
+def test_find_nearest_city_timezone_uses_index(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Lookups go through the index and keep the 100 km haversine cutoff"""
+    coords = np.array([[51.5074, -0.1278], [35.6762, 139.6503]])
+    index = GeoNamesIndex.build(coords, ["Europe/London", "Asia/Tokyo"])
+    monkeypatch.setattr(time_resolution, "geonames_index", index)
+    monkeypatch.setattr(time_resolution, "_geonames_loaded", True)
+
+    assert time_resolution.find_nearest_city_timezone(51.6, -0.2) == "Europe/London"
+    assert time_resolution.find_nearest_city_timezone(35.5, 139.5) == "Asia/Tokyo"
+    assert time_resolution.find_nearest_city_timezone(0.0, 0.0) is None
+
+    # Batch: GeoNames hits, a regional override (Kentucky) and a timezonefinder fallback
+    lats = np.array([51.6, 35.5, 38.0, 40.7128])
+    lons = np.array([-0.2, 139.5, -84.0, -74.0060])
+    expected = [time_resolution.get_historical_timezone(a, b) for a, b in zip(lats, lons)]
+    assert time_resolution.get_historical_timezones(lats, lons) == expected
+    assert expected[:3] == ["Europe/London", "Asia/Tokyo", "America/Kentucky/Monticello"]
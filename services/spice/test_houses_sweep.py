@@ -0,0 +1,114 @@
+"""
+Tests for the birth-time rectification sweep (rectification.py, /v1/houses/sweep)
+
+Every step of the sweep must equal /houses at that instant, and each reported
+sign change must separate the two signs it names. Only needs the repo's
+leapseconds kernel (houses use no SPK).
+"""
+
+import os
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+import spiceypy as spice
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+
+# Disable rate limiting for tests
+os.environ["DISABLE_RATE_LIMIT"] = "1"
+
+import main
+from models import (
+    HousesRequest,
+    HousesResponse,
+    HousesSweepRequest,
+    HouseSystem,
+    Zodiac,
+)
+
+LSK = Path(__file__).resolve().parents[2] / "kernels" / "lsk" / "naif0012.tls"
+
+# The second window spans the 2016-12-31 leap second
+STARTS = [datetime(1987, 11, 3, 6, 30, tzinfo=UTC), datetime(2016, 12, 31, 23, 0, tzinfo=UTC)]
+LOCATIONS = [(51.5, -0.12), (-33.9, 151.2), (64.1, -21.9)]
+
+@pytest.fixture
+def lsk() -> Iterator[None]:
+    if not LSK.exists():
+        pytest.skip("Leapseconds kernel not available")
+    spice.furnsh(str(LSK))
+    yield
+    spice.unload(str(LSK))
+
+ZODIACS: tuple[Zodiac, ...] = ("tropical", "sidereal")
+SYSTEMS: tuple[HouseSystem, ...] = ("placidus", "whole-sign", "equal")
+
+def _at(start: datetime, seconds: float) -> datetime:
+    return start + timedelta(seconds=seconds)
+
+def _houses(t: datetime, req: HousesSweepRequest) -> HousesResponse:
+    fields = req.model_dump(include={"latitude", "longitude", "zodiac", "system", "mc_hemisphere"})
+    return main._houses_sync(HousesRequest(birth_time=t, **fields))
+
+def test_each_step_matches_houses(lsk: None) -> None:
+    """ASC, MC and every cusp equal /houses at each step, for each system and zodiac"""
+    for start in STARTS:
+        for lat, lon in LOCATIONS:
+            for zodiac in ZODIACS:
+                for system in SYSTEMS:
+                    req = HousesSweepRequest(
+                        start=start, end=_at(start, 7200), step_seconds=900,
+                        latitude=lat, longitude=lon, zodiac=zodiac, system=system,
+                    )
+                    sweep = main._houses_sweep_sync(req)
+                    assert sweep.count == 9
+                    for i in range(sweep.count):
+                        h = _houses(_at(start, i * 900), req)
+                        assert (sweep.asc[i], sweep.mc[i]) == (h.asc, h.mc)
+                        assert [column[i] for column in sweep.cusps] == h.cusps
+
+def test_sign_changes_bracket_the_ingress(lsk: None) -> None:
+    """The sign just before each reported time is from_sign, just after is to_sign"""
+    for lat, lon in LOCATIONS:
+        req = HousesSweepRequest(
+            start=STARTS[0], end=_at(STARTS[0], 86400), step_seconds=1800,
+            latitude=lat, longitude=lon, system="equal",
+        )
+        changes = main._houses_sweep_sync(req).sign_changes
+        # ASC and MC each pass through all 12 signs in a sidereal day
+        assert sum(c.angle == "asc" for c in changes) >= 12
+        assert sum(c.angle == "mc" for c in changes) >= 12
+        assert [c.time for c in changes] == sorted(c.time for c in changes)
+        for c in changes:
+            t = datetime.fromisoformat(c.time)
+            for offset, sign in ((-0.002, c.from_sign), (0.002, c.to_sign)):
+                lon_deg = getattr(_houses(t + timedelta(seconds=offset), req), c.angle)
+                assert main.zodiac_from_longitude(lon_deg)[0] == sign
+
+def test_validation() -> None:
+    with pytest.raises(ValidationError, match="end must not be before start"):
+        HousesSweepRequest(
+            start=STARTS[0], end=_at(STARTS[0], -1800), latitude=51.5, longitude=-0.12
+        )
+    with pytest.raises(ValidationError, match="steps"):
+        HousesSweepRequest(
+            start=STARTS[0], end=_at(STARTS[0], 7 * 86400), step_seconds=1,
+            latitude=51.5, longitude=-0.12,
+        )
+
+def test_endpoint(lsk: None) -> None:
+    client = TestClient(main.app)
+    body = {
+        "start": "1987-11-03T06:30:00Z", "end": "1987-11-03T07:30:00Z",
+        "latitude": 51.5, "longitude": 0,
+    }
+    r = client.post("/v1/houses/sweep", json=body)
+    assert r.status_code == 200
+    data = r.json()
+    assert data["count"] == 61 and len(data["asc"]) == 61
+    assert len(data["cusps"]) == 12 and all(len(column) == 61 for column in data["cusps"])
+
+    r = client.post("/v1/houses/sweep", json={**body, "latitude": 70.0})
+    assert r.status_code == 422
@@ -0,0 +1,66 @@
+"""
+Tests for the load-test harness helpers (tools/loadtest.py)
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "tools"))
+
+from loadtest import make_payloads, mark_saturation, parse_mix, percentile, summarize
+from models import ChartRequest, HousesRequest, TimeResolveRequest
+
+
+def test_payloads_are_valid_requests() -> None:
+    """Every generated body passes the endpoint's request model"""
+    models = {
+        "calculate": ChartRequest,
+        "houses": HousesRequest,
+        "chart": ChartRequest,
+        "time": TimeResolveRequest,
+    }
+    payloads = make_payloads(25, seed=7)
+    assert len(payloads) == 100
+    for name, body in payloads:
+        models[name](**body)
+    assert make_payloads(25, seed=7) == payloads
+
+def test_parse_mix() -> None:
+    assert parse_mix("calculate=3,time=1") == {"calculate": 3.0, "time": 1.0}
+    assert parse_mix("houses") == {"houses": 1.0}
+    with pytest.raises(ValueError):
+        parse_mix("calculate=1,ephemeris=2")
+
+def test_percentile_nearest_rank() -> None:
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 0.50) == 50.0
+    assert percentile(values, 0.99) == 99.0
+    assert percentile([5.0], 0.99) == 5.0
+    assert percentile([], 0.5) is None
+
+def test_summarize_rates_errors_and_worker_cpu() -> None:
+    samples = {"calculate": [(0.01, 200)] * 8 + [(0.5, 503), (1.0, 0)], "time": [(0.002, 200)]}
+    before = {10: {"cpu_s": 1.0, "rss_bytes": 0}}
+    after = {10: {"cpu_s": 2.5, "rss_bytes": 200 * 2**20}}
+    report = summarize(samples, 2.0, before, after, client_cpu_s=0.5)
+
+    assert report["requests"] == 11
+    assert report["rps"] == 5.5
+    assert report["errors"] == 2
+    assert report["endpoints"]["calculate"]["error_statuses"] == {"503": 1, "0": 1}
+    assert report["workers"] == [
+        {"pid": 10, "cpu_percent": 75.0, "rss_mb": 200.0, "pss_mb": 0.0}
+    ]
+    assert report["client_cpu_percent"] == 25.0
+
+def test_saturation_is_first_step_near_peak_throughput() -> None:
+    steps = [
+        {"concurrency": 1, "rps": 100.0},
+        {"concurrency": 4, "rps": 380.0},
+        {"concurrency": 16, "rps": 395.0},
+        {"concurrency": 64, "rps": 390.0},
+    ]
+    assert mark_saturation(steps) == 4
+    assert mark_saturation([]) is None
@@ -0,0 +1,84 @@
+"""
+Tests for the queue-based structured log pipeline (log_pipeline.py)
+"""
+
+import io
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+
+import pytest
+from log_pipeline import LogPipeline, parse_level
+
+
+def test_dict_records_written_as_json_by_writer() -> None:
+    """Structured events are encoded on the writer thread, one JSON line each"""
+    stream = io.StringIO()
+    pipeline = LogPipeline(logging.getLogger("test.pipeline.json"), stream=stream)
+    pipeline.start()
+    pipeline.logger.info({"event": "calculation", "target": "ALL_BODIES", "latency_ms": 1.5})
+    pipeline.logger.warning("plain %s", "message")
+    pipeline.stop()
+
+    lines = stream.getvalue().splitlines()
+    assert json.loads(lines[0]) == {
+        "event": "calculation",
+        "target": "ALL_BODIES",
+        "latency_ms": 1.5,
+    }
+    assert lines[1] == "plain message"
+
+def test_full_queue_drops_instead_of_blocking() -> None:
+    """A stalled writer never blocks the caller; overflow is counted"""
+    stream = io.StringIO()
+    pipeline = LogPipeline(logging.getLogger("test.pipeline.full"), max_queue=2, stream=stream)
+    for i in range(5):
+        pipeline.logger.info({"n": i})
+    assert pipeline.dropped == 3
+
+    pipeline.start()
+    pipeline.stop()
+    assert [json.loads(line)["n"] for line in stream.getvalue().splitlines()] == [0, 1]
+
+def test_level_filters_before_enqueue() -> None:
+    """Records below the configured level never reach the queue"""
+    pipeline = LogPipeline(logging.getLogger("test.pipeline.level"), "WARNING")
+    pipeline.logger.info({"event": "ignored"})
+    assert pipeline.queue.qsize() == 0
+    assert not pipeline.logger.propagate
+
+def test_stop_is_idempotent() -> None:
+    pipeline = LogPipeline(logging.getLogger("test.pipeline.stop"), stream=io.StringIO())
+    pipeline.stop()
+    pipeline.start()
+    pipeline.start()
+    pipeline.stop()
+    pipeline.stop()
+
+def test_writer_restarts_in_both_processes_after_fork(tmp_path: Path) -> None:
+    """Forking (gunicorn preload) leaves a working writer thread in parent and child"""
+    path = tmp_path / "log.jsonl"
+    with open(path, "a", buffering=1) as stream:
+        pipeline = LogPipeline(logging.getLogger("test.pipeline.fork"), stream=stream)
+        pipeline.start()
+        pid = os.fork()
+        if pid == 0:  # child
+            ok = any(t.name != "MainThread" for t in threading.enumerate())
+            pipeline.logger.info({"event": "child", "writer": ok})
+            pipeline.stop()
+            os._exit(0)
+        os.waitpid(pid, 0)
+        pipeline.logger.info({"event": "parent"})
+        pipeline.stop()
+
+    events = [json.loads(line) for line in path.read_text().splitlines()]
+    assert {"event": "child", "writer": True} in events
+    assert {"event": "parent"} in events
+
+def test_parse_level() -> None:
+    assert parse_level("debug") == logging.DEBUG
+    assert parse_level(" WARNING ") == logging.WARNING
+    with pytest.raises(ValueError):
+        parse_level("LOUD")
@@ -0,0 +1,52 @@
+"""
+Tests for observer frame selection from the startup-cached Earth model
+
+Frame choice is a plain interval check against the ITRF93 (EOP) coverage that
+lifespan reads once, so it is exercised here with a synthetic EarthModel.
+"""
+
+import os
+
+# Disable rate limiting for tests
+os.environ["DISABLE_RATE_LIMIT"] = "1"
+
+import main
+from main import EarthModel, _observer_frame, _observer_position, reset_earth_model
+
+
+def test_has_eop_interval_check() -> None:
+    """Coverage windows are inclusive; gaps and out-of-range epochs have no EOP"""
+    earth = EarthModel(
+        radii_km=(6378.1366, 6378.1366, 6356.7519),
+        itrf93_coverage=((0.0, 100.0), (200.0, 300.0)),
+    )
+    assert earth.has_eop(0.0)
+    assert earth.has_eop(100.0)
+    assert earth.has_eop(250.0)
+    assert not earth.has_eop(150.0)
+    assert not earth.has_eop(-1.0e9)
+    assert abs(earth.flattening - (6378.1366 - 6356.7519) / 6378.1366) < 1e-15
+
+def test_observer_frame_uses_cached_coverage() -> None:
+    """Epochs inside EOP coverage use ITRF93, historical epochs fall back to IAU_EARTH"""
+    main._earth_model = EarthModel(
+        radii_km=(6378.1366, 6378.1366, 6356.7519),
+        itrf93_coverage=((-3.0e7, 8.0e8),),
+    )
+    try:
+        assert _observer_frame(7.7e8) == "ITRF93"
+        assert _observer_frame(-1.2e9) == "IAU_EARTH"  # 1962
+    finally:
+        reset_earth_model()
+
+def test_observer_position_is_memoized() -> None:
+    """georec runs once per (frame, lat, lon, elev)"""
+    reset_earth_model()
+    first = _observer_position("IAU_EARTH", 37.7749, -122.4194, 50.0)
+    second = _observer_position("IAU_EARTH", 37.7749, -122.4194, 50.0)
+    assert first == second
+    assert _observer_position.cache_info().hits >= 1
+
+    # WGS-84 radius sanity check at this latitude (km)
+    r = sum(c * c for c in first) ** 0.5
+    assert 6369.0 < r < 6371.0
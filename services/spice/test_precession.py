@@ -0,0 +1,89 @@
+"""
+Tests for the vectorized precession/obliquity engine (precession.py)
+
+The stacked matrices are checked against a straight scalar transcription of
+the IAU 2006 precession / IAU 1980 obliquity model. No SPICE kernels needed.
+"""
+
+import math
+
+import numpy as np
+from precession import (
+    centuries_since_j2000,
+    ecliptic_matrices,
+    ecliptic_matrix,
+    ecliptic_matrix_rate,
+    mean_obliquity_deg,
+    to_ecliptic_of_date,
+)
+
+
+def reference_matrix(et: float) -> np.ndarray:
+    """Scalar J2000 → ecliptic-of-date rotation built element by element"""
+    T = ((2451545.0 + et / 86400.0) - 2451545.0) / 36525.0
+    zeta = math.radians((2306.2181 * T + 0.30188 * T**2 + 0.017998 * T**3) / 3600.0)
+    z = math.radians((2306.2181 * T + 1.09468 * T**2 + 0.018203 * T**3) / 3600.0)
+    theta = math.radians((2004.3109 * T - 0.42665 * T**2 - 0.041833 * T**3) / 3600.0)
+    eps = math.radians(23.43929111 - (46.8150 * T + 0.00059 * T**2 - 0.001813 * T**3) / 3600.0)
+
+    cz, sz = math.cos(-zeta), math.sin(-zeta)
+    cZ, sZ = math.cos(-z), math.sin(-z)
+    ct, st = math.cos(theta), math.sin(theta)
+    ce, se = math.cos(eps), math.sin(eps)
+    r1 = np.array([[cz, sz, 0], [-sz, cz, 0], [0, 0, 1]])
+    r2 = np.array([[ct, 0, -st], [0, 1, 0], [st, 0, ct]])
+    r3 = np.array([[cZ, sZ, 0], [-sZ, cZ, 0], [0, 0, 1]])
+    obl = np.array([[1, 0, 0], [0, ce, se], [0, -se, ce]])
+    return obl @ r3 @ r2 @ r1
+
+def test_stacked_matrices_match_reference() -> None:
+    """Every stacked matrix equals the scalar construction across 1550..2650"""
+    ets = np.linspace(-1.42e10, 2.05e10, 101)
+    stacked = ecliptic_matrices(ets)
+    assert stacked.shape == (101, 3, 3)
+    for i, et in enumerate(ets):
+        assert np.allclose(stacked[i], reference_matrix(float(et)), atol=1e-14)
+
+def test_matrices_are_rotations() -> None:
+    """Orthonormal with determinant +1"""
+    m = ecliptic_matrices(np.array([-1.0e10, 0.0, 1.0e10]))
+    eye = np.broadcast_to(np.eye(3), m.shape)
+    assert np.allclose(m @ np.transpose(m, (0, 2, 1)), eye, atol=1e-14)
+    assert np.allclose(np.linalg.det(m), 1.0)
+
+def test_j2000_obliquity() -> None:
+    """At J2000.0 precession vanishes and obliquity is the IAU 1980 constant"""
+    assert centuries_since_j2000(0.0) == 0.0
+    assert float(mean_obliquity_deg(0.0)) == 23.43929111
+    eps = math.radians(23.43929111)
+    expected = np.array([[1, 0, 0], [0, math.cos(eps), math.sin(eps)], [0, -math.sin(eps), math.cos(eps)]])
+    assert np.allclose(ecliptic_matrix(0.0), expected, atol=1e-15)
+
+def test_epoch_memo_is_shared_and_read_only() -> None:
+    """Repeated lookups at one ET return the same read-only matrix"""
+    a = ecliptic_matrix(7.5e8)
+    b = ecliptic_matrix(7.5e8)
+    assert a is b
+    assert not a.flags.writeable
+
+def test_single_epoch_and_many_epochs_agree() -> None:
+    """N=1 (memoized) and N-epoch (stacked) conversions give identical coordinates"""
+    rng = np.random.default_rng(3)
+    pos = rng.normal(size=(64, 3)) * 1.0e8
+    ets = rng.uniform(-1.4e10, 1.9e10, size=64)
+
+    lon, lat, dist = to_ecliptic_of_date(pos, ets)
+    for i in range(len(ets)):
+        l1, b1, d1 = to_ecliptic_of_date(pos[i], float(ets[i]))
+        assert abs(((lon[i] - l1[0]) + 180) % 360 - 180) < 1e-10
+        assert abs(lat[i] - b1[0]) < 1e-10
+        assert abs(dist[i] - d1[0]) < 1e-14
+
+def test_matrix_rate_is_general_precession() -> None:
+    """Frame rate moves longitudes by roughly 50.3 arcsec per year"""
+    rate = ecliptic_matrix_rate(0.0)
+    x = np.array([1.0, 0.0, 0.0])  # equinox direction
+    v = ecliptic_matrix(0.0) @ x
+    dv = rate @ x
+    lam_dot_arcsec_per_year = math.degrees(v[0] * dv[1] - v[1] * dv[0]) * 3600 * 86400 * 365.25
+    assert 50.0 < lam_dot_arcsec_per_year < 50.6
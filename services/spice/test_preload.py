@@ -0,0 +1,68 @@
+"""
+Tests for gunicorn preload mode (main.preload_shared_state, gunicorn.conf.py)
+
+Runs in a subprocess: preloading freezes the GC and loads in-memory timezone
+data, which must not leak into the test process. The subprocess forks like a
+gunicorn master and checks the child can use the shared state.
+"""
+
+import importlib.util
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SERVICE_DIR = Path(__file__).resolve().parent
+
+CHILD = """
+import json, os, threading
+import main, time_resolution
+
+main.preload_shared_state()
+read, write = os.pipe()
+pid = os.fork()
+if pid == 0:
+    status = time_resolution.subsystem_status()
+    result = {
+        "preloaded": main._preloaded,
+        "finder_in_memory": status["timezone_finder_in_memory"],
+        "transition_tables": status["transition_tables"],
+        "log_writer": any(t.name != "MainThread" for t in threading.enumerate()),
+        "timezone": time_resolution.get_historical_timezone(51.5074, -0.1278),
+    }
+    os.write(write, json.dumps(result).encode())
+    os._exit(0)
+os.waitpid(pid, 0)
+print("RESULT " + os.read(read, 65536).decode())
+"""
+
+def test_preloaded_state_is_usable_after_fork() -> None:
+    """Forked workers see the preloaded tables and get their own log writer"""
+    proc = subprocess.run(
+        [sys.executable, "-c", CHILD],
+        cwd=SERVICE_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+        env={"DISABLE_RATE_LIMIT": "1", "PATH": ""},
+    )
+    line = next(x for x in proc.stdout.splitlines() if x.startswith("RESULT "))
+    result = json.loads(line.removeprefix("RESULT "))
+    assert result["preloaded"] is True
+    assert result["finder_in_memory"] is True
+    assert result["transition_tables"] > 100
+    assert result["log_writer"] is True
+    assert result["timezone"] == "Europe/London"
+
+def test_gunicorn_config_preload_flag(monkeypatch: pytest.MonkeyPatch) -> None:
+    """PRELOAD=1 turns on gunicorn's preload_app"""
+    path = SERVICE_DIR / "gunicorn.conf.py"
+    for value, expected in (("1", True), ("0", False)):
+        monkeypatch.setenv("PRELOAD", value)
+        spec = importlib.util.spec_from_file_location("gunicorn_conf", path)
+        assert spec is not None and spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        assert module.preload_app is expected
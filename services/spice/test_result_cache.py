@@ -0,0 +1,120 @@
+"""
+Tests for the chart result cache (result_cache.py)
+
+LRU eviction and key canonicalization are checked directly; /calculate hit
+behaviour is checked when kernels are loaded.
+"""
+
+import os
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+# Disable rate limiting for tests
+os.environ["DISABLE_RATE_LIMIT"] = "1"
+
+from main import app, result_cache
+from models import ChartRequest
+from result_cache import ResultCache, chart_cache_key
+
+
+def get_client() -> TestClient:
+    return TestClient(app)
+
+def chart(**overrides: object) -> ChartRequest:
+    fields: dict[str, object] = {
+        "birth_time": "2024-06-21T18:00:00Z",
+        "latitude": 37.7749,
+        "longitude": -122.4194,
+        "elevation": 50,
+    }
+    return ChartRequest.model_validate({**fields, **overrides})
+
+def key(c: ChartRequest) -> object:
+    return chart_cache_key(c, "2024-Q3", "2.0.0", "analytic")
+
+def test_key_canonicalizes_equivalent_requests() -> None:
+    """Same instant in another offset, sub-quantum coordinates and tropical ayanamsa share a key"""
+    base = key(chart())
+    assert key(chart(birth_time="2024-06-21T11:00:00-07:00")) == base
+    assert key(chart(latitude=37.77490000004)) == base
+    assert key(chart(zodiac="tropical")) == key(
+        chart(zodiac="tropical", ayanamsa="fagan_bradley")
+    )
+
+def test_key_separates_distinct_requests() -> None:
+    """Anything that changes the result (kernel set, version, speed method too) changes the key"""
+    base = key(chart())
+    assert key(chart(birth_time=datetime.fromisoformat("2024-06-21T18:00:01+00:00"))) != base
+    assert key(chart(latitude=37.7750)) != base
+    assert key(chart(ayanamsa="fagan_bradley")) != base
+    assert key(chart(bodies=["Sun", "Moon"])) != base
+    assert key(chart(precision="fast")) != base
+    assert chart_cache_key(chart(), "2025-Q1", "2.0.0", "analytic") != base
+    assert chart_cache_key(chart(), "2024-Q3", "2.1.0", "analytic") != base
+    assert chart_cache_key(chart(), "2024-Q3", "2.0.0", "finite_difference") != base
+
+def test_lru_eviction_by_entries() -> None:
+    """The least recently used entry is evicted first"""
+    cache = ResultCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    stats = cache.stats()
+    assert stats["evictions"] == 1 and stats["entries"] == 2
+    assert stats["hits"] == 3 and stats["misses"] == 1
+
+def test_lru_eviction_by_bytes() -> None:
+    """The memory bound evicts old entries and rejects values larger than the bound"""
+    cache = ResultCache(max_entries=100, max_bytes=3000)
+    for i in range(5):
+        cache.put(i, b"x" * 1000)
+    stats = cache.stats()
+    assert stats["entries"] == 2 and stats["bytes"] <= 3000
+    assert stats["evictions"] == 3
+
+    cache.put("huge", b"x" * 10000)
+    assert cache.get("huge") is None
+
+def test_disabled_cache_stores_nothing() -> None:
+    cache = ResultCache(max_entries=0)
+    cache.put("a", 1)
+    assert cache.get("a") is None
+    assert cache.stats()["entries"] == 0
+
+def test_calculate_hits_cache_on_repeat() -> None:
+    """A repeated chart is served from the cache with fresh meta"""
+    client = get_client()
+    payload = {
+        "birth_time": "2024-06-21T18:00:00Z",
+        "latitude": 37.7749,
+        "longitude": -122.4194,
+        "elevation": 50,
+    }
+    result_cache.clear()
+    first = client.post("/calculate", json=payload)
+    if first.status_code != 200:
+        pytest.skip("SPICE kernels not available")
+
+    hits = result_cache.hits
+    second = client.post("/calculate", json={**payload, "birth_time": "2024-06-21T20:00:00+02:00"})
+    assert second.status_code == 200
+    assert result_cache.hits == hits + 1
+    assert second.json()["data"] == first.json()["data"]
+    assert second.json()["meta"]["request_id"] != first.json()["meta"]["request_id"]
+
+def test_errors_are_not_cached() -> None:
+    """Failed calculations leave the cache untouched"""
+    client = get_client()
+    result_cache.clear()
+    r = client.post(
+        "/calculate",
+        json={"birth_time": "1000-01-01T00:00:00Z", "latitude": 0.0, "longitude": 0.0},
+    )
+    assert r.status_code != 200
+    assert result_cache.stats()["entries"] == 0
@@ -0,0 +1,86 @@
+"""
+Tests for the ephemeris time-series endpoint (/v1/ephemeris/series)
+
+The vectorized ecliptic conversion the series relies on is checked against the
+scalar path with synthetic vectors, so these tests do not require SPICE kernels.
+"""
+
+import json
+import os
+
+import numpy as np
+from fastapi.testclient import TestClient
+
+# Disable rate limiting for tests
+os.environ["DISABLE_RATE_LIMIT"] = "1"
+
+from main import app, convert_to_ecliptic_of_date_spice
+from precession import to_ecliptic_of_date
+
+
+def get_client() -> TestClient:
+    return TestClient(app)
+
+def test_vectorized_ecliptic_matches_scalar() -> None:
+    """Stacked precession/obliquity matches convert_to_ecliptic_of_date_spice per row"""
+    rng = np.random.default_rng(42)
+    pos = rng.normal(size=(200, 3)) * 1.5e8
+    # ~1560..2630 in ET seconds past J2000
+    ets = rng.uniform(-1.4e10, 1.9e10, size=200)
+
+    lon, lat, dist = to_ecliptic_of_date(pos, ets)
+
+    for i in range(len(ets)):
+        expected = convert_to_ecliptic_of_date_spice(pos[i], float(ets[i]))
+        d_lon = abs(((lon[i] - expected["longitude"]) + 180) % 360 - 180)
+        assert d_lon < 1e-9
+        assert abs(lat[i] - expected["latitude"]) < 1e-9
+        assert abs(dist[i] - expected["distance"]) < 1e-12
+
+def test_series_request_validation() -> None:
+    """Reversed ranges and oversized ranges are rejected before any SPICE work"""
+    client = get_client()
+    base = {"latitude": 0.0, "longitude": 0.0, "bodies": ["Moon"]}
+
+    r = client.post("/v1/ephemeris/series", json={
+        **base, "start": "2024-02-01T00:00:00Z", "end": "2024-01-01T00:00:00Z"
+    })
+    assert r.status_code == 422
+
+    r = client.post("/v1/ephemeris/series", json={
+        **base, "start": "1600-01-01T00:00:00Z", "end": "2600-01-01T00:00:00Z", "step_seconds": 60
+    })
+    assert r.status_code == 422
+
+    r = client.post("/v1/ephemeris/series", json={
+        **base, "start": "2024-01-01T00:00:00Z", "end": "2024-01-02T00:00:00Z", "step_seconds": 1
+    })
+    assert r.status_code == 422
+
+def test_series_endpoint_contract() -> None:
+    """Contract test: NDJSON rows on success, mapped HTTP error otherwise"""
+    client = get_client()
+    payload = {
+        "start": "2024-01-01T00:00:00Z",
+        "end": "2024-01-02T00:00:00Z",
+        "step_seconds": 3600,
+        "latitude": 37.7749,
+        "longitude": -122.4194,
+        "bodies": ["Sun", "Moon"],
+    }
+
+    r = client.post("/v1/ephemeris/series", json=payload)
+    assert r.status_code in [200, 500]
+
+    if r.status_code == 200:
+        assert r.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in r.text.splitlines()]
+        assert len(rows) == 25
+        assert rows[0]["time"].startswith("2024-01-01T00:00:00")
+        for row in rows:
+            assert set(row.keys()) == {"time", "et", "ayanamsa_deg", "bodies"}
+            assert set(row["bodies"].keys()) == {"Sun", "Moon"}
+            assert 0 <= row["bodies"]["Moon"]["longitude"] < 360
+    else:
+        # Without kernels the up-front range check fails before streaming starts
+        assert isinstance(r.json()["detail"], str)
@@ -0,0 +1,124 @@
+"""
+Tests for the node-wide shared cache tier (shared_cache.py)
+
+Uses real SQLite files under tmp_path; a separate process stands in for a
+second HTTP worker.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import sqlite3
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+# Disable rate limiting for tests
+os.environ["DISABLE_RATE_LIMIT"] = "1"
+
+from main import app, result_cache
+from models import TimeResolveRequest, TimeResolveResponse
+from result_cache import ResultCache, time_cache_key
+from shared_cache import TRIM_EVERY, SharedCache
+
+
+def get_client() -> TestClient:
+    return TestClient(app)
+
+def write_from_other_process(path: str) -> None:
+    ResultCache(shared=SharedCache(path)).put(("chart", "k"), {"Sun": 90.0})
+
+def test_blob_round_trip_and_counters(tmp_path: Path) -> None:
+    """Stored blobs come back; the file uses WAL journaling"""
+    cache = SharedCache(str(tmp_path / "cache" / "results.sqlite"))
+    assert cache.get("a") is None
+    cache.put("a", b"payload")
+    assert cache.get("a") == b"payload"
+
+    stats = cache.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1
+    assert stats["entries"] == 1 and stats["bytes"] == len(b"payload")
+    conn = sqlite3.connect(cache.path)
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+def test_size_bound_trims_least_recently_used(tmp_path: Path) -> None:
+    """Past max_bytes the oldest entries are deleted down to the trim target"""
+    cache = SharedCache(str(tmp_path / "results.sqlite"), max_bytes=10_000)
+    for i in range(TRIM_EVERY):
+        cache.put(f"k{i}", b"x" * 1000)
+
+    stats = cache.stats()
+    assert stats["bytes"] <= 10_000
+    assert stats["evictions"] == TRIM_EVERY - stats["entries"]
+    assert cache.get("k0") is None
+    assert cache.get(f"k{TRIM_EVERY - 1}") is not None
+
+def test_miss_in_one_worker_hits_from_another(tmp_path: Path) -> None:
+    """A result written by another process is served from the shared tier"""
+    path = str(tmp_path / "results.sqlite")
+    proc = multiprocessing.get_context("spawn").Process(
+        target=write_from_other_process, args=(path,)
+    )
+    proc.start()
+    proc.join(timeout=30)
+    assert proc.exitcode == 0
+
+    cache = ResultCache(shared=SharedCache(path))
+    assert cache.get(("chart", "k")) == {"Sun": 90.0}
+    assert cache.get(("chart", "k")) == {"Sun": 90.0}
+    stats = cache.stats()
+    assert stats["shared_hits"] == 1 and stats["hits"] == 1 and stats["misses"] == 0
+
+def test_survives_restart(tmp_path: Path) -> None:
+    """Entries persist after the connection (worker) goes away"""
+    path = str(tmp_path / "results.sqlite")
+    first = ResultCache(shared=SharedCache(path))
+    first.put(("houses", 1.0), [0.0, 30.0])
+    assert first.shared is not None
+    first.shared.close()
+
+    assert ResultCache(shared=SharedCache(path)).get(("houses", 1.0)) == [0.0, 30.0]
+
+def test_unusable_file_degrades_to_miss(tmp_path: Path) -> None:
+    """A path that is not a database never fails the caller"""
+    bad = tmp_path / "not-a-db.sqlite"
+    bad.write_bytes(b"garbage" * 100)
+    cache = ResultCache(shared=SharedCache(str(bad)))
+    cache.put(("chart", "k"), 1)
+    assert cache.get(("other", "k")) is None
+    assert cache.shared is not None and cache.shared.stats()["errors"] > 0
+
+def test_time_resolution_key_includes_tz_database() -> None:
+    """A timezone database upgrade never serves old offsets"""
+    req = TimeResolveRequest(local_datetime="2024-03-10T02:30:00", latitude=40.7, longitude=-74.0)
+    assert time_cache_key(req, "2024.1", "2.0.0") != time_cache_key(req, "2024.2", "2.0.0")
+
+def test_time_resolution_is_cached() -> None:
+    """A repeated /v1/time/resolve is served from the result cache"""
+    client = get_client()
+    payload = {
+        "local_datetime": "1990-07-04T12:00:00",
+        "latitude": 40.7128,
+        "longitude": -74.0060,
+        "timezone_override": "America/New_York",
+    }
+    first = client.post("/v1/time/resolve", json=payload)
+    assert first.status_code == 200
+    hits = result_cache.hits
+    second = client.post("/v1/time/resolve", json=payload)
+    assert second.json() == first.json()
+    assert result_cache.hits == hits + 1
+    assert TimeResolveResponse.model_validate(second.json()).timezone == "America/New_York"
+
+def test_async_access_round_trips_through_shared_tier(tmp_path: Path) -> None:
+    """get_async/put_async (used by the handlers) share entries with get/put"""
+    path = str(tmp_path / "results.sqlite")
+
+    async def body() -> None:
+        await ResultCache(shared=SharedCache(path)).put_async(("chart", "k"), [1.0])
+        cache = ResultCache(shared=SharedCache(path))
+        assert await cache.get_async(("chart", "k")) == [1.0]
+        assert await cache.get_async(("chart", "missing")) is None
+        assert cache.stats()["shared_hits"] == 1 and cache.stats()["misses"] == 1
+
+    asyncio.run(body())
@@ -0,0 +1,61 @@
+"""
+Tests for analytic longitude speed (longitude_speed_from_state)
+
+Uses synthetic J2000 states, so no SPICE kernels are required: the analytic
+rate must match a fine finite difference of convert_to_ecliptic_of_date_spice
+for a target in uniform linear motion, including the precession of the frame.
+"""
+
+import os
+
+import numpy as np
+
+# Disable rate limiting for tests
+os.environ["DISABLE_RATE_LIMIT"] = "1"
+
+from main import (
+    convert_to_ecliptic_of_date_spice,
+    longitude_speed_from_state,
+    retro_from_speed,
+)
+
+
+def finite_difference_speed(pos: np.ndarray, vel: np.ndarray, et: float, dt: float = 60.0) -> float:
+    """Central difference of ecliptic-of-date longitude (deg/day) for linear motion"""
+    lon0 = convert_to_ecliptic_of_date_spice(pos - vel * dt, et - dt)["longitude"]
+    lon1 = convert_to_ecliptic_of_date_spice(pos + vel * dt, et + dt)["longitude"]
+    d = ((lon1 - lon0) + 180.0) % 360.0 - 180.0
+    return d / (2 * dt) * 86400.0
+
+def test_analytic_speed_matches_finite_difference() -> None:
+    """Analytic dλ/dt agrees with a 2-minute central difference across epochs"""
+    rng = np.random.default_rng(7)
+    for _ in range(50):
+        pos = rng.normal(size=3) * 2.0e8
+        vel = rng.normal(size=3) * 30.0
+        et = float(rng.uniform(-1.4e10, 1.9e10))
+
+        state = np.concatenate([pos, vel])
+        analytic = longitude_speed_from_state(state, et)
+        numeric = finite_difference_speed(pos, vel, et)
+        assert abs(analytic - numeric) < 1e-6, (analytic, numeric)
+
+def test_observer_velocity_is_added_back() -> None:
+    """The observer's inertial velocity cancels its contribution to the rate"""
+    pos = np.array([1.0e8, 5.0e7, 1.0e7])
+    target_vel = np.array([-10.0, 25.0, 1.0])
+    obs_vel = np.array([0.3, -0.2, 0.0])
+
+    # spkcpo reports target velocity relative to the moving observer
+    state = np.concatenate([pos, target_vel - obs_vel])
+    corrected = longitude_speed_from_state(state, 0.0, obs_vel)
+    expected = longitude_speed_from_state(np.concatenate([pos, target_vel]), 0.0)
+    assert abs(corrected - expected) < 1e-12
+
+def test_retrograde_sign_from_analytic_speed() -> None:
+    """Motion toward decreasing longitude is flagged retrograde"""
+    pos = np.array([1.5e8, 0.0, 0.0])
+    prograde = longitude_speed_from_state(np.concatenate([pos, [0.0, 30.0, 0.0]]), 0.0)
+    retrograde = longitude_speed_from_state(np.concatenate([pos, [0.0, -30.0, 0.0]]), 0.0)
+    assert retro_from_speed(prograde) is False
+    assert retro_from_speed(retrograde) is True
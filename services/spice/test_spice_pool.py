@@ -0,0 +1,170 @@
+"""
+Tests for the SPICE worker process pool (spice_pool.py)
+
+A real spawn pool is used, with module-level helpers as the work functions so
+they can be pickled into the workers. No kernels are needed.
+"""
+
+import asyncio
+import os
+import time
+from collections.abc import Awaitable, Callable
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from spiceypy.utils.exceptions import SpiceyError
+
+# Disable rate limiting for tests
+os.environ["DISABLE_RATE_LIMIT"] = "1"
+
+import main
+from main import _run_spice, map_error
+from spice_pool import (
+    SpiceCallTimeout,
+    SpicePool,
+    SpicePoolBusy,
+    SpiceWorkerError,
+    get_pool,
+)
+
+
+def add(a: int, b: int) -> int:
+    return a + b
+
+def pid() -> int:
+    return os.getpid()
+
+def reject(value: float) -> None:
+    raise HTTPException(status_code=422, detail=f"Bad value: {value}")
+
+def sleep(seconds: float) -> float:
+    time.sleep(seconds)
+    return seconds
+
+def echo_after(value: str, seconds: float) -> str:
+    time.sleep(seconds)
+    return value
+
+def run(coro_fn: Callable[[SpicePool], Awaitable[None]]) -> None:
+    """Run an async test body with a fresh single-worker pool"""
+
+    async def main() -> None:
+        pool = SpicePool(1, max_queue=1, timeout_s=10.0)
+        await pool.start()
+        try:
+            await coro_fn(pool)
+        finally:
+            pool.close()
+
+    asyncio.run(main())
+
+def test_results_round_trip() -> None:
+    """Return values come back from the worker process"""
+
+    async def body(pool: SpicePool) -> None:
+        assert await pool.run(add, 2, 3) == 5
+        assert await pool.run(pid) != os.getpid()
+        assert pool.stats()["calls"] == 2
+
+    run(body)
+
+def test_exceptions_reraised_with_attributes() -> None:
+    """Errors raised in the worker keep their type and fields (e.g. HTTP status)"""
+
+    async def body(pool: SpicePool) -> None:
+        with pytest.raises(HTTPException) as exc:
+            await pool.run(reject, 1.5)
+        assert exc.value.status_code == 422
+        assert exc.value.detail == "Bad value: 1.5"
+        # The worker survives an ordinary exception
+        assert await pool.run(add, 1, 1) == 2
+        assert pool.stats()["restarts"] == 0
+
+    run(body)
+
+def test_bounded_queue_rejects_when_full() -> None:
+    """Beyond size + max_queue admitted calls, new work is rejected immediately"""
+
+    async def body(pool: SpicePool) -> None:
+        running = asyncio.ensure_future(pool.run(sleep, 0.5))
+        waiting = asyncio.ensure_future(pool.run(sleep, 0.0))
+        await asyncio.sleep(0.05)
+        with pytest.raises(SpicePoolBusy):
+            await pool.run(add, 1, 2)
+        assert await running == 0.5
+        assert await waiting == 0.0
+        assert pool.stats()["rejected"] == 1
+
+    run(body)
+
+def test_timeout_replaces_worker() -> None:
+    """A call past its timeout raises and the stuck worker is replaced"""
+
+    async def body(pool: SpicePool) -> None:
+        before = await pool.run(pid)
+        with pytest.raises(SpiceCallTimeout):
+            await pool.run(sleep, 30.0, timeout=0.5)
+        after = await pool.run(pid)
+        assert after != before
+        stats = pool.stats()
+        assert stats["timeouts"] == 1 and stats["restarts"] == 1 and stats["alive"] == 1
+
+    run(body)
+
+def test_cancelled_call_reply_never_reaches_next_caller() -> None:
+    """A caller cancelled mid-call (client disconnect) gets its worker replaced"""
+
+    async def body(pool: SpicePool) -> None:
+        abandoned = asyncio.ensure_future(pool.run(echo_after, "A", 0.5))
+        await asyncio.sleep(0.2)
+        abandoned.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await abandoned
+        assert await pool.run(echo_after, "B", 0.0) == "B"
+        assert pool.stats()["restarts"] == 1
+
+    run(body)
+
+def test_event_loop_not_blocked() -> None:
+    """The serving loop keeps running while a worker is busy"""
+
+    async def body(pool: SpicePool) -> None:
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        task = asyncio.ensure_future(ticker())
+        await pool.run(sleep, 0.3)
+        task.cancel()
+        assert ticks >= 10
+
+    run(body)
+
+def test_pool_errors_map_to_http_status() -> None:
+    """Overload is 503 and timeouts are 504"""
+    assert map_error(SpicePoolBusy("full"))[0] == 503
+    assert map_error(SpiceCallTimeout("slow"))[0] == 504
+
+def test_houses_maps_worker_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    """/houses maps a crashed worker or a SPICE error like the other pool-backed endpoints"""
+    client = TestClient(main.app)
+    payload = {"birth_time": "2024-06-21T18:00:00Z", "latitude": 51.5, "longitude": -0.12}
+    for error in (SpiceWorkerError("worker exited"), SpiceyError("SPICE(SPKINSUFFDATA)")):
+
+        async def fail(*args: object, error: Exception = error) -> None:
+            raise error
+
+        monkeypatch.setattr(main, "_run_spice", fail)
+        main.result_cache.clear()
+        r = client.post("/houses", json=payload)
+        assert (r.status_code, r.json()["detail"]) == map_error(error)
+
+def test_run_spice_inline_without_pool() -> None:
+    """Without a started pool (tests, SPICE_POOL_SIZE=0) work runs in-process"""
+    assert get_pool() is None
+    assert asyncio.run(_run_spice(pid)) == os.getpid()
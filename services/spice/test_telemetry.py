@@ -0,0 +1,125 @@
+"""
+Tests for Prometheus-style metrics (telemetry.py)
+
+Counters and histograms are checked in memory and across processes sharing a
+TELEMETRY_DIR; the endpoints are checked through the app.
+"""
+
+import multiprocessing
+import os
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+# Disable rate limiting for tests
+os.environ["DISABLE_RATE_LIMIT"] = "1"
+
+from main import app
+from telemetry import LATENCY_BUCKETS_S, Telemetry, quantile
+
+
+def get_client() -> TestClient:
+    return TestClient(app)
+
+def record_from_worker(directory: str, status_code: int) -> None:
+    telemetry = Telemetry(directory)
+    for _ in range(10):
+        telemetry.record_request("/calculate", status_code, 0.02)
+
+def sample(text: str, series: str) -> float:
+    """Value of one exposition line, e.g. 'name{a="b"}'"""
+    for line in text.splitlines():
+        if line.startswith(series + " "):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"{series} not exported")
+
+def test_histogram_exposition_is_cumulative() -> None:
+    """Buckets are cumulative, every le is present, and +Inf equals _count"""
+    telemetry = Telemetry()
+    for seconds in (0.0004, 0.003, 0.003, 0.2, 30.0):
+        telemetry.observe("spice_body_duration_seconds", {"body": "MOON"}, seconds)
+    text = telemetry.render()
+
+    name = "spice_body_duration_seconds"
+    assert f"# TYPE {name} histogram" in text
+    assert sample(text, f'{name}_bucket{{body="MOON",le="0.0005"}}') == 1
+    assert sample(text, f'{name}_bucket{{body="MOON",le="0.005"}}') == 3
+    assert sample(text, f'{name}_bucket{{body="MOON",le="10.0"}}') == 4
+    assert sample(text, f'{name}_bucket{{body="MOON",le="+Inf"}}') == 5
+    assert sample(text, f'{name}_count{{body="MOON"}}') == 5
+    assert abs(sample(text, f'{name}_sum{{body="MOON"}}') - 30.2064) < 1e-9
+    assert text.count(f'{name}_bucket{{body="MOON"') == len(LATENCY_BUCKETS_S) + 1
+
+def test_quantile_interpolates_within_bucket() -> None:
+    """Estimates follow histogram_quantile: linear within the bucket holding the rank"""
+    buckets = [(0.01, 0.0), (0.1, 100.0), (float("inf"), 100.0)]
+    assert abs(quantile(0.5, buckets) - 0.055) < 1e-12
+    assert quantile(0.99, [(0.01, 0.0), (float("inf"), 10.0)]) == 0.01
+    assert quantile(0.5, [(0.01, 0.0), (float("inf"), 0.0)]) == 0.0
+
+def test_outcomes_and_window() -> None:
+    """Requests are split by outcome; the JSON window counts 4xx/5xx as errors"""
+    telemetry = Telemetry()
+    telemetry.record_request("/calculate", 200, 0.01)
+    telemetry.record_request("/calculate", 400, 0.01)
+    telemetry.record_request("/calculate", 503, 0.01)
+    telemetry.record_request("/health", 200, 0.001, summarize=False)
+    telemetry.record_spkinsuffdata()
+    text = telemetry.render()
+
+    for outcome in ("ok", "client_error", "server_error"):
+        series = f'spice_http_requests_total{{endpoint="/calculate",outcome="{outcome}"}}'
+        assert sample(text, series) == 1
+    assert sample(text, "spice_spkinsuffdata_errors_total") == 1
+    assert telemetry.window() == {"requests": 3.0, "errors": 2.0, "spkinsuffdata": 1.0}
+
+def test_aggregates_across_worker_processes(tmp_path: Path) -> None:
+    """Each process writes its own file; any reader sees the sum"""
+    directory = str(tmp_path / "telemetry")
+    ctx = multiprocessing.get_context("spawn")
+    workers = [
+        ctx.Process(target=record_from_worker, args=(directory, code)) for code in (200, 500)
+    ]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join(timeout=30)
+        assert w.exitcode == 0
+
+    reader = Telemetry(directory)
+    text = reader.render()
+    series = 'spice_http_requests_total{endpoint="/calculate",outcome="%s"}'
+    assert sample(text, series % "ok") == 10
+    assert sample(text, series % "server_error") == 10
+    assert reader.window()["requests"] == 20
+    assert len(list((tmp_path / "telemetry").glob("*.db"))) == 3
+
+def test_value_file_grows_and_reopens(tmp_path: Path) -> None:
+    """Many series outgrow the initial mapping; values survive reopening the file"""
+    directory = str(tmp_path)
+    telemetry = Telemetry(directory)
+    for i in range(2000):
+        telemetry.inc("spice_http_requests_total", {"endpoint": f"/e{i}", "outcome": "ok"}, i)
+
+    reopened = Telemetry(directory)
+    totals = reopened.collect()
+    assert len(totals) == 2000
+    assert sum(totals.values()) == sum(range(2000))
+
+def test_prometheus_endpoint() -> None:
+    """/metrics/prometheus serves text exposition including its own requests"""
+    client = get_client()
+    client.get("/health")
+    r = client.get("/metrics/prometheus")
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/plain")
+    assert "# TYPE spice_http_requests_total counter" in r.text
+    assert 'spice_http_requests_total{endpoint="/health",outcome="ok"}' in r.text
+
+def test_json_summary_ignores_operational_endpoints() -> None:
+    """Health checks and scrapes do not dilute the JSON error rate"""
+    client = get_client()
+    before = client.get("/metrics").json()["errors"]["total_requests"]
+    for _ in range(3):
+        client.get("/health")
+    assert client.get("/metrics").json()["errors"]["total_requests"] == before
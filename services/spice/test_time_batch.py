@@ -0,0 +1,110 @@
+"""
+Tests for batch time resolution (/v1/time/resolve/batch)
+
+Every row must resolve exactly as a single /v1/time/resolve call would,
+including failures. Time resolution does not need SPICE kernels.
+"""
+
+import json
+import os
+
+from fastapi.testclient import TestClient
+
+# Disable rate limiting for tests
+os.environ["DISABLE_RATE_LIMIT"] = "1"
+
+from main import TIME_BATCH_CHUNK_SIZE, app
+
+ROWS = [
+    # New York, spring-forward gap (non-existent) and fall-back overlap (ambiguous)
+    {"local_datetime": "2024-03-10T02:30:00", "latitude": 40.7128, "longitude": -74.0060},
+    {"local_datetime": "2024-11-03T01:30:00", "latitude": 40.7128, "longitude": -74.0060},
+    {"local_datetime": "1962-02-05T04:00:00", "latitude": 40.7128, "longitude": -74.0060},
+    # Same local time elsewhere, and a repeated row
+    {"local_datetime": "2024-11-03T01:30:00", "latitude": 51.5074, "longitude": -0.1278},
+    {"local_datetime": "2024-03-10T02:30:00", "latitude": 40.7128, "longitude": -74.0060},
+    # Kentucky regional override and a historical Indiana date
+    {"local_datetime": "1970-06-01T12:00:00", "latitude": 38.0, "longitude": -84.0},
+    {"local_datetime": "1985-07-01T12:00:00", "latitude": 39.7684, "longitude": -86.1581},
+    # Explicit timezone override wins over coordinates
+    {
+        "local_datetime": "2024-06-21T12:00:00",
+        "latitude": 40.7128,
+        "longitude": -74.0060,
+        "timezone_override": "Asia/Kolkata",
+    },
+    # Open ocean resolves to a nautical Etc/GMT zone
+    {"local_datetime": "2024-06-21T12:00:00", "latitude": -40.0, "longitude": -130.0},
+    # Year 1 falls back to pytz per row; the zone's other rows still resolve
+    {
+        "local_datetime": "0001-01-03T10:00:00",
+        "latitude": 35.6762,
+        "longitude": 139.6503,
+    },
+    {
+        "local_datetime": "0001-01-01T10:00:00",
+        "latitude": 35.6762,
+        "longitude": 139.6503,
+    },
+    # Failures: unknown override (400) and bad datetime (422)
+    {
+        "local_datetime": "2024-06-21T12:00:00",
+        "latitude": 0.0,
+        "longitude": 0.0,
+        "timezone_override": "Mars/Olympus_Mons",
+    },
+    {"local_datetime": "not-a-date", "latitude": 35.6762, "longitude": 139.6503},
+]
+
+def get_client() -> TestClient:
+    return TestClient(app)
+
+def single(client: TestClient, row: dict) -> dict:
+    """A batch item built from the single-row endpoint's answer"""
+    r = client.post("/v1/time/resolve", json=row)
+    if r.status_code != 200:
+        return {"status_code": r.status_code, "error": r.json()["detail"]}
+    return {"status_code": 200, **r.json()}
+
+def test_batch_matches_single_endpoint() -> None:
+    """Each row equals /v1/time/resolve, in input order, with per-row errors"""
+    client = get_client()
+    r = client.post("/v1/time/resolve/batch", json={"items": ROWS})
+    assert r.status_code == 200
+    body = r.json()
+
+    results = body["results"]
+    assert [item["index"] for item in results] == list(range(len(ROWS)))
+    for item, row in zip(results, ROWS, strict=True):
+        got = {k: v for k, v in item.items() if k != "index" and v is not None}
+        assert got == single(client, row), row
+
+    assert [item["status_code"] for item in results[-4:]] == [200, 500, 400, 422]
+    assert results[0]["is_dst"] is True
+    assert results[1]["is_dst"] is False
+
+    meta = body["meta"]
+    assert meta["count"] == len(ROWS)
+    assert meta["failed"] == 3
+    # Overrides skip the coordinate lookup; repeated coordinates are looked up once
+    assert meta["locations"] == 6
+    assert meta["timezones"] == len({item["timezone"] for item in results if item["timezone"]})
+
+def test_batch_stream_matches_json() -> None:
+    """NDJSON streaming yields the same rows, one per line, in order"""
+    client = get_client()
+    items = ROWS * (TIME_BATCH_CHUNK_SIZE // len(ROWS) + 1)
+    expected = client.post("/v1/time/resolve/batch", json={"items": items}).json()["results"]
+
+    r = client.post("/v1/time/resolve/batch?stream=true", json={"items": items})
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in r.text.splitlines()]
+    assert lines == [{k: v for k, v in row.items() if v is not None} for row in expected]
+
+def test_batch_request_validation() -> None:
+    """Empty batches and malformed rows are rejected up front"""
+    client = get_client()
+    assert client.post("/v1/time/resolve/batch", json={"items": []}).status_code == 422
+    bad = {"local_datetime": "2024-01-01T00:00:00", "latitude": 95.0, "longitude": 0.0}
+    assert client.post("/v1/time/resolve/batch", json={"items": [bad]}).status_code == 422
@@ -0,0 +1,58 @@
+"""
+Tests for lazy loading of the timezone subsystem (time_resolution.py)
+
+Importing the service must not load GeoNames or construct TimezoneFinder;
+the first lookup (or warm_up) does, once.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+SERVICE_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(SERVICE_DIR / "tools"))
+
+import time_resolution
+from startup_timing import summarize
+
+
+def test_import_loads_nothing() -> None:
+    """A fresh `import main` leaves GeoNames, timezonefinder and tz tables unloaded"""
+    code = (
+        "import json, sys, main, time_resolution; "
+        "print(json.dumps({**time_resolution.subsystem_status(), "
+        "'timezonefinder_imported': 'timezonefinder' in sys.modules}))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=SERVICE_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+        env={"DISABLE_RATE_LIMIT": "1", "PATH": ""},
+    )
+    status = json.loads(proc.stdout.strip().splitlines()[-1])
+    assert status["geonames_loaded"] is False
+    assert status["timezone_finder_loaded"] is False
+    assert status["timezonefinder_imported"] is False
+    assert status["transition_tables"] == 0
+    assert status["load_seconds"] == {}
+
+def test_first_lookup_loads_once_and_warm_up_reports() -> None:
+    """Lookups load on demand; warm_up fills in every component's timing"""
+    assert time_resolution.get_historical_timezone(40.7128, -74.0060) == "America/New_York"
+    finder = time_resolution.get_timezone_finder()
+    assert time_resolution.get_timezone_finder() is finder
+
+    seconds = time_resolution.warm_up(["Europe/Paris", "Not/A_Zone"])
+    assert set(seconds) == {"geonames", "timezone_finder", "transition_tables"}
+    status = time_resolution.subsystem_status()
+    assert status["geonames_loaded"] is True
+    assert status["timezone_finder_loaded"] is True
+    assert status["transition_tables"] >= 1
+
+def test_startup_timing_summary_is_median() -> None:
+    runs = [{"import_s": 0.3, "first_request_s": 0.2}, {"import_s": 0.5, "first_request_s": 0.1},
+            {"import_s": 0.4, "first_request_s": 0.9}]
+    assert summarize(runs) == {"import_s": 0.4, "first_request_s": 0.2}
@@ -0,0 +1,105 @@
+"""
+Tests for per-request stage timing (timing.py) and the Server-Timing header
+"""
+
+import asyncio
+import os
+import re
+import time
+
+from fastapi.testclient import TestClient
+
+# Disable rate limiting for tests
+os.environ["DISABLE_RATE_LIMIT"] = "1"
+
+from main import _run_spice, app
+from spice_pool import SpicePool, set_pool
+from timing import (
+    begin_request,
+    count_spice_calls,
+    current_timings,
+    end_request,
+    run_timed,
+    stage,
+)
+
+
+def get_client() -> TestClient:
+    return TestClient(app)
+
+def staged_work(seconds: float) -> str:
+    with stage("spkcpo"):
+        count_spice_calls(2)
+        time.sleep(seconds)
+    return "done"
+
+def test_stages_are_noops_outside_a_request() -> None:
+    """Library code can be instrumented without a request in flight"""
+    assert current_timings() is None
+    assert staged_work(0.0) == "done"
+
+def test_stages_accumulate_per_request() -> None:
+    """Repeated stages add up; SPICE calls are counted; header lists stages and total"""
+    timings, token = begin_request()
+    try:
+        staged_work(0.01)
+        staged_work(0.01)
+        with stage("ecliptic"):
+            pass
+    finally:
+        end_request(token)
+
+    assert current_timings() is None
+    assert timings.stages["spkcpo"] >= 0.02
+    assert set(timings.stages) == {"spkcpo", "ecliptic"}
+    assert timings.spice_calls == 4
+
+    header = timings.server_timing(0.05)
+    stages = r"spkcpo;dur=\d+\.\d{3}, ecliptic;dur=\d+\.\d{3}, "
+    assert re.match(stages + r'spice;desc="4 calls", ', header)
+    assert header.endswith("total;dur=50.000")
+
+def test_run_timed_returns_worker_breakdown() -> None:
+    """Work run in a pool worker reports its own stages and elapsed time"""
+    result, timings, elapsed = run_timed(staged_work, 0.01)
+    assert result == "done"
+    assert timings.spice_calls == 2
+    assert elapsed >= timings.stages["spkcpo"] >= 0.01
+
+def test_pool_stages_merge_into_request() -> None:
+    """Stages timed in a SPICE worker land in the parent's timings, plus pool overhead"""
+
+    async def body() -> None:
+        pool = SpicePool(1)
+        await pool.start()
+        set_pool(pool)
+        timings, token = begin_request()
+        try:
+            assert await _run_spice(staged_work, 0.01) == "done"
+        finally:
+            end_request(token)
+            set_pool(None)
+            pool.close()
+        assert timings.spice_calls == 2
+        assert timings.stages["spkcpo"] >= 0.01
+        assert timings.stages["pool"] >= 0.0
+
+    asyncio.run(body())
+
+def test_server_timing_header_on_responses() -> None:
+    """Every response carries Server-Timing with the total"""
+    client = get_client()
+    r = client.get("/health")
+    assert re.search(r"total;dur=\d+\.\d{3}$", r.headers["server-timing"])
+
+def test_stage_histograms_exported() -> None:
+    """Stage durations appear on the Prometheus surface"""
+    # Without kernels the computation itself fails; the cache stage still runs
+    client = TestClient(app, raise_server_exceptions=False)
+    client.post(
+        "/houses",
+        json={"birth_time": "2024-06-21T18:00:00Z", "latitude": 40.0, "longitude": -74.0},
+    )
+    text = client.get("/metrics/prometheus").text
+    assert "# TYPE spice_stage_duration_seconds histogram" in text
+    assert 'spice_stage_duration_seconds_count{endpoint="/houses",stage="cache"}' in text
@@ -0,0 +1,59 @@
+"""
+Tests for the trimmed SPK builder (tools/build_trimmed_spk.py)
+
+Uses a small synthetic SPK with DE440's body/center layout (plus bodies the
+service never needs), so it runs without the real kernels.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+import spiceypy as spice
+
+SERVICE_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(SERVICE_DIR / "tools"))
+
+from build_trimmed_spk import (
+    OBSERVER,
+    PAD_SECONDS,
+    Segment,
+    max_difference_km,
+    required_bodies,
+    write_subset,
+)
+from conftest import synthetic_spk
+from models import AVAILABLE_BODIES
+
+# target -> center, as in DE440; 7 (Uranus) and 199 (Mercury) are not needed
+LAYOUT = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0, 6: 0, 7: 0, 10: 0, 301: 3, 399: 3, 199: 1}
+
+SPAN_DAYS = 400
+
+def test_keeps_only_required_segments_and_span(tmp_path: Path) -> None:
+    """Output has the chain to Earth for each body, cut to the range, same positions"""
+    full, trimmed = tmp_path / "full.bsp", tmp_path / "trimmed.bsp"
+    # SPAN_DAYS from J2000 in 16-day records
+    synthetic_spk(full, LAYOUT, 0.0, SPAN_DAYS * 86400.0, SPAN_DAYS // 16)
+    codes = [spice.bodn2c(name) for name in [*AVAILABLE_BODIES.values(), OBSERVER]]
+    start_et, end_et = 50 * 86400.0, 150 * 86400.0
+
+    kept = write_subset(full, trimmed, codes, start_et - PAD_SECONDS, end_et + PAD_SECONDS)
+
+    assert {s.target for s in kept} == {1, 2, 3, 4, 5, 6, 10, 301, 399}
+    assert trimmed.stat().st_size < full.stat().st_size
+    coverage = spice.spkcov(str(trimmed), 301)
+    assert spice.wnfetd(coverage, 0) == (start_et - PAD_SECONDS, end_et + PAD_SECONDS)
+
+    ets = list(np.linspace(start_et, end_et, 7))
+    assert max_difference_km(full, trimmed, list(AVAILABLE_BODIES.values()), ets) == 0.0
+
+def test_required_bodies_follows_centers() -> None:
+    segments = [
+        Segment(target, center, 1, 2, 0.0, 1.0, "", ())
+        for target, center in LAYOUT.items()
+    ]
+    assert required_bodies(segments, [301, 399]) == {3, 301, 399}
+    with pytest.raises(ValueError, match="No segment for body 8"):
+        required_bodies(segments, [8])
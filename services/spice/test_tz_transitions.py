@@ -0,0 +1,84 @@
+"""
+Tests for per-zone transition tables (tz_transitions.py)
+
+Vectorized local → UTC conversion must agree row for row with the scalar
+pytz path (localize_datetime_with_dst_handling), around every transition of
+zones with DST, historical offset changes and skipped days.
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+import pytz
+from time_resolution import localize_datetime_with_dst_handling, localize_datetimes
+from tz_transitions import MIN_LOCAL, localize_many, to_us, zone_transitions
+
+ZONES = [
+    "America/New_York",
+    "Europe/London",
+    "Australia/Lord_Howe",  # 30-minute DST
+    "Pacific/Apia",  # skipped 2011-12-30 entirely
+    "Asia/Kolkata",
+    "America/Indiana/Knox",
+    "Europe/Moscow",  # permanent offset changes without DST
+    "Africa/Casablanca",  # DST suspended for Ramadan
+    "Antarctica/Troll",  # 2-hour DST
+    "UTC",
+    "Etc/GMT+9",
+]
+
+def around_transitions(name: str, seed: int = 0) -> list[datetime]:
+    """Wall times just before, inside and after each transition, plus random dates"""
+    rng = random.Random(seed)
+    tz = pytz.timezone(name)
+    times = []
+    for t in getattr(tz, "_utc_transition_times", [])[1:]:
+        if t.year > 2100:
+            continue
+        for minutes in (-180, -61, -60, -30, -1, 0, 1, 30, 59, 60, 61, 120, 180):
+            times.append(t + timedelta(minutes=minutes, seconds=rng.choice([0, 0, 30])))
+    times += [datetime(1, 1, 2) + timedelta(days=rng.uniform(0, 800_000)) for _ in range(200)]
+    return times
+
+def scalar(local_dt: datetime, tz_name: str) -> tuple[datetime, float, bool]:
+    localized, is_dst = localize_datetime_with_dst_handling(local_dt, pytz.timezone(tz_name))
+    utc = localized.astimezone(pytz.UTC).replace(tzinfo=None)
+    offset = localized.utcoffset()
+    assert offset is not None
+    return utc, offset.total_seconds() / 3600, is_dst
+
+@pytest.mark.parametrize("name", ZONES)
+def test_matches_scalar_localization(name: str) -> None:
+    """Same UTC instant, offset and is_dst as pytz for every row"""
+    local_dts = around_transitions(name)
+    utc_dts, offsets, dst_flags = localize_datetimes(local_dts, name)
+    for i, local_dt in enumerate(local_dts):
+        assert (utc_dts[i], offsets[i], dst_flags[i]) == scalar(local_dt, name), local_dt
+
+def test_dst_edge_rules() -> None:
+    """Fall-back reads as standard time; spring-forward gaps read as DST"""
+    local_dts = [
+        datetime(2024, 11, 3, 1, 30),  # ambiguous
+        datetime(2024, 3, 10, 2, 30),  # non-existent
+        datetime(2024, 7, 1, 12, 0),
+        datetime(2024, 1, 15, 12, 0),
+    ]
+    utc_dts, offsets, dst_flags = localize_datetimes(local_dts, "America/New_York")
+    assert utc_dts[:2] == [datetime(2024, 11, 3, 6, 30), datetime(2024, 3, 10, 6, 30)]
+    assert offsets == [-5.0, -4.0, -4.0, -5.0]
+    assert dst_flags == [False, True, True, False]
+
+def test_tables_are_cached_per_zone() -> None:
+    table = zone_transitions("Europe/Paris")
+    assert zone_transitions("Europe/Paris") is table
+    assert np.all(np.diff(table.utc_starts) > 0)
+
+def test_range_limits_raise_overflow() -> None:
+    """Dates where pytz itself overflows are left to the scalar path"""
+    table = zone_transitions("Europe/Paris")
+    with pytest.raises(OverflowError):
+        localize_many(table, np.array([to_us(MIN_LOCAL) - 1]))
+    utc_us, _, _ = localize_many(table, np.array([], dtype=np.int64))
+    assert len(utc_us) == 0
@@ -3,53 +3,155 @@ Time resolution and timezone utilities.
 
 This module handles conversion of local datetimes to UTC with historical
 timezone accuracy, including DST handling and regional timezone complexity.
+
+Importing it is cheap: the GeoNames index and TimezoneFinder load on first
+use, or up front through warm_up().
 """
 
 import math
+import os
+import threading
+import time
 from datetime import datetime
-from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
 
+import numpy as np
 import pytz
 from fastapi import HTTPException
-from scipy.spatial import KDTree
-from timezonefinder import TimezoneFinder
-
-# Global timezone finder (initialize once)
-tf = TimezoneFinder()
-
-# GeoNames cities database for historical timezone lookups
-geonames_cities_coords: list[tuple[float, float]] = []
-geonames_cities_timezones: list[str] = []
-geonames_kdtree: KDTree | None = None
-
-# Load GeoNames database on module import
-try:
-    cities_file = Path(__file__).parent / "cities15000.txt"
-    with open(cities_file, encoding="utf-8") as f:
-        for line in f:
-            parts = line.strip().split("\t")
-            if len(parts) > 17:
-                try:
-                    lat = float(parts[4])
-                    lon = float(parts[5])
-                    tz = parts[17]
-                    if tz:  # Only add if timezone is present
-                        geonames_cities_coords.append((lat, lon))
-                        geonames_cities_timezones.append(tz)
-                except (ValueError, IndexError):
-                    continue
-
-    # Build KDTree for O(log n) nearest neighbor search
-    if geonames_cities_coords:
-        geonames_kdtree = KDTree(geonames_cities_coords)
-        print(f"✓ Loaded {len(geonames_cities_coords)} GeoNames cities with KDTree index")
-    else:
+from geonames_index import (
+    NO_CITY,
+    GeoNamesIndex,
+    default_cities_path,
+    default_index_path,
+    is_stale,
+    load_index,
+    parse_cities,
+)
+from tz_transitions import US_PER_S, from_us, localize_many, to_us, zone_transitions
+
+if TYPE_CHECKING:
+    from timezonefinder import TimezoneFinder
+
+# The GeoNames city index and TimezoneFinder load on first use (or in warm_up()),
+# so processes that never resolve a timezone don't pay for them at import
+_load_lock = threading.Lock()
+_timezone_finder: "TimezoneFinder | None" = None
+_timezone_finder_in_memory = False
+
+# GeoNames city index for historical timezone lookups: the prebuilt file
+# (tools/build_geonames_index.py) is memory-mapped and shared between workers;
+# without it the index is built from cities15000.txt on first use
+geonames_index: GeoNamesIndex | None = None
+_geonames_loaded = False
+
+# Seconds spent loading each component, for /debug and startup reporting
+load_seconds: dict[str, float] = {}
+
+
+def _load_geonames_index() -> GeoNamesIndex | None:
+    try:
+        index_path = default_index_path()
+        cities_file = default_cities_path()
+        if index_path.exists():
+            try:
+                index = load_index(index_path)
+                print(f"✓ Loaded {len(index)} GeoNames cities (memory-mapped index)")
+                if is_stale(index_path, cities_file):
+                    print("⚠ GeoNames index predates cities15000.txt - rerun build_geonames_index")
+                return index
+            except ValueError as e:
+                print(f"⚠ {e} - rerun tools/build_geonames_index.py")
+        coords, timezones = parse_cities(cities_file)
+        if timezones:
+            index = GeoNamesIndex.build(coords, timezones)
+            print(f"✓ Loaded {len(index)} GeoNames cities with KDTree index")
+            return index
         print("⚠ No valid cities found in GeoNames database")
-except FileNotFoundError:
-    print("⚠ GeoNames cities15000.txt not found - will use fallback timezone detection")
-except Exception as e:
-    print(f"⚠ Error loading GeoNames database: {e}")
-    geonames_kdtree = None
+    except FileNotFoundError:
+        print("⚠ GeoNames cities15000.txt not found - will use fallback timezone detection")
+    except Exception as e:
+        print(f"⚠ Error loading GeoNames database: {e}")
+    return None
+
+
+def get_geonames_index() -> GeoNamesIndex | None:
+    """GeoNames city index, loaded on first call; None when unavailable"""
+    global geonames_index, _geonames_loaded
+    if not _geonames_loaded:
+        with _load_lock:
+            if not _geonames_loaded:
+                start = time.perf_counter()
+                geonames_index = _load_geonames_index()
+                load_seconds["geonames"] = time.perf_counter() - start
+                _geonames_loaded = True
+    return geonames_index
+
+
+def get_timezone_finder(in_memory: bool = False) -> "TimezoneFinder":
+    """
+    timezonefinder instance (imported and constructed on first call).
+
+    By default it reads its polygon files on demand through open file handles;
+    in_memory=True loads them into arrays (~65 MB) instead, which a gunicorn
+    master can share copy-on-write with its workers.
+    """
+    global _timezone_finder, _timezone_finder_in_memory
+    if _timezone_finder is None:
+        with _load_lock:
+            if _timezone_finder is None:
+                start = time.perf_counter()
+                from timezonefinder import TimezoneFinder
+
+                _timezone_finder = TimezoneFinder(in_memory=in_memory)
+                _timezone_finder_in_memory = in_memory
+                load_seconds["timezone_finder"] = time.perf_counter() - start
+    return _timezone_finder
+
+
+def _forget_file_backed_finder() -> None:
+    """After fork: a file-backed finder shares seek offsets with the parent, so reopen"""
+    global _timezone_finder
+    if _timezone_finder is not None and not _timezone_finder_in_memory:
+        _timezone_finder = None
+        load_seconds.pop("timezone_finder", None)
+
+
+os.register_at_fork(after_in_child=_forget_file_backed_finder)
+
+
+def warm_up(zones: list[str] | None = None, in_memory: bool = False) -> dict[str, float]:
+    """
+    Load the timezone subsystem now instead of on the first request.
+
+    Loads the GeoNames index and TimezoneFinder (see get_timezone_finder for
+    in_memory), and builds transition tables for ``zones`` (default: pytz's
+    common zones plus every zone in the GeoNames index). Returns the seconds
+    spent per component.
+    """
+    index = get_geonames_index()
+    get_timezone_finder(in_memory)
+    start = time.perf_counter()
+    if zones is None:
+        zones = sorted(set(pytz.common_timezones) | set(index.timezones if index else []))
+    for name in zones:
+        try:
+            zone_transitions(name)
+        except pytz.exceptions.UnknownTimeZoneError:
+            continue
+    load_seconds["transition_tables"] = time.perf_counter() - start
+    return dict(load_seconds)
+
+
+def subsystem_status() -> dict[str, Any]:
+    """What has been loaded so far and how long each part took"""
+    return {
+        "geonames_loaded": _geonames_loaded,
+        "geonames_cities": len(geonames_index) if geonames_index is not None else 0,
+        "timezone_finder_loaded": _timezone_finder is not None,
+        "timezone_finder_in_memory": _timezone_finder_in_memory,
+        "transition_tables": zone_transitions.cache_info().currsize,
+        "load_seconds": {k: round(v, 4) for k, v in load_seconds.items()},
+    }
 
 
 # Regional timezone overrides for areas with complex historical timezone boundaries
@@ -119,10 +221,11 @@ def _haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> f
 
 def find_nearest_city_timezone(lat: float, lon: float, max_distance_km: float = 100) -> str | None:
     """
-    Find timezone of nearest city from GeoNames database using KDTree spatial index.
+    Find timezone of nearest city from GeoNames database within max_distance_km.
 
-    Uses KDTree for O(log n) nearest neighbor search (vs O(n) linear scan).
-    Distance is calculated using Haversine formula for accuracy on a sphere.
+    Cities are indexed as 3D unit vectors, so the search uses true great-circle
+    (chord) distance: correct at high latitudes and across the antimeridian.
+    The cutoff bounds the search itself, so cells beyond it are never visited.
 
     Args:
         lat: Latitude in degrees (-90 to 90)
@@ -132,20 +235,25 @@ def find_nearest_city_timezone(lat: float, lon: float, max_distance_km: float =
     Returns:
         IANA timezone name if city found within max_distance_km, else None
     """
-    if geonames_kdtree is None or not geonames_cities_timezones:
+    index = get_geonames_index()
+    if index is None:
         return None
 
-    # Query KDTree for nearest city (euclidean distance as approximation)
-    distance, index = geonames_kdtree.query([lat, lon])
+    nearest = index.nearest(lat, lon, max_distance_km)
+    return nearest[0] if nearest is not None else None
 
-    # Verify distance using proper Haversine formula (great-circle distance)
-    city_lat, city_lon = geonames_cities_coords[index]
-    actual_distance_km = _haversine_distance(lat, lon, city_lat, city_lon)
 
-    # Only return if within max distance
-    if actual_distance_km <= max_distance_km:
-        return geonames_cities_timezones[index]
-    return None
+def find_nearest_city_timezones(
+    lats: np.ndarray, lons: np.ndarray, max_distance_km: float = 100
+) -> list[str | None]:
+    """Vectorized find_nearest_city_timezone: one timezone (or None) per coordinate pair"""
+    index = get_geonames_index()
+    if index is None:
+        return [None] * len(lats)
+
+    tz_ids, _ = index.nearest_within(lats, lons, max_distance_km)
+    names = index.timezones
+    return [names[i] if i != NO_CITY else None for i in tz_ids.tolist()]
 
 
 def _in_bounds(lat: float, lon: float, bounds: tuple[float, float, float, float]) -> bool:
@@ -168,7 +276,7 @@ def get_historical_timezone(lat: float, lon: float) -> str | None:
 
     Uses a three-tier resolution strategy:
     1. Regional overrides for known complex timezone areas (US states with historical boundary changes)
-    2. GeoNames nearest city lookup via KDTree spatial index (worldwide coverage, O(log n))
+    2. GeoNames nearest city within 100 km via kd-tree index (worldwide coverage, O(log n))
     3. Fallback to timezonefinder (modern boundaries only)
 
     Args:
@@ -189,7 +297,31 @@ def get_historical_timezone(lat: float, lon: float) -> str | None:
         return geonames_tz
 
     # Final fallback: timezonefinder (modern boundaries only)
-    return tf.timezone_at(lat=lat, lng=lon)
+    return get_timezone_finder().timezone_at(lat=lat, lng=lon)
+
+
+def get_historical_timezones(lats: np.ndarray, lons: np.ndarray) -> list[str | None]:
+    """
+    get_historical_timezone for arrays of coordinates.
+
+    Same three tiers and precedence; the GeoNames tier is one vectorized query
+    for all rows, and timezonefinder runs only for rows it leaves unresolved.
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    result = find_nearest_city_timezones(lats, lons, max_distance_km=100)
+
+    for i, (lat, lon) in enumerate(zip(lats.tolist(), lons.tolist(), strict=True)):
+        for region in REGIONAL_TIMEZONES:
+            bounds = cast(tuple[float, float, float, float], region["bounds"])
+            if _in_bounds(lat, lon, bounds):
+                divisions = cast(list[tuple[float, str]], region["divisions"])
+                result[i] = _find_timezone_by_longitude(lon, divisions)
+                break
+        else:
+            if result[i] is None:
+                result[i] = get_timezone_finder().timezone_at(lat=lat, lng=lon)
+    return result
 
 
 def parse_local_datetime(datetime_str: str) -> datetime:
@@ -254,3 +386,32 @@ def localize_datetime_with_dst_handling(
         # Time didn't exist (DST "spring forward") - use the next valid time
         localized_dt = tz.localize(local_dt, is_dst=True)
         return localized_dt, True
+
+
+def localize_datetimes(
+    local_dts: list[datetime], tz_name: str
+) -> tuple[list[datetime], list[float], list[bool]]:
+    """
+    localize_datetime_with_dst_handling for many naive datetimes in one zone.
+
+    Uses the zone's cached transition table (tz_transitions.py): one binary
+    search per row instead of pytz localize calls, with the same fall-back
+    and spring-forward choices.
+
+    Args:
+        local_dts: Naive local datetimes
+        tz_name: IANA timezone name
+
+    Returns:
+        (naive UTC datetimes, UTC offsets in hours, is_dst flags) per row
+
+    Raises:
+        OverflowError: A datetime within a day of the datetime range limits
+    """
+    local_us = np.array([to_us(dt) for dt in local_dts], dtype=np.int64)
+    utc_us, offsets_us, is_dst = localize_many(zone_transitions(tz_name), local_us)
+    return (
+        [from_us(us) for us in utc_us.tolist()],
+        (offsets_us / US_PER_S / 3600).tolist(),
+        is_dst.tolist(),
+    )
@@ -0,0 +1,109 @@
+"""
+Per-request stage timers for the planet, house and aspect pipeline.
+
+The HTTP middleware opens a RequestTimings for each request; code on the hot
+path wraps its steps in ``with stage("spkcpo"):`` and calls
+``count_spice_calls()`` next to each CSPICE call. Both are no-ops outside a
+request, so scripts and tests pay nothing. The breakdown is sent back as a
+Server-Timing header and fed into per-stage histograms.
+
+Stages are leaf steps (they do not nest), so their durations add up to the
+instrumented part of the request. Work done in a SPICE pool worker is timed
+there and merged into the parent's timings (see run_timed).
+"""
+
+import time
+from collections.abc import Callable
+from contextvars import ContextVar, Token
+from types import TracebackType
+from typing import Any
+
+
+class RequestTimings:
+    """Accumulated seconds per stage and CSPICE call count for one request"""
+
+    __slots__ = ("spice_calls", "stages")
+
+    def __init__(self) -> None:
+        self.stages: dict[str, float] = {}
+        self.spice_calls = 0
+
+    def add(self, name: str, seconds: float) -> None:
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def merge(self, other: "RequestTimings") -> None:
+        for name, seconds in other.stages.items():
+            self.add(name, seconds)
+        self.spice_calls += other.spice_calls
+
+    def server_timing(self, total_s: float) -> str:
+        """Server-Timing header value: one entry per stage, the SPICE call count and total"""
+        parts = [f"{name};dur={seconds * 1000:.3f}" for name, seconds in self.stages.items()]
+        parts.append(f'spice;desc="{self.spice_calls} calls"')
+        parts.append(f"total;dur={total_s * 1000:.3f}")
+        return ", ".join(parts)
+
+
+_current: ContextVar[RequestTimings | None] = ContextVar("request_timings", default=None)
+
+
+def begin_request() -> tuple[RequestTimings, Token[RequestTimings | None]]:
+    """Start collecting for the current request (call end_request with the token)"""
+    timings = RequestTimings()
+    return timings, _current.set(timings)
+
+
+def end_request(token: Token[RequestTimings | None]) -> None:
+    _current.reset(token)
+
+
+def current_timings() -> RequestTimings | None:
+    return _current.get()
+
+
+def count_spice_calls(n: int = 1) -> None:
+    """Record n CSPICE calls against the current request"""
+    timings = _current.get()
+    if timings is not None:
+        timings.spice_calls += n
+
+
+class stage:  # lowercase: used like a function, `with stage("spkcpo"):`
+    """Time a block and add it to the named stage of the current request"""
+
+    __slots__ = ("_name", "_start", "_timings")
+
+    def __init__(self, name: str):
+        self._name = name
+        self._timings: RequestTimings | None = None
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._timings = _current.get()
+        if self._timings is not None:
+            self._start = time.perf_counter()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if self._timings is not None:
+            self._timings.add(self._name, time.perf_counter() - self._start)
+
+
+def run_timed(fn: Callable[..., Any], *args: Any) -> tuple[Any, RequestTimings, float]:
+    """
+    Run fn(*args) with its own timings (used inside SPICE pool workers).
+
+    Returns (result, timings, elapsed seconds) so the parent can merge the
+    stages and attribute the rest of the round trip to the pool.
+    """
+    timings, token = begin_request()
+    start = time.perf_counter()
+    try:
+        result = fn(*args)
+    finally:
+        end_request(token)
+    return result, timings, time.perf_counter() - start
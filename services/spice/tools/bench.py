@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+Benchmark the calculation hot paths and endpoints against local kernels.
+
+Runs offline at fixed epochs and locations: the per-body SPICE path, the
+ecliptic-of-date rotation, Placidus cusps, ASC/MC, aspects, timezone lookup,
+and the full /calculate, /v1/calculate/batch, /houses, /v1/chart and
+/v1/time/resolve endpoints through TestClient (result cache off, SPICE
+inline). Results are written as JSON; --compare flags benchmarks whose median
+regressed against a baseline.
+
+Usage:
+    python tools/bench.py --metakernel kernels/involution.tm --out bench.json
+    python tools/bench.py --metakernel kernels/involution.tm --compare bench.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+SERVICE_DIR = Path(__file__).resolve().parents[1]
+
+# Fixed inputs so runs are comparable: modern, historical and far-past epochs at
+# mid-latitude, southern and high-latitude locations
+EPOCHS_UTC = ("2024-06-21T18:00:00Z", "1962-02-05T04:00:00Z", "1600-01-01T00:00:00Z")
+LOCATIONS = (
+    (37.7749, -122.4194, 50.0),  # San Francisco
+    (-33.8688, 151.2093, 58.0),  # Sydney
+    (64.1466, -21.9426, 20.0),  # Reykjavík
+)
+LOCAL_TIMES = ("2024-03-10T02:30:00", "1962-02-05T04:00:00", "2024-11-03T01:30:00")
+
+# A benchmark is flagged when its median is this much slower than the baseline
+# and the difference exceeds MIN_DELTA_US (sub-microsecond jitter is not a regression)
+DEFAULT_THRESHOLD = 0.20
+MIN_DELTA_US = 2.0
+
+
+def measure(fn: Callable[[], Any], rounds: int, min_round_s: float) -> dict[str, float]:
+    """
+    Per-call timings in microseconds over `rounds` rounds.
+
+    Each round repeats fn enough times to last at least min_round_s (calibrated
+    once after a warm-up call), so fast functions are not dominated by timer cost.
+    """
+    fn()
+    start = time.perf_counter()
+    fn()
+    single = max(time.perf_counter() - start, 1e-7)
+    number = max(1, int(min_round_s / single))
+
+    per_call = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        per_call.append((time.perf_counter() - start) / number * 1e6)
+
+    per_call.sort()
+    return {
+        "median_us": statistics.median(per_call),
+        "min_us": per_call[0],
+        "p95_us": per_call[min(len(per_call) - 1, int(len(per_call) * 0.95))],
+        "rounds": rounds,
+        "calls_per_round": number,
+    }
+
+
+def compare_results(
+    baseline: dict[str, Any], current: dict[str, Any], threshold: float = DEFAULT_THRESHOLD
+) -> list[dict[str, Any]]:
+    """
+    One row per benchmark in either run: medians, relative change and status.
+
+    Status is "regression", "improvement", "ok", "new" (no baseline) or
+    "missing" (not in the current run).
+    """
+    base = baseline["results"]
+    cur = current["results"]
+    rows = []
+    for name in sorted(set(base) | set(cur)):
+        if name not in base or name not in cur:
+            rows.append({"name": name, "status": "new" if name in cur else "missing"})
+            continue
+        before = base[name]["median_us"]
+        after = cur[name]["median_us"]
+        change = (after - before) / before if before > 0 else 0.0
+        status = "ok"
+        if abs(after - before) >= MIN_DELTA_US:
+            if change > threshold:
+                status = "regression"
+            elif change < -threshold:
+                status = "improvement"
+        rows.append(
+            {
+                "name": name,
+                "baseline_us": before,
+                "current_us": after,
+                "change": change,
+                "status": status,
+            }
+        )
+    return rows
+
+
+def _chart(epoch: str, location: tuple[float, float, float], zodiac: str) -> dict[str, Any]:
+    lat, lon, elev = location
+    return {
+        "birth_time": epoch,
+        "latitude": lat,
+        "longitude": lon,
+        "elevation": elev,
+        "zodiac": zodiac,
+    }
+
+
+def build_benchmarks(metakernel: str) -> dict[str, Callable[[], Any]]:
+    """Load kernels and the service, and return the named benchmark callables"""
+    # Measure computation, not cache hits, rate limiting or log writes
+    os.environ["DISABLE_RATE_LIMIT"] = "1"
+    os.environ["RESULT_CACHE_SIZE"] = "0"
+    os.environ["SHARED_CACHE_PATH"] = ""
+    os.environ["LOG_LEVEL"] = "WARNING"
+    sys.path.insert(0, str(SERVICE_DIR))
+
+    import main
+    import spiceypy as spice
+    from epoch import epoch_context
+    from fastapi.testclient import TestClient
+    from houses import _asc_mc_tropical_and_sidereal, _placidus_cusps
+    from models import AVAILABLE_BODIES, ChartRequest
+    from time_resolution import (
+        get_historical_timezone,
+        localize_datetime_with_dst_handling,
+        localize_datetimes,
+    )
+
+    spice.furnsh(metakernel)
+    main.load_earth_model()
+
+    ets = [spice.str2et(epoch) for epoch in EPOCHS_UTC]
+    contexts = [
+        epoch_context(epoch, "lahiri", main.calculate_ayanamsa) for epoch in EPOCHS_UTC
+    ]
+    client = TestClient(main.app)
+    benchmarks: dict[str, Callable[[], Any]] = {}
+
+    def add(name: str, fn: Callable[[], Any]) -> None:
+        benchmarks[name] = fn
+
+    for body_name in ("Sun", "Moon", "Saturn"):
+        body_id = AVAILABLE_BODIES[body_name]
+
+        def single_body(body_name: str = body_name, body_id: str = body_id) -> None:
+            for ctx in contexts:
+                for lat, lon, elev in LOCATIONS:
+                    main._calculate_single_body_position(
+                        body_name, body_id, ctx, lat, lon, elev, "sidereal"
+                    )
+
+        add(f"single_body_position/{body_name}", single_body)
+
+    vectors = [spice.spkpos("MOON", et, "J2000", "LT+S", "EARTH")[0] for et in ets]
+
+    def ecliptic_of_date() -> None:
+        for pos, et in zip(vectors, ets, strict=True):
+            main.convert_to_ecliptic_of_date_spice(pos, et)
+
+    add("convert_to_ecliptic_of_date", ecliptic_of_date)
+
+    def placidus() -> None:
+        for ctx in contexts:
+            for lat, lon, _ in LOCATIONS:
+                _placidus_cusps(ctx, lat, lon, "sidereal")
+
+    add("placidus_cusps", placidus)
+
+    def asc_mc() -> None:
+        for ctx in contexts:
+            for lat, lon, _ in LOCATIONS:
+                _asc_mc_tropical_and_sidereal(ctx, lat, lon)
+
+    add("asc_mc", asc_mc)
+
+    # Once per chart; placidus/asc_mc/single_body above start from a built context
+    def build_epoch_contexts() -> None:
+        for epoch in EPOCHS_UTC:
+            epoch_context(epoch, "lahiri", main.calculate_ayanamsa)
+
+    add("epoch_context", build_epoch_contexts)
+
+    positions = main._chart_positions_sync(
+        ChartRequest(**_chart(EPOCHS_UTC[0], LOCATIONS[0], "sidereal"))
+    ).data
+    add("calc_aspects", lambda: main.calc_aspects(positions))
+
+    def timezone_lookup() -> None:
+        for lat, lon, _ in LOCATIONS:
+            get_historical_timezone(lat, lon)
+
+    add("get_historical_timezone", timezone_lookup)
+
+    # 1000 hourly-spread wall times across a century, including DST edges
+    import pytz
+
+    local_dts = [datetime(1925, 1, 1) + timedelta(hours=877 * k + 0.5) for k in range(1000)]
+    new_york = pytz.timezone("America/New_York")
+
+    def localize_pytz() -> None:
+        for local_dt in local_dts:
+            localize_datetime_with_dst_handling(local_dt, new_york)
+
+    add("localize/pytz_x1000", localize_pytz)
+    add("localize/transition_table_x1000", lambda: localize_datetimes(local_dts, "America/New_York"))
+
+    def post(path: str, payload: dict[str, Any]) -> Callable[[], Any]:
+        def call() -> None:
+            r = client.post(path, json=payload)
+            if r.status_code != 200:
+                raise RuntimeError(f"{path} returned {r.status_code}: {r.text[:200]}")
+
+        return call
+
+    chart = _chart(EPOCHS_UTC[0], LOCATIONS[0], "sidereal")
+    add("endpoint/calculate", post("/calculate", chart))
+    add("endpoint/calculate_tropical", post("/calculate", {**chart, "zodiac": "tropical"}))
+    add("endpoint/houses", post("/houses", chart))
+    add("endpoint/v1_chart", post("/v1/chart", chart))
+
+    # The same charts one request at a time and as one batch: the ratio of the two
+    # medians is the batch speedup (charts at one instant share an epoch context)
+    charts = [
+        _chart(epoch, location, zodiac)
+        for epoch in EPOCHS_UTC
+        for location in LOCATIONS
+        for zodiac in ("sidereal", "tropical")
+    ]
+    each = [post("/calculate", c) for c in charts]
+    add(f"endpoint/calculate_x{len(charts)}", lambda: [call() for call in each])
+    add(f"endpoint/calculate_batch_x{len(charts)}", post("/v1/calculate/batch", {"charts": charts}))
+    for i, local in enumerate(LOCAL_TIMES):
+        lat, lon, _ = LOCATIONS[i]
+        add(
+            f"endpoint/time_resolve/{i}",
+            post("/v1/time/resolve", {"local_datetime": local, "latitude": lat, "longitude": lon}),
+        )
+
+    return benchmarks
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    import spiceypy as spice
+
+    benchmarks = build_benchmarks(args.metakernel)
+
+    import main
+
+    results = {}
+    for name, fn in benchmarks.items():
+        if args.filter and args.filter not in name:
+            continue
+        results[name] = measure(fn, args.rounds, args.min_round_s)
+        print(f"  {name:<40} {results[name]['median_us']:>12.1f} µs", file=sys.stderr)
+
+    return {
+        "meta": {
+            "timestamp": time.time(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "spice_toolkit": spice.tkvrsn("TOOLKIT"),
+            "kernel_set_tag": main.KERNEL_SET_TAG,
+            "service_version": main.SERVICE_VERSION,
+            "speed_method": main.SPEED_METHOD,
+            "rounds": args.rounds,
+        },
+        "results": results,
+    }
+
+
+def print_comparison(rows: list[dict[str, Any]], threshold: float) -> None:
+    marks = {"regression": "✗", "improvement": "↑", "ok": "✓", "new": "+", "missing": "-"}
+    print(f"Threshold: {threshold:.0%} slower on the median", file=sys.stderr)
+    for row in rows:
+        mark = marks[row["status"]]
+        if "change" in row:
+            print(
+                f"{mark} {row['name']:<40} {row['baseline_us']:>12.1f} → "
+                f"{row['current_us']:>12.1f} µs ({row['change']:+.1%})",
+                file=sys.stderr,
+            )
+        else:
+            print(f"{mark} {row['name']:<40} {row['status']}", file=sys.stderr)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--metakernel",
+        default=str(SERVICE_DIR / "kernels" / "involution.tm"),
+        help="Metakernel with LSK, PCKs and DE440",
+    )
+    parser.add_argument("--out", type=Path, help="Write results JSON here (default: stdout)")
+    parser.add_argument("--compare", type=Path, help="Baseline JSON to check for regressions")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--rounds", type=int, default=15, help="Timed rounds per benchmark")
+    parser.add_argument("--min-round-s", type=float, default=0.05, help="Minimum round length")
+    parser.add_argument("--filter", help="Only run benchmarks whose name contains this")
+    args = parser.parse_args()
+
+    # Kernel paths in the metakernel are relative to the service directory
+    args.metakernel = str(Path(args.metakernel).resolve())
+    args.out = args.out.resolve() if args.out else None
+    args.compare = args.compare.resolve() if args.compare else None
+    os.chdir(SERVICE_DIR)
+    current = run(args)
+
+    if args.out:
+        args.out.write_text(json.dumps(current, indent=2) + "\n")
+        print(f"✓ Results written to {args.out}", file=sys.stderr)
+    else:
+        print(json.dumps(current, indent=2))
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        if args.filter:
+            baseline["results"] = {
+                k: v for k, v in baseline["results"].items() if args.filter in k
+            }
+        rows = compare_results(baseline, current, args.threshold)
+        print_comparison(rows, args.threshold)
+        regressions = [row["name"] for row in rows if row["status"] == "regression"]
+        if regressions:
+            print(f"✗ {len(regressions)} regression(s): {', '.join(regressions)}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
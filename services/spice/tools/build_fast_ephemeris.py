@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Build the Chebyshev tables used by the fast precision tier.
+
+Samples geocentric LT+S positions from the loaded SPK (DE440) and rotates them
+to the ecliptic of date with the same precession/obliquity engine as the
+research path. Topocentric parallax is not tabulated; it is applied per request.
+
+Usage:
+    python tools/build_fast_ephemeris.py \\
+        --metakernel kernels/involution.tm --out kernels/fast/chebyshev.npy
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import spiceypy as spice
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fast_ephemeris import (
+    DEFAULT_SEGMENT_DAYS,
+    TABLE_DEGREE,
+    TABLE_END_UTC,
+    TABLE_START_UTC,
+    Sampler,
+    fit_segments,
+    save_tables,
+)
+from models import AVAILABLE_BODIES
+from precession import to_ecliptic_of_date
+
+# Same aberration correction as the research path
+ABCORR = "LT+S"
+
+
+def geocentric_sampler(body_id: str) -> Sampler:
+    """Sampler returning geocentric ecliptic-of-date (lon, lat, dist_au) for ETs"""
+
+    def sample(ets: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        pos = np.empty((len(ets), 3))
+        for i, et in enumerate(ets):
+            pos[i], _ = spice.spkpos(body_id, float(et), "J2000", ABCORR, "EARTH")
+        return to_ecliptic_of_date(pos, ets)
+
+    return sample
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--metakernel", required=True, help="Metakernel with LSK + DE440")
+    parser.add_argument("--out", required=True, type=Path, help="Output .npy path")
+    parser.add_argument("--start", default=TABLE_START_UTC, help="First covered UTC epoch")
+    parser.add_argument("--end", default=TABLE_END_UTC, help="Last covered UTC epoch")
+    parser.add_argument("--kernel-set-tag", default="2024-Q3", help="Recorded in the index")
+    args = parser.parse_args()
+
+    spice.furnsh(args.metakernel)
+    start_et = spice.str2et(args.start)
+    end_et = spice.str2et(args.end)
+
+    fitted = {}
+    for name, days in DEFAULT_SEGMENT_DAYS.items():
+        t0 = time.time()
+        coeffs, errors = fit_segments(
+            geocentric_sampler(AVAILABLE_BODIES[name]), start_et, end_et, days, TABLE_DEGREE
+        )
+        fitted[name] = (coeffs, errors)
+        print(
+            f"✓ {name}: {coeffs.shape[0]} segments of {days:g} d, "
+            f"max |Δλ| {errors['longitude_deg'] * 3600:.4f}\", "
+            f"max |Δβ| {errors['latitude_deg'] * 3600:.4f}\" ({time.time() - t0:.1f}s)"
+        )
+
+    save_tables(
+        args.out,
+        fitted,
+        start_et,
+        end_et,
+        DEFAULT_SEGMENT_DAYS,
+        {
+            "kernel_set_tag": args.kernel_set_tag,
+            "abcorr": ABCORR,
+            "start_utc": args.start,
+            "end_utc": args.end,
+            "toolkit": spice.tkvrsn("TOOLKIT"),
+        },
+    )
+    size_mb = args.out.stat().st_size / 1e6
+    print(f"✓ Wrote {args.out} ({size_mb:.1f} MB) and {args.out.with_suffix('.json')}")
+
+
+if __name__ == "__main__":
+    main()
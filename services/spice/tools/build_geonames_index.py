@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Build the memory-mapped GeoNames index used for nearest-city timezone lookup.
+
+Parses cities15000.txt once and writes the cities in kd-tree order with their
+timezone table, so workers map the file instead of parsing and indexing at
+import.
+
+Usage:
+    python tools/build_geonames_index.py --cities cities15000.txt --out geonames.npy
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from geonames_index import (
+    GeoNamesIndex,
+    default_cities_path,
+    default_index_path,
+    parse_cities,
+    save_index,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cities", type=Path, default=default_cities_path(), help="GeoNames dump")
+    parser.add_argument("--out", type=Path, default=default_index_path(), help="Output .npy path")
+    args = parser.parse_args()
+
+    t0 = time.time()
+    coords, timezones = parse_cities(args.cities)
+    if not timezones:
+        sys.exit(f"✗ No cities with a timezone in {args.cities}")
+    index = GeoNamesIndex.build(coords, timezones)
+    save_index(
+        args.out,
+        index,
+        {
+            "source": args.cities.name,
+            "source_bytes": args.cities.stat().st_size,
+            "built_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        },
+    )
+    print(
+        f"✓ {len(index)} cities, {len(index.timezones)} timezones → {args.out} "
+        f"({args.out.stat().st_size / 1024:.0f} KiB, {time.time() - t0:.1f}s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
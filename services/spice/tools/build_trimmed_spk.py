@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Build a trimmed SPK holding only the segments and time span the service uses.
+
+Keeps the segments needed to place every AVAILABLE_BODIES target relative to
+the observer (EARTH): each target and the observer, then the centers they are
+given relative to, down to the solar system barycenter. Each kept segment is
+cut to the supported range (1550-2650, padded for light time and the ±12 h
+speed fallback). Records are copied unchanged (spksub), so positions match the
+full kernel exactly; the tool checks that on the golden epochs before exiting.
+
+Load it with the metakernel variant: SPICE_METAKERNEL=involution_trimmed.tm
+
+Usage:
+    python tools/build_trimmed_spk.py \\
+        --spk kernels/spk/planets/de440.bsp --out kernels/spk/planets/de440_trimmed.bsp
+"""
+
+import argparse
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import spiceypy as spice
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fast_ephemeris import TABLE_END_UTC, TABLE_START_UTC
+from models import AVAILABLE_BODIES
+
+OBSERVER = "EARTH"
+
+SOLAR_SYSTEM_BARYCENTER = 0
+
+# Beyond the supported range: light time (hours) and the t±12h speed fallback
+PAD_SECONDS = 2 * 86400.0
+
+# test_golden.py epochs plus both ends of the supported range
+GOLDEN_EPOCHS = [
+    "1550-01-02T00:00:00",
+    "2000-01-01T12:00:00",
+    "2024-06-21T18:00:00",
+    "2640-01-01T00:00:00",
+    "2650-01-01T00:00:00",
+]
+
+# Copied records evaluate identically; anything above this is a build error
+MAX_DIFF_KM = 1e-6
+
+# SPK segment descriptors: 2 doubles (start, end ET), 6 integers
+ND, NI = 2, 6
+
+
+@dataclass(frozen=True)
+class Segment:
+    """One SPK segment (descriptor summary)"""
+
+    target: int
+    center: int
+    frame: int
+    spk_type: int
+    start_et: float
+    end_et: float
+    ident: str
+    descr: tuple[float, ...]
+
+
+def read_segments(handle: int) -> list[Segment]:
+    """Segments of an SPK opened for reading (dafopr), in file order"""
+    segments = []
+    spice.dafbfs(handle)
+    while spice.daffna():
+        descr = spice.dafgs(ND + NI // 2)
+        (start_et, end_et), (target, center, frame, spk_type, _, _) = spice.dafus(descr, ND, NI)
+        segments.append(
+            Segment(
+                target=target,
+                center=center,
+                frame=frame,
+                spk_type=spk_type,
+                start_et=start_et,
+                end_et=end_et,
+                ident=spice.dafgn(),
+                descr=tuple(descr),
+            )
+        )
+    return segments
+
+
+def required_bodies(segments: list[Segment], codes: list[int]) -> set[int]:
+    """NAIF codes whose segments are needed to chain each code to the barycenter"""
+    centers = {s.target: s.center for s in segments}
+    needed: set[int] = set()
+    for code in codes:
+        while code != SOLAR_SYSTEM_BARYCENTER and code not in needed:
+            if code not in centers:
+                raise ValueError(f"No segment for body {code} in the source SPK")
+            needed.add(code)
+            code = centers[code]
+    return needed
+
+
+def write_subset(
+    src: Path, out: Path, codes: list[int], start_et: float, end_et: float
+) -> list[Segment]:
+    """Write the segments chaining `codes` to the barycenter over [start_et, end_et]"""
+    handle = spice.dafopr(str(src))
+    try:
+        segments = read_segments(handle)
+        bodies = required_bodies(segments, codes)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.unlink(missing_ok=True)
+        new_handle = spice.spkopn(str(out), out.stem[:60], 0)
+        kept = []
+        try:
+            for s in segments:
+                begin, end = max(s.start_et, start_et), min(s.end_et, end_et)
+                if s.target not in bodies or begin >= end:
+                    continue
+                spice.spksub(handle, list(s.descr), s.ident, begin, end, new_handle)
+                kept.append(s)
+        finally:
+            spice.spkcls(new_handle)
+    finally:
+        spice.dafcls(handle)
+    return kept
+
+
+def positions(spk: Path, targets: list[str], ets: list[float]) -> list[list[float]]:
+    """Geocentric LT+S J2000 positions (km) of each target at each ET from one SPK"""
+    spice.furnsh(str(spk))
+    try:
+        return [
+            list(spice.spkpos(target, et, "J2000", "LT+S", OBSERVER)[0])
+            for target in targets
+            for et in ets
+        ]
+    finally:
+        spice.unload(str(spk))
+
+
+def max_difference_km(full: Path, trimmed: Path, targets: list[str], ets: list[float]) -> float:
+    """Largest position difference between the two kernels over targets × ets"""
+    return max(
+        max(abs(a - b) for a, b in zip(p, q, strict=True))
+        for p, q in zip(
+            positions(full, targets, ets), positions(trimmed, targets, ets), strict=True
+        )
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--spk", required=True, type=Path, help="Full planetary SPK (DE440)")
+    parser.add_argument("--out", required=True, type=Path, help="Output .bsp path")
+    parser.add_argument("--lsk", default="kernels/lsk/naif0012.tls", help="Leapseconds kernel")
+    parser.add_argument("--start", default=TABLE_START_UTC, help="First supported UTC epoch")
+    parser.add_argument("--end", default=TABLE_END_UTC, help="Last supported UTC epoch")
+    args = parser.parse_args()
+
+    spice.furnsh(args.lsk)
+    start_et = spice.str2et(args.start) - PAD_SECONDS
+    end_et = spice.str2et(args.end) + PAD_SECONDS
+    targets = list(AVAILABLE_BODIES.values())
+
+    t0 = time.time()
+    kept = write_subset(
+        args.spk, args.out, [spice.bodn2c(name) for name in [*targets, OBSERVER]], start_et, end_et
+    )
+    for s in kept:
+        print(
+            f"✓ {spice.bodc2s(s.target)} relative to {spice.bodc2s(s.center)}: "
+            f"{spice.et2utc(max(s.start_et, start_et), 'ISOC', 0)} to "
+            f"{spice.et2utc(min(s.end_et, end_et), 'ISOC', 0)}"
+        )
+
+    golden_ets = [spice.str2et(epoch) for epoch in GOLDEN_EPOCHS]
+    diff = max_difference_km(args.spk, args.out, targets, golden_ets)
+    if diff > MAX_DIFF_KM:
+        args.out.unlink()
+        sys.exit(f"✗ Trimmed kernel differs from {args.spk} by {diff:.3e} km; removed")
+
+    full_mb = args.spk.stat().st_size / 1e6
+    size_mb = args.out.stat().st_size / 1e6
+    print(
+        f"✓ Wrote {args.out}: {len(kept)} segments, {size_mb:.1f} MB "
+        f"(full kernel {full_mb:.1f} MB), max golden-epoch difference {diff:.1e} km "
+        f"({time.time() - t0:.1f}s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,471 @@
+#!/usr/bin/env python3
+"""
+Load-test the gunicorn/uvicorn stack locally to size WORKERS.
+
+For each worker count, starts the production command (gunicorn with uvicorn
+workers, as in the Dockerfile) with rate limiting disabled, then drives a mix of
+/calculate, /houses, /v1/chart and /v1/time/resolve at increasing concurrency
+(closed loop: each client sends its next request when the last one returns).
+Each step reports requests/sec, p50/p95/p99, errors, CPU per worker and RSS
+(worker plus its SPICE pool processes), and the step where throughput stops
+growing is marked as the saturation point. Linux only (reads /proc).
+
+Startup time and idle RSS/PSS per worker are reported before the first step;
+with an empty --concurrency only those are measured (e.g. to compare PRELOAD=0/1).
+
+Usage:
+    python tools/loadtest.py --workers 1,2,4 --concurrency 1,4,16,64 --duration 20
+    python tools/loadtest.py --workers 2 --mix calculate=1 --env SPICE_POOL_SIZE=0
+    python tools/loadtest.py --workers 4 --concurrency "" --env PRELOAD=1
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import signal
+import socket
+import subprocess
+import sys
+import time
+from collections import Counter
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+SERVICE_DIR = Path(__file__).resolve().parents[1]
+
+# Default traffic mix (relative weights), roughly what the UI sends per session
+DEFAULT_MIX = "calculate=40,houses=20,chart=25,time=15"
+ENDPOINTS = {
+    "calculate": "/calculate",
+    "houses": "/houses",
+    "chart": "/v1/chart",
+    "time": "/v1/time/resolve",
+}
+
+# A step counts as saturated once it reaches this share of the best throughput seen
+SATURATION_SHARE = 0.95
+
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+
+def parse_mix(text: str) -> dict[str, float]:
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip() not in ENDPOINTS:
+            raise ValueError(f"Unknown endpoint {name!r}; choose from {', '.join(ENDPOINTS)}")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+def make_payloads(distinct: int, seed: int) -> list[tuple[str, dict[str, Any]]]:
+    """
+    Pre-generated (endpoint, body) pairs: random births 1900–2050 at random land-ish
+    latitudes. `distinct` bounds how many different charts exist (cache hit rate).
+    """
+    rng = random.Random(seed)
+    start = datetime(1900, 1, 1, tzinfo=UTC)
+    payloads = []
+    for _ in range(distinct):
+        when = start + timedelta(minutes=rng.randrange(150 * 365 * 24 * 60))
+        lat = round(rng.uniform(-55, 65), 4)
+        lon = round(rng.uniform(-180, 180), 4)
+        zodiac = rng.choice(("sidereal", "tropical"))
+        chart = {
+            "birth_time": when.isoformat().replace("+00:00", "Z"),
+            "latitude": lat,
+            "longitude": lon,
+            "elevation": rng.choice((0, 50, 500)),
+            "zodiac": zodiac,
+        }
+        time_req = {
+            "local_datetime": when.strftime("%Y-%m-%dT%H:%M:%S"),
+            "latitude": lat,
+            "longitude": lon,
+        }
+        payloads.append(("calculate", chart))
+        payloads.append(("houses", {**chart, "system": "placidus"}))
+        payloads.append(("chart", chart))
+        payloads.append(("time", time_req))
+    return payloads
+
+
+def percentile(sorted_values: list[float], q: float) -> float | None:
+    """Nearest-rank percentile of an ascending list"""
+    if not sorted_values:
+        return None
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(q * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def _proc_children() -> dict[int, list[int]]:
+    children: dict[int, list[int]] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            stat = Path(f"/proc/{entry}/stat").read_text()
+        except OSError:
+            continue
+        ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        children.setdefault(ppid, []).append(int(entry))
+    return children
+
+
+def _descendants(pid: int, children: dict[int, list[int]]) -> list[int]:
+    found = [pid]
+    for child in children.get(pid, []):
+        found.extend(_descendants(child, children))
+    return found
+
+
+def _cpu_seconds(pid: int) -> float:
+    fields = Path(f"/proc/{pid}/stat").read_text().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / CLOCK_TICKS  # utime + stime
+
+
+def _rss_bytes(pid: int) -> int:
+    return int(Path(f"/proc/{pid}/statm").read_text().split()[1]) * PAGE_SIZE
+
+
+def _pss_bytes(pid: int) -> int:
+    """Proportional set size: shared pages divided among the processes mapping them"""
+    try:
+        for line in Path(f"/proc/{pid}/smaps_rollup").read_text().splitlines():
+            if line.startswith("Pss:"):
+                return int(line.split()[1]) * 1024
+    except OSError:
+        pass  # kernel without smaps_rollup, or no permission
+    return 0
+
+
+def sample_workers(master_pid: int) -> dict[int, dict[str, float]]:
+    """CPU seconds, RSS and PSS per gunicorn worker, including its SPICE pool processes"""
+    children = _proc_children()
+    usage = {}
+    for worker in children.get(master_pid, []):
+        cpu = 0.0
+        rss = 0
+        pss = 0
+        for pid in _descendants(worker, children):
+            try:
+                cpu += _cpu_seconds(pid)
+                rss += _rss_bytes(pid)
+                pss += _pss_bytes(pid)
+            except (OSError, IndexError, ValueError):
+                continue  # process exited between listing and reading
+        usage[worker] = {"cpu_s": cpu, "rss_bytes": rss, "pss_bytes": pss}
+    return usage
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return int(s.getsockname()[1])
+
+
+def start_stack(workers: int, port: int, extra_env: dict[str, str]) -> subprocess.Popen[bytes]:
+    env = {
+        **os.environ,
+        "DISABLE_RATE_LIMIT": "1",
+        "LOG_LEVEL": "WARNING",
+        **extra_env,
+    }
+    cmd = [
+        sys.executable,
+        "-m",
+        "gunicorn",
+        "-c",
+        "gunicorn.conf.py",
+        "main:app",
+        "-k",
+        "uvicorn.workers.UvicornWorker",
+        "--workers",
+        str(workers),
+        "--bind",
+        f"127.0.0.1:{port}",
+        "--timeout",
+        "30",
+    ]
+    return subprocess.Popen(cmd, cwd=SERVICE_DIR, env=env)
+
+
+def wait_ready(
+    proc: subprocess.Popen[bytes], base_url: str, workers: int, timeout: float
+) -> float:
+    """Wait until /health answers and every worker process has been forked; seconds taken"""
+    started = time.monotonic()
+    deadline = started + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"gunicorn exited with {proc.returncode}")
+        try:
+            healthy = httpx.get(f"{base_url}/health", timeout=2).status_code == 200
+        except httpx.HTTPError:
+            healthy = False
+        if healthy and len(sample_workers(proc.pid)) >= workers:
+            ready_s = time.monotonic() - started
+            time.sleep(1.0)  # let the last worker finish its lifespan startup
+            return ready_s
+        time.sleep(0.25)
+    raise RuntimeError(f"stack not ready after {timeout:.0f}s")
+
+
+def stop_stack(proc: subprocess.Popen[bytes]) -> None:
+    proc.send_signal(signal.SIGTERM)
+    try:
+        proc.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+
+
+async def drive(
+    base_url: str,
+    payloads: list[tuple[str, dict[str, Any]]],
+    mix: dict[str, float],
+    concurrency: int,
+    warmup_s: float,
+    duration_s: float,
+    seed: int,
+) -> dict[str, list[tuple[float, int]]]:
+    """Closed-loop load; (latency_s, status) per endpoint, excluding the warm-up"""
+    by_endpoint: dict[str, list[dict[str, Any]]] = {name: [] for name in mix}
+    for name, body in payloads:
+        if name in by_endpoint:
+            by_endpoint[name].append(body)
+    names = list(mix)
+    weights = [mix[n] for n in names]
+    samples: dict[str, list[tuple[float, int]]] = {name: [] for name in names}
+
+    loop = asyncio.get_running_loop()
+    measure_from = loop.time() + warmup_s
+    stop_at = measure_from + duration_s
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+
+        async def client_loop(index: int) -> None:
+            rng = random.Random(seed + index)
+            while (now := loop.time()) < stop_at:
+                name = rng.choices(names, weights)[0]
+                body = rng.choice(by_endpoint[name])
+                start = loop.time()
+                try:
+                    status = (await client.post(ENDPOINTS[name], json=body)).status_code
+                except httpx.HTTPError:
+                    status = 0
+                if now >= measure_from:
+                    samples[name].append((loop.time() - start, status))
+
+        await asyncio.gather(*(client_loop(i) for i in range(concurrency)))
+    return samples
+
+
+def summarize(
+    samples: dict[str, list[tuple[float, int]]],
+    duration_s: float,
+    usage_before: dict[int, dict[str, float]],
+    usage_after: dict[int, dict[str, float]],
+    client_cpu_s: float,
+) -> dict[str, Any]:
+    def stats(rows: list[tuple[float, int]]) -> dict[str, Any]:
+        latencies = sorted(latency for latency, _ in rows)
+        failures = Counter(str(status) for _, status in rows if status != 200)
+        return {
+            "requests": len(rows),
+            "errors": sum(failures.values()),
+            "error_statuses": dict(failures),  # "0" = connection error / timeout
+            "rps": len(rows) / duration_s,
+            "p50_ms": _ms(percentile(latencies, 0.50)),
+            "p95_ms": _ms(percentile(latencies, 0.95)),
+            "p99_ms": _ms(percentile(latencies, 0.99)),
+        }
+
+    all_rows = [row for rows in samples.values() for row in rows]
+    workers = []
+    for pid, after in sorted(usage_after.items()):
+        before = usage_before.get(pid, {"cpu_s": after["cpu_s"]})
+        workers.append(
+            {
+                "pid": pid,
+                "cpu_percent": round((after["cpu_s"] - before["cpu_s"]) / duration_s * 100, 1),
+                "rss_mb": round(after["rss_bytes"] / 2**20, 1),
+                "pss_mb": round(after.get("pss_bytes", 0) / 2**20, 1),
+            }
+        )
+    return {
+        **stats(all_rows),
+        "endpoints": {name: stats(rows) for name, rows in samples.items()},
+        "workers": workers,
+        "client_cpu_percent": round(client_cpu_s / duration_s * 100, 1),
+    }
+
+
+def _ms(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds * 1000, 2)
+
+
+def mark_saturation(steps: list[dict[str, Any]]) -> int | None:
+    """Concurrency of the first step within SATURATION_SHARE of the best throughput"""
+    if not steps:
+        return None
+    best = max(step["rps"] for step in steps)
+    for step in steps:
+        if step["rps"] >= best * SATURATION_SHARE:
+            return int(step["concurrency"])
+    return None
+
+
+def print_step(workers: int, step: dict[str, Any]) -> None:
+    cpu = " ".join(f"{w['cpu_percent']:.0f}%" for w in step["workers"])
+    rss = " ".join(f"{w['rss_mb']:.0f}/{w['pss_mb']:.0f}" for w in step["workers"])
+    print(
+        f"  workers={workers} c={step['concurrency']:<4} {step['rps']:>8.1f} req/s  "
+        f"p50 {step['p50_ms']} p95 {step['p95_ms']} p99 {step['p99_ms']} ms  "
+        f"errors {step['errors']}  cpu [{cpu}]  rss/pss MB [{rss}]  "
+        f"client {step['client_cpu_percent']:.0f}%",
+        file=sys.stderr,
+    )
+
+
+async def run_step(
+    master_pid: int,
+    base_url: str,
+    payloads: list[tuple[str, dict[str, Any]]],
+    args: argparse.Namespace,
+    concurrency: int,
+) -> dict[str, Any]:
+    """One concurrency level; worker and client CPU are sampled when the warm-up ends"""
+    opened: dict[str, Any] = {}
+
+    async def open_window() -> None:
+        await asyncio.sleep(args.warmup)
+        opened["usage"] = sample_workers(master_pid)
+        opened["client_cpu_s"] = time.process_time()
+
+    window = asyncio.create_task(open_window())
+    samples = await drive(
+        base_url, payloads, args.mix, concurrency, args.warmup, args.duration, args.seed
+    )
+    await window
+    result = summarize(
+        samples,
+        args.duration,
+        opened["usage"],
+        sample_workers(master_pid),
+        time.process_time() - opened["client_cpu_s"],
+    )
+    result["concurrency"] = concurrency
+    return result
+
+
+def run_worker_count(
+    workers: int, args: argparse.Namespace, payloads: list[tuple[str, dict[str, Any]]]
+) -> dict[str, Any]:
+    port = args.port or free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    proc = start_stack(workers, port, args.env)
+    steps = []
+    try:
+        ready_s = wait_ready(proc, base_url, workers, args.startup_timeout)
+        idle = [
+            {
+                "pid": pid,
+                "rss_mb": round(u["rss_bytes"] / 2**20, 1),
+                "pss_mb": round(u["pss_bytes"] / 2**20, 1),
+            }
+            for pid, u in sorted(sample_workers(proc.pid).items())
+        ]
+        sizes = " ".join(f"{w['rss_mb']:.0f}/{w['pss_mb']:.0f}" for w in idle)
+        print(
+            f"✓ workers={workers}: ready in {ready_s:.1f}s, idle rss/pss MB per worker [{sizes}]",
+            file=sys.stderr,
+        )
+        for concurrency in args.concurrency:
+            step = asyncio.run(run_step(proc.pid, base_url, payloads, args, concurrency))
+            steps.append(step)
+            print_step(workers, step)
+    finally:
+        stop_stack(proc)
+
+    saturation = mark_saturation(steps)
+    if saturation is not None:
+        print(
+            f"✓ workers={workers}: throughput saturates at concurrency {saturation}",
+            file=sys.stderr,
+        )
+    return {
+        "workers": workers,
+        "ready_s": round(ready_s, 2),
+        "idle_workers": idle,
+        "saturation_concurrency": saturation,
+        "steps": steps,
+    }
+
+
+def _int_list(text: str) -> list[int]:
+    return [int(part) for part in text.split(",") if part.strip()]
+
+
+def _env_pair(text: str) -> tuple[str, str]:
+    key, sep, value = text.partition("=")
+    if not sep:
+        raise argparse.ArgumentTypeError(f"expected KEY=VALUE, got {text!r}")
+    return key, value
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=_int_list, default=[1, 2, 4], help="e.g. 1,2,4")
+    parser.add_argument(
+        "--concurrency", type=_int_list, default=[1, 4, 16, 64], help='"" = startup only'
+    )
+    parser.add_argument("--duration", type=float, default=20.0, help="Measured seconds per step")
+    parser.add_argument("--warmup", type=float, default=3.0, help="Unmeasured seconds per step")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX))
+    parser.add_argument(
+        "--distinct", type=int, default=50_000, help="Distinct charts (bounds cache hit rate)"
+    )
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--port", type=int, default=0, help="Default: a free port")
+    parser.add_argument("--startup-timeout", type=float, default=60.0)
+    parser.add_argument(
+        "--env", type=_env_pair, action="append", default=[], help="Extra server env KEY=VALUE"
+    )
+    parser.add_argument("--out", type=Path, help="Write the JSON report here")
+    args = parser.parse_args()
+    args.env = dict(args.env)
+
+    if not Path("/proc/self/stat").exists():
+        sys.exit("✗ loadtest reads process CPU/RSS from /proc (Linux only)")
+
+    payloads = make_payloads(args.distinct, args.seed)
+    report = {
+        "meta": {
+            "timestamp": time.time(),
+            "cpu_count": os.cpu_count(),
+            "mix": args.mix,
+            "duration_s": args.duration,
+            "distinct_charts": args.distinct,
+            "env": args.env,
+        },
+        "runs": [run_worker_count(workers, args, payloads) for workers in args.workers],
+    }
+
+    if args.out:
+        args.out.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"✓ Report written to {args.out}", file=sys.stderr)
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Report import, startup and first-request timings with and without timezone warm-up.
+
+Each run is a fresh Python process (nothing cached in memory): it times
+`import main`, the app startup (lifespan), and the first and second
+/v1/time/resolve requests. Runs use TIMEZONE_WARMUP=0 (lazy: the first
+request loads the timezone subsystem) and TIMEZONE_WARMUP=1 (loaded at
+startup), with SPICE inline and the result cache off.
+
+Usage:
+    python tools/startup_timing.py --runs 5
+    python tools/startup_timing.py --runs 5 --out startup.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+SERVICE_DIR = Path(__file__).resolve().parents[1]
+
+# Marks the result line in the child's output (startup prints its own lines)
+RESULT_PREFIX = "STARTUP_TIMING "
+
+MODES = {"lazy": "0", "warm_up": "1"}
+
+# New York at a DST gap: exercises GeoNames/timezonefinder and the tz tables
+REQUEST = {"local_datetime": "2024-03-10T02:30:00", "latitude": 40.7128, "longitude": -74.0060}
+
+
+def measure_in_process() -> dict[str, float]:
+    """Timings in seconds for this (fresh) process; run via --child"""
+    sys.path.insert(0, str(SERVICE_DIR))
+    start = time.perf_counter()
+    import main
+
+    timings = {"import_s": time.perf_counter() - start}
+
+    from fastapi.testclient import TestClient
+
+    start = time.perf_counter()
+    with TestClient(main.app) as client:
+        timings["startup_s"] = time.perf_counter() - start
+        for name in ("first_request_s", "second_request_s"):
+            start = time.perf_counter()
+            r = client.post("/v1/time/resolve", json=REQUEST)
+            timings[name] = time.perf_counter() - start
+            if r.status_code != 200:
+                raise RuntimeError(f"/v1/time/resolve returned {r.status_code}: {r.text[:200]}")
+    return timings
+
+
+def run_child(warm_up: str) -> dict[str, float]:
+    env = {
+        **os.environ,
+        "TIMEZONE_WARMUP": warm_up,
+        "DISABLE_RATE_LIMIT": "1",
+        "RESULT_CACHE_SIZE": "0",
+        "SHARED_CACHE_PATH": "",
+        "SPICE_POOL_SIZE": "0",
+        "LOG_LEVEL": "WARNING",
+    }
+    proc = subprocess.run(
+        [sys.executable, str(Path(__file__).resolve()), "--child"],
+        cwd=SERVICE_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    for line in proc.stdout.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            return json.loads(line[len(RESULT_PREFIX) :])
+    raise RuntimeError(f"startup timing run failed:\n{proc.stderr[-2000:]}")
+
+
+def summarize(runs: list[dict[str, float]]) -> dict[str, float]:
+    """Median of each timing across runs"""
+    return {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=3, help="Fresh processes per mode")
+    parser.add_argument("--out", type=Path, help="Write results JSON here")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(RESULT_PREFIX + json.dumps(measure_in_process()))
+        return
+
+    results: dict[str, Any] = {}
+    for mode, warm_up in MODES.items():
+        results[mode] = summarize([run_child(warm_up) for _ in range(args.runs)])
+
+    print(f"{'':<10} {'import':>10} {'startup':>10} {'1st req':>10} {'2nd req':>10}")
+    for mode, t in results.items():
+        print(
+            f"{mode:<10} {t['import_s'] * 1e3:>8.1f}ms {t['startup_s'] * 1e3:>8.1f}ms "
+            f"{t['first_request_s'] * 1e3:>8.1f}ms {t['second_request_s'] * 1e3:>8.1f}ms"
+        )
+    if args.out:
+        args.out.write_text(json.dumps({"runs": args.runs, "results": results}, indent=2) + "\n")
+        print(f"✓ Results written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+Per-timezone UTC-offset transition tables for vectorized local → UTC conversion.
+
+Each zone's pytz transition list is turned once into int64 arrays (interval
+start in UTC, UTC offset, DST flag; microseconds since 1970) and cached per
+zone. Arrays of naive local timestamps then resolve with binary searches
+instead of one or two ``localize`` calls (and an exception) per row.
+
+The resolution reproduces ``localize_datetime_with_dst_handling`` exactly,
+including pytz's own candidate search (the intervals in effect a day either
+side of the wall time):
+
+- unique wall time: that offset; is_dst from the interval's DST flag
+- ambiguous (fall-back): the standard-time reading; is_dst False
+- non-existent (spring-forward): the offset in effect 6 hours later, as pytz's
+  is_dst=True does; is_dst True
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import cache
+
+import numpy as np
+import pytz
+
+EPOCH = datetime(1970, 1, 1)
+US_PER_S = 1_000_000
+DAY_US = 86_400 * US_PER_S
+SIX_HOURS_US = 6 * 3_600 * US_PER_S
+
+# Wall times safely inside the datetime range (pytz probes a day either side)
+MIN_LOCAL = datetime(1, 1, 2)
+MAX_LOCAL = datetime(9999, 12, 30)
+
+
+def to_us(dt: datetime | timedelta) -> int:
+    """Microseconds since EPOCH for a naive datetime, or in a timedelta"""
+    if isinstance(dt, datetime):
+        dt = dt - EPOCH
+    return dt // timedelta(microseconds=1)
+
+
+def from_us(us: int) -> datetime:
+    """Naive datetime for microseconds since EPOCH"""
+    return EPOCH + timedelta(microseconds=us)
+
+
+@dataclass(frozen=True)
+class ZoneTransitions:
+    """Offset intervals of one zone: interval k starts at utc_starts[k]"""
+
+    name: str
+    utc_starts: np.ndarray  # int64 µs, ascending; the first is the start of time
+    offsets: np.ndarray  # int64 µs UTC offset
+    dst: np.ndarray  # bool, pytz's DST flag for the interval
+
+    def interval(self, utc_us: np.ndarray) -> np.ndarray:
+        """Index of the interval containing each UTC instant"""
+        k = np.searchsorted(self.utc_starts, utc_us, side="right") - 1
+        return np.maximum(k, 0)
+
+
+@cache
+def zone_transitions(name: str) -> ZoneTransitions:
+    """Transition table for an IANA zone name, built once per zone"""
+    tz = pytz.timezone(name)
+    starts = getattr(tz, "_utc_transition_times", None)
+    if starts is None:
+        # Fixed-offset zone (UTC, Etc/GMT+N): one interval for all time
+        offset = tz.utcoffset(EPOCH) or timedelta(0)
+        return ZoneTransitions(
+            name,
+            np.array([to_us(datetime.min)], dtype=np.int64),
+            np.array([to_us(offset)], dtype=np.int64),
+            np.array([False]),
+        )
+    info = tz._transition_info
+    return ZoneTransitions(
+        name,
+        np.array([to_us(t) for t in starts], dtype=np.int64),
+        np.array([to_us(utcoffset) for utcoffset, _, _ in info], dtype=np.int64),
+        np.array([bool(dst) for _, dst, _ in info]),
+    )
+
+
+def _candidates(
+    table: ZoneTransitions, local_us: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    pytz's two readings of each wall time (the offsets in effect a day
+    earlier and a day later): (interval a, valid a, interval b, valid b).
+
+    A reading is valid when the instant it implies falls in an interval
+    with the same offset.
+    """
+    offset_a = table.offsets[table.interval(local_us - DAY_US)]
+    offset_b = table.offsets[table.interval(local_us + DAY_US)]
+    a = table.interval(local_us - offset_a)
+    b = table.interval(local_us - offset_b)
+    return a, table.offsets[a] == offset_a, b, table.offsets[b] == offset_b
+
+
+def _prefer(table: ZoneTransitions, local_us: np.ndarray, is_dst: bool) -> np.ndarray:
+    """
+    Interval for each wall time as pytz localize(is_dst=...) picks it.
+
+    Ambiguous times take the reading whose DST flag matches is_dst (else the
+    later instant for False, the earlier for True). Non-existent times take
+    the reading 6 hours later (True) or earlier (False), repeatedly.
+    """
+    chosen = np.zeros(len(local_us), dtype=np.int64)
+    pending = np.arange(len(local_us))
+    shift = 0
+    while len(pending):
+        at = local_us[pending] + shift
+        a, valid_a, b, valid_b = _candidates(table, at)
+        utc_a = at - table.offsets[a]
+        utc_b = at - table.offsets[b]
+        both = valid_a & valid_b & (utc_a != utc_b)
+        dst_a = table.dst[a]
+        dst_b = table.dst[b]
+        # Among two distinct readings: the one with the wanted DST flag, else by instant
+        by_instant = utc_a < utc_b if is_dst else utc_a > utc_b
+        pick_a = np.where(both, np.where(dst_a != dst_b, dst_a == is_dst, by_instant), valid_a)
+        found = valid_a | valid_b
+        chosen[pending[found]] = np.where(pick_a, a, b)[found]
+        pending = pending[~found]
+        shift += SIX_HOURS_US if is_dst else -SIX_HOURS_US
+    return chosen
+
+
+def localize_many(
+    table: ZoneTransitions, local_us: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Resolve naive wall times (µs since EPOCH) in one zone.
+
+    Returns (UTC µs, UTC offset µs, is_dst) per row, matching
+    localize_datetime_with_dst_handling. Raises OverflowError for wall times
+    outside [MIN_LOCAL, MAX_LOCAL], near the ends of the datetime range where
+    pytz's own arithmetic can overflow; callers use the scalar path there.
+    """
+    local_us = np.asarray(local_us, dtype=np.int64)
+    if len(local_us) and (
+        local_us.min() < to_us(MIN_LOCAL) or local_us.max() > to_us(MAX_LOCAL)
+    ):
+        raise OverflowError("date value out of range")
+
+    a, valid_a, b, valid_b = _candidates(table, local_us)
+    utc_a = local_us - table.offsets[a]
+    utc_b = local_us - table.offsets[b]
+    ambiguous = valid_a & valid_b & (utc_a != utc_b)
+    missing = ~(valid_a | valid_b)
+
+    chosen = np.where(valid_a, a, b)
+    is_dst = table.dst[chosen].copy()
+    if ambiguous.any():
+        chosen[ambiguous] = _prefer(table, local_us[ambiguous], is_dst=False)
+        is_dst[ambiguous] = False
+    if missing.any():
+        chosen[missing] = _prefer(table, local_us[missing] + SIX_HOURS_US, is_dst=True)
+        is_dst[missing] = True
+
+    offsets = table.offsets[chosen]
+    return local_us - offsets, offsets, is_dst